@@ -1,20 +1,145 @@
 # app/client.py
 
-from typing import Any, Type, TypeVar, Optional
+from typing import Any, Dict, Iterator, List, Type, TypeVar, Optional, Tuple
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
-import json
+import functools
+import hashlib
+import threading
+import time
 
 T = TypeVar("T", bound=BaseModel)
 
+@functools.lru_cache(maxsize=64)
+def _prefix_key(model: str, system_instruction: str, text: str, tools_key: str) -> str:
+    # Prefixes are long, module-level strings passed on every call: memoizing keeps their UTF-8
+    # encoding and digest to once per process (str hashes are cached on the object).
+    return hashlib.sha256(
+        f"{model}\x00{system_instruction}\x00{text}\x00{tools_key}".encode("utf-8")
+    ).hexdigest()
+
 class Client:
     """Centralizes Gemini API calls."""
 
+    CACHE_TTL_SECONDS = 3600
+    # Gemini refuses to cache prefixes below this size; shorter ones are sent inline without a create attempt.
+    MIN_CACHE_TOKENS = 1024
+    CHARS_PER_TOKEN = 4
+    BATCH_POLL_SECONDS = 30
+    # Longest a caller waits on a batch job; past it the job is cancelled and every entry is
+    # returned as None, so the caller runs those requests in realtime instead.
+    BATCH_MAX_WAIT_SECONDS = 30 * 60
+    # Largest number of texts the embedding endpoint accepts per request.
+    EMBED_BATCH_SIZE = 100
+    _BATCH_DONE_STATES = (
+        "JOB_STATE_SUCCEEDED",
+        "JOB_STATE_PARTIALLY_SUCCEEDED",
+        "JOB_STATE_FAILED",
+        "JOB_STATE_CANCELLED",
+        "JOB_STATE_EXPIRED",
+    )
+
     def __init__(self, api_key: str):
         self._client = genai.Client(api_key=api_key)
+        self._cached_contents: Dict[str, Tuple[Optional[str], float]] = {}
+        # One lock per prefix, so setting up one prefix's cache never waits on another's.
+        self._prefix_locks: Dict[str, threading.Lock] = {}
+        self._prefix_locks_lock = threading.Lock()
+        self._token_counts: Dict[str, int] = {}
+        self.usage: Dict[str, Dict[str, int]] = {}
+        self._usage_lock = threading.Lock()
 
-    def call(
+    def _record_usage(self, model: str, resp: Any) -> None:
+        """Accumulates per-model token counts, including the share served from the prompt cache."""
+        meta = getattr(resp, "usage_metadata", None)
+        if meta is None:
+            return
+        with self._usage_lock:
+            totals = self.usage.setdefault(model, {"prompt": 0, "cached": 0, "output": 0})
+            totals["prompt"] += meta.prompt_token_count or 0
+            totals["cached"] += meta.cached_content_token_count or 0
+            totals["output"] += meta.candidates_token_count or 0
+
+    def cache_content(
+        self,
+        *,
+        model: str,
+        text: Optional[str] = None,
+        system_instruction: Optional[str] = None,
+        tools: Optional[list[types.Tool]] = None,
+    ) -> Optional[str]:
+        """
+        Registers a static prompt prefix as server-side cached content for `model` and
+        returns its name. The prefix is `system_instruction` and/or a shared `text` block;
+        `tools` must be cached with it because Gemini rejects tools next to `cached_content`.
+
+        The cache is created once per (model, system_instruction, text, tools); shortly before its
+        TTL runs out it is extended in place, and only recreated if that fails. Returns None when the provider refuses to cache the prefix
+        (e.g. it is below the model's minimum cacheable size); callers then send it inline.
+        """
+        tools_key = "".join(t.model_dump_json(exclude_none=True) for t in tools or [])
+        key = _prefix_key(model, system_instruction or "", text or "", tools_key)
+        with self._prefix_locks_lock:
+            prefix_lock = self._prefix_locks.setdefault(key, threading.Lock())
+        # Held across the check, extend/create and store, so concurrent callers with the same
+        # prefix wait for the first one's cache instead of each creating their own.
+        with prefix_lock:
+            name, expires_at = self._cached_contents.get(key, (None, 0.0))
+            if time.monotonic() < expires_at:
+                return name
+            if name:
+                try:
+                    self._client.caches.update(
+                        name=name,
+                        config=types.UpdateCachedContentConfig(ttl=f"{self.CACHE_TTL_SECONDS}s"),
+                    )
+                    self._cached_contents[key] = (name, time.monotonic() + self.CACHE_TTL_SECONDS - 60)
+                    return name
+                except Exception:
+                    pass
+
+            if self._prefix_tokens(model, f"{system_instruction or ''}{text or ''}") < self.MIN_CACHE_TOKENS:
+                self._cached_contents[key] = (None, float("inf"))
+                return None
+
+            cache_config: dict[str, Any] = {"ttl": f"{self.CACHE_TTL_SECONDS}s"}
+            if system_instruction:
+                cache_config["system_instruction"] = system_instruction
+            if text:
+                cache_config["contents"] = [types.Content(role="user", parts=[types.Part(text=text)])]
+            if tools:
+                cache_config["tools"] = tools
+
+            try:
+                cached = self._client.caches.create(
+                    model=model,
+                    config=types.CreateCachedContentConfig(**cache_config),
+                )
+                name = cached.name
+            except Exception:
+                name = None
+            # Refresh a minute early so an in-flight call never references an expired cache.
+            self._cached_contents[key] = (name, time.monotonic() + self.CACHE_TTL_SECONDS - 60)
+            return name
+
+    def _prefix_tokens(self, model: str, text: str) -> int:
+        """
+        Token count of a static prefix, counted once per (model, text). Clear-cut sizes use the
+        character estimate; only prefixes near MIN_CACHE_TOKENS are counted by the API.
+        """
+        estimate = len(text) // self.CHARS_PER_TOKEN
+        if not self.MIN_CACHE_TOKENS // 2 <= estimate < self.MIN_CACHE_TOKENS * 2:
+            return estimate
+        key = _prefix_key(model, "", text, "")
+        if key not in self._token_counts:
+            try:
+                self._token_counts[key] = self._client.models.count_tokens(model=model, contents=text).total_tokens
+            except Exception:
+                self._token_counts[key] = estimate
+        return self._token_counts[key]
+
+    def _request(
         self,
         *,
         model: str,
@@ -22,26 +147,75 @@ class Client:
         user_prompt: str,
         schema: Optional[Type[T]] = None,
         tools: Optional[list[types.Tool]] = None,
-    ) -> T | str:
+        shared_context: Optional[str] = None,
+        cache_instructions: bool = False,
+    ) -> Tuple[Any, types.GenerateContentConfig]:
+        """Returns the (contents, config) pair for a generate call, using cached content where available."""
         gen_config_params: dict[str, Any] = {}
+        contents: Any = user_prompt
 
-        if system_instruction:
+        cached_content = None
+        if shared_context or cache_instructions:
+            cached_content = self.cache_content(
+                model=model,
+                text=shared_context,
+                system_instruction=system_instruction if cache_instructions else None,
+                tools=tools if cache_instructions else None,
+            )
+        if cached_content and cache_instructions:
+            # The whole static prefix is cached; only the per-call prompt is sent.
+            gen_config_params["cached_content"] = cached_content
+        elif cached_content:
+            # Gemini rejects `system_instruction` alongside `cached_content`, so the role
+            # instructions travel as the first user part, right after the shared prefix.
+            gen_config_params["cached_content"] = cached_content
+            contents = [
+                types.Content(
+                    role="user",
+                    parts=[types.Part(text=system_instruction), types.Part(text=user_prompt)],
+                )
+            ]
+        elif shared_context:
+            gen_config_params["system_instruction"] = f"{shared_context}\n\n{system_instruction}"
+        elif system_instruction:
             gen_config_params["system_instruction"] = system_instruction
 
         if schema:
             gen_config_params["response_mime_type"] = "application/json"
             gen_config_params["response_schema"] = schema
 
-        if tools:
+        if tools and not (cached_content and cache_instructions):
             gen_config_params["tools"] = tools
 
-        config = types.GenerateContentConfig(**gen_config_params)
+        return contents, types.GenerateContentConfig(**gen_config_params)
+
+    def call(
+        self,
+        *,
+        model: str,
+        system_instruction: str,
+        user_prompt: str,
+        schema: Optional[Type[T]] = None,
+        tools: Optional[list[types.Tool]] = None,
+        shared_context: Optional[str] = None,
+        cache_instructions: bool = False,
+    ) -> T | str:
+        contents, config = self._request(
+            model=model,
+            system_instruction=system_instruction,
+            user_prompt=user_prompt,
+            schema=schema,
+            tools=tools,
+            shared_context=shared_context,
+            cache_instructions=cache_instructions,
+        )
 
         resp = self._client.models.generate_content(
             model=model,
-            contents=user_prompt,
+            contents=contents,
             config=config,
         )
+        self._record_usage(model, resp)
 
         if schema:
             try:
@@ -102,15 +276,183 @@ class Client:
                 f"Response summary: {resp_summary}"
             )
 
-    def planner_call(self, model: str, instructions: str, user_prompt: str, schema: Optional[Type[T]] = None) -> T | str:
-        return self.call(model=model, system_instruction=instructions, user_prompt=user_prompt, schema=schema)
+    def call_stream(
+        self,
+        *,
+        model: str,
+        system_instruction: str,
+        user_prompt: str,
+        tools: Optional[list[types.Tool]] = None,
+        shared_context: Optional[str] = None,
+        cache_instructions: bool = False,
+    ) -> Iterator[str]:
+        """
+        Like `call` for plain-text responses, but yields the text of each chunk as the model
+        produces it. Usage is recorded from the final chunk, which carries the totals.
+        """
+        contents, config = self._request(
+            model=model,
+            system_instruction=system_instruction,
+            user_prompt=user_prompt,
+            tools=tools,
+            shared_context=shared_context,
+            cache_instructions=cache_instructions,
+        )
+        last_chunk = None
+        for chunk in self._client.models.generate_content_stream(model=model, contents=contents, config=config):
+            last_chunk = chunk
+            if chunk.text:
+                yield chunk.text
+        if last_chunk is not None:
+            self._record_usage(model, last_chunk)
 
-    def thinker_call(self, model: str, instructions: str, user_prompt: str, tools: Optional[list[types.Tool]] = None) -> str:
-        response = self.call(model=model, system_instruction=instructions, user_prompt=user_prompt, tools=tools)
+    def batch_call(
+        self,
+        *,
+        model: str,
+        system_instruction: str,
+        user_prompts: List[str],
+        tools: Optional[list[types.Tool]] = None,
+        shared_context: Optional[str] = None,
+        cache_instructions: bool = False,
+    ) -> List[Optional[str]]:
+        """
+        Submits one plain-text request per prompt as a single inline batch job and blocks until
+        it finishes, for at most BATCH_MAX_WAIT_SECONDS (batch jobs take minutes, not seconds,
+        but are billed at a discount). Returns the response texts in prompt order; an entry is
+        None if its request failed, got no response, or the job did not finish in time, and
+        callers fall back to realtime calls for those.
+        """
+        requests = []
+        for user_prompt in user_prompts:
+            contents, config = self._request(
+                model=model,
+                system_instruction=system_instruction,
+                user_prompt=user_prompt,
+                tools=tools,
+                shared_context=shared_context,
+                cache_instructions=cache_instructions,
+            )
+            requests.append(types.InlinedRequest(contents=contents, config=config))
+
+        results: List[Optional[str]] = [None] * len(user_prompts)
+        try:
+            job = self._client.batches.create(model=model, src=requests)
+            deadline = time.monotonic() + self.BATCH_MAX_WAIT_SECONDS
+            while job.state.name not in self._BATCH_DONE_STATES:
+                if time.monotonic() >= deadline:
+                    self._client.batches.cancel(name=job.name)
+                    return results
+                time.sleep(self.BATCH_POLL_SECONDS)
+                job = self._client.batches.get(name=job.name)
+        except Exception:
+            return results
+        # Whatever the final state, entries that did complete are kept; only the rest are re-run.
+        if not job.dest or not job.dest.inlined_responses:
+            return results
+
+        for i, inlined in enumerate(job.dest.inlined_responses[:len(results)]):
+            if inlined.error or not inlined.response:
+                continue
+            self._record_usage(model, inlined.response)
+            try:
+                results[i] = inlined.response.text
+            except AttributeError:
+                pass
+        return results
+
+    def embed(self, texts: List[str], model: str = "text-embedding-004") -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), self.EMBED_BATCH_SIZE):
+            resp = self._client.models.embed_content(model=model, contents=texts[start:start + self.EMBED_BATCH_SIZE])
+            vectors.extend(list(e.values) for e in resp.embeddings)
+        return vectors
+
+    def planner_call(
+        self,
+        model: str,
+        instructions: str,
+        user_prompt: str,
+        schema: Optional[Type[T]] = None,
+        shared_context: Optional[str] = None,
+    ) -> T | str:
+        return self.call(
+            model=model,
+            system_instruction=instructions,
+            user_prompt=user_prompt,
+            schema=schema,
+            shared_context=shared_context,
+            cache_instructions=True,
+        )
+
+    def thinker_call(
+        self,
+        model: str,
+        instructions: str,
+        user_prompt: str,
+        tools: Optional[list[types.Tool]] = None,
+        shared_context: Optional[str] = None,
+    ) -> str:
+        response = self.call(
+            model=model,
+            system_instruction=instructions,
+            user_prompt=user_prompt,
+            tools=tools,
+            shared_context=shared_context,
+            cache_instructions=True,
+        )
         return response
 
-    def reviewer_call(self, model: str, instructions: str, user_prompt: str, schema: Optional[Type[T]] = None) -> T | str:
-        return self.call(model=model, system_instruction=instructions, user_prompt=user_prompt, schema=schema)
+    def thinker_call_stream(
+        self,
+        model: str,
+        instructions: str,
+        user_prompt: str,
+        tools: Optional[list[types.Tool]] = None,
+        shared_context: Optional[str] = None,
+    ) -> Iterator[str]:
+        return self.call_stream(
+            model=model,
+            system_instruction=instructions,
+            user_prompt=user_prompt,
+            tools=tools,
+            shared_context=shared_context,
+            cache_instructions=True,
+        )
+
+    def thinker_batch_call(
+        self,
+        model: str,
+        instructions: str,
+        user_prompts: List[str],
+        tools: Optional[list[types.Tool]] = None,
+        shared_context: Optional[str] = None,
+    ) -> List[Optional[str]]:
+        return self.batch_call(
+            model=model,
+            system_instruction=instructions,
+            user_prompts=user_prompts,
+            tools=tools,
+            shared_context=shared_context,
+            cache_instructions=True,
+        )
+
+    def reviewer_call(
+        self,
+        model: str,
+        instructions: str,
+        user_prompt: str,
+        schema: Optional[Type[T]] = None,
+        shared_context: Optional[str] = None,
+    ) -> T | str:
+        return self.call(
+            model=model,
+            system_instruction=instructions,
+            user_prompt=user_prompt,
+            schema=schema,
+            shared_context=shared_context,
+            cache_instructions=True,
+        )
 
     def synthesizer_call(self, model: str, instructions: str, user_prompt: str) -> str:
-        return self.call(model=model, system_instruction=instructions, user_prompt=user_prompt)
+        return self.call(model=model, system_instruction=instructions, user_prompt=user_prompt, cache_instructions=True)
@@ -0,0 +1,85 @@
+# app/compression.py
+
+import math
+import re
+from collections import Counter
+from typing import List, Optional
+
+from app.schemas import ExplorationPlan
+
+KEEP_INFORMATION_RATIO = 0.8
+MIN_SENTENCES_TO_COMPRESS = 6
+
+_FENCE_RE = re.compile(r"```.*?```\s*", re.DOTALL)
+_SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]*\s*")
+_WORD_RE = re.compile(r"\w+")
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+def compress_thinker_output(text: str, word_counts: Optional[Counter] = None) -> str:
+    """
+    Drops low-information prose from a Thinker response before the Reviewer reads it.
+
+    Each word is scored by its surprisal, -log p(word), under the unigram distribution of
+    `word_counts` (by default the text itself). Boilerplate built from common words scores
+    low. Sentences are kept by descending information density until KEEP_INFORMATION_RATIO
+    of the response's total information is retained, then emitted in their original order.
+    Fenced code blocks (code and execution results) are always kept verbatim.
+    """
+    counts = word_counts if word_counts is not None else Counter(_words(text))
+    total = sum(counts.values())
+    if not total:
+        return text
+
+    pieces: List[str] = []
+    cursor = 0
+    for fence in _FENCE_RE.finditer(text):
+        pieces.extend(_SENTENCE_RE.findall(text[cursor:fence.start()]))
+        pieces.append(fence.group(0))
+        cursor = fence.end()
+    pieces.extend(_SENTENCE_RE.findall(text[cursor:]))
+
+    scored = []
+    for index, piece in enumerate(pieces):
+        if piece.startswith("```"):
+            continue
+        words = _words(piece)
+        if words:
+            information = sum(-math.log((counts[w] or 1) / total) for w in words)
+            scored.append((information / len(words), information, index))
+    if len(scored) < MIN_SENTENCES_TO_COMPRESS:
+        return text
+
+    budget = KEEP_INFORMATION_RATIO * sum(information for _, information, _ in scored)
+    dropped = {index for _, _, index in scored}
+    kept_information = 0.0
+    for _, information, index in sorted(scored, reverse=True):
+        if kept_information >= budget:
+            break
+        dropped.discard(index)
+        kept_information += information
+
+    kept = [piece for index, piece in enumerate(pieces) if index not in dropped]
+    return re.sub(r"\n{3,}", "\n\n", "".join(kept)).strip()
+
+def compress_responses(plans: List[ExplorationPlan]) -> List[ExplorationPlan]:
+    """
+    Returns copies of `plans` with every step response compressed. Word statistics are pooled
+    over the whole iteration, so phrasing every Thinker repeats counts as low-information.
+    """
+    corpus = Counter(
+        word
+        for plan in plans
+        for step in plan.steps
+        if step.response
+        for word in _words(step.response)
+    )
+    compressed: List[ExplorationPlan] = []
+    for plan in plans:
+        plan_copy = plan.model_copy(deep=True)
+        for step in plan_copy.steps:
+            if step.response:
+                step.response = compress_thinker_output(step.response, corpus)
+        compressed.append(plan_copy)
+    return compressed
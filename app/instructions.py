@@ -62,1402 +62,363 @@
 
 """
 
-EXPLORATION_STRATEGIES = """
-**I. Problem-Solving Exploration Strategies**
-
-* **1. Root Cause Analysis (RCA)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define the Problem:** Clearly articulate the specific problem or incident whose root cause needs to be identified (e.g., "20% conversion drop").
-    2. **Gather Data/Evidence:** Collect observable symptoms, data, and facts related to the problem. Group or categorize this information (e.g., by technology, user experience, marketing, external factors).
-    3. **Identify Potential Causes (Iterative Inquiry):** For each category or primary symptom, apply an iterative questioning technique (like "5 Whys").
-       * Ask "Why did [the problem/symptom] occur?" to identify an immediate cause.
-       * Take that immediate cause and ask "Why did *that* happen?"
-       * Continue asking "Why?" for each subsequent answer, drilling down through layers of causality.
-    4. **Determine Root Cause(s):** The process stops when a fundamental cause is reached â€“ one that, if resolved, would prevent the problem from recurring. There may be multiple root causes.
-    5. **Verify Causal Chain:** Trace the logic from the identified root cause(s) back to the original problem to ensure the causal relationship is sound.
-  * ***Why It's Effective:***
-    * Addresses the fundamental origins of a problem, not just its symptoms, leading to more permanent and effective solutions.
-    * Prevents problem recurrence by tackling the underlying issues.
-    * Enhances understanding of complex systems and processes by revealing hidden causal relationships.
-  * ***Ideal Problem Factors / Characteristics:***
-    * The task involves understanding *why* a problem exists, diagnosing failures, or preventing recurrence.
-    * Problems with observable symptoms but unclear or complex origins.
-    * Situations where previous fixes have only provided temporary relief.
-    * Tasks requiring in-depth diagnosis before solution implementation.
-    * Prompts like: "Determine the primary reasons for X," "Investigate the causes of system failure Y," "Why is metric Z declining?"
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "RCA_ConversionDrop",
-          "strategy": "Root Cause Analysis",
-          "overview": "Investigate the fundamental reasons for a 20% drop in user conversion rates.",
-          "steps": [
-            { "step_id": "RCA1", "instructions": "List all observable evidence and symptoms of the 20% conversion drop. Group findings by potential areas: technical issues, UX changes, marketing campaign shifts, external factors." },
-            { "step_id": "RCA2", "instructions": "For each group identified in RCA1, apply the '5 Whys' technique to drill down to fundamental causes. Record each causal chain (e.g., Symptom -> Why1 -> Why2 -> ... -> Root Cause).", "dependencies": ["RCA_ConversionDrop.RCA1"] },
-            { "step_id": "RCA3", "instructions": "Identify and list the top 3-5 distinct root causes based on the '5 Whys' analysis. Prioritize them based on their likely impact and the evidence supporting them. Prepare a succinct rationale for each prioritized root cause.", "dependencies": ["RCA_ConversionDrop.RCA2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Complements Systems Thinking by identifying specific failure points within a system.
-* **2. Comparative Analysis**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Identify Items for Comparison:** Clearly define the two or more items (e.g., solutions, products, theories, approaches A, B, C) to be compared.
-    2. **Define Comparison Criteria:** Establish a set of specific, relevant, and measurable (or clearly assessable) criteria against which all items will be evaluated (e.g., performance, cost, ease of use, scalability, security).
-    3. **Gather Data per Criterion:** For each item, systematically gather information or make reasoned assessments related to each defined criterion. Ensure consistency in how data is collected or evaluated across items.
-    4. **Systematic Evaluation:** Evaluate each item against each criterion. This can involve scoring, qualitative descriptions, or noting specific features/evidence.
-    5. **Synthesize and Conclude:** Present the comparisons (often in a structured format like a table). Analyze the results to identify relative strengths, weaknesses, trade-offs, and overall suitability of each item for the specific purpose or context. Make a recommendation if applicable.
-  * ***Why It's Effective:***
-    * Provides a structured and objective framework for evaluating multiple options.
-    * Clarifies the relative advantages and disadvantages of each alternative, facilitating informed decision-making.
-    * Makes trade-offs explicit, helping to choose the best fit for specific needs.
-  * ***Ideal Problem Factors / Characteristics:***
-    * The task requires making a choice between several distinct options or alternatives.
-    * Need to evaluate the suitability of different solutions, products, designs, or methodologies for a specific problem or purpose.
-    * Requirement to understand the detailed differences, strengths, and weaknesses of comparable items.
-    * Prompts like: "Compare solution A vs. solution B for problem X," "Evaluate three proposed designs for Y," "Which methodology is better for Z?"
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "CA_Frameworks",
-          "strategy": "Comparative Analysis",
-          "overview": "Compare two software frameworks (Framework A and Framework B) for a new web application project.",
-          "steps": [
-            { "step_id": "CA1", "instructions": "Define at least 4 critical comparison criteria relevant to the web application project. Examples: performance, learning curve, community support, scalability. Add others if critical for the project's success." },
-            { "step_id": "CA2", "instructions": "For Framework A, evaluate it against each criterion defined in CA1. Provide evidence, examples, or reasoned arguments for each assessment. Note specific pros and cons for Framework A related to each criterion.", "dependencies": ["CA_Frameworks.CA1"] },
-            { "step_id": "CA3", "instructions": "For Framework B, evaluate it against each criterion defined in CA1. Provide evidence, examples, or reasoned arguments for each assessment. Note specific pros and cons for Framework B related to each criterion.", "dependencies": ["CA_Frameworks.CA1"] },
-            { "step_id": "CA4", "instructions": "Synthesize the evaluations from CA2 and CA3. Create a summary comparison (e.g., a table). Recommend the preferred framework for the project, or a conditional choice, with clear justification based on the analysis of criteria.", "dependencies": ["CA_Frameworks.CA2", "CA_Frameworks.CA3"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can incorporate Pro/Con Evaluation for each item against the criteria.
-* **3. Hypothesis Testing (Conceptual)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Formulate Hypothesis:** State a clear, specific, and conceptually testable proposition or educated guess (the hypothesis, H1). Often, an implicit null hypothesis (H0 â€“ the opposite or absence of H1) is also considered.
-    2. **Identify Evidence/Reasoning Needed:** Determine what kind of logical arguments, existing knowledge, or conceptual evidence would support or refute the hypothesis. For LLMs, this focuses on lines of reasoning rather than empirical data collection.
-    3. **Outline Conceptual Test:** Describe a logical process or a line of inquiry to evaluate the hypothesis. This might involve:
-       * Searching for information that confirms or disconfirms predictions derived from the hypothesis.
-       * Constructing logical arguments for or against the hypothesis based on established principles.
-       * Examining the consistency of the hypothesis with known facts.
-    4. **Evaluate Evidence/Reasoning:** Assess the gathered information or constructed arguments in relation to the hypothesis.
-    5. **Draw Conclusion:** Determine whether the hypothesis is conceptually supported, refuted, or if the available reasoning is inconclusive. State any caveats, limitations, or assumptions made during the conceptual test.
-  * ***Why It's Effective:***
-    * Provides a structured approach to validate assumptions, claims, or proposed explanations before acting on them.
-    * Encourages critical thinking and reliance on logical reasoning rather than unsubstantiated belief.
-    * Helps to refine understanding by systematically examining the plausibility of an idea.
-  * ***Ideal Problem Factors / Characteristics:***
-    * An assumption, claim, or proposed explanation needs to be validated or scrutinized.
-    * The task involves investigating the truth or plausibility of a specific assertion.
-    * Decisions depend on the likely validity of a particular idea or relationship.
-    * Prompts like: "Is it true that X causes Y?" "Investigate the validity of the assertion that Z is the most effective approach." "Examine the hypothesis that..."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "HT_Gamification",
-          "strategy": "Hypothesis Testing (Conceptual)",
-          "overview": "Test the hypothesis that gamification was the primary driver of Q3 user engagement increase.",
-          "steps": [
-            { "step_id": "HT1", "instructions": "Formally state the primary hypothesis: 'The introduction of gamification features in Q3 was the primary driver of the observed increase in user engagement metrics.'" },
-            { "step_id": "HT2", "instructions": "Derive 3-4 specific, logical predictions that would be observable if the hypothesis (HT1) were true (e.g., engagement increased most in gamified sections, users who interacted with gamification showed higher engagement than those who didn't, no other major changes coincided with the engagement rise). Outline the type of conceptual evidence or reasoning needed to assess each prediction.", "dependencies": ["HT_Gamification.HT1"] },
-            { "step_id": "HT3", "instructions": "Conceptually evaluate each prediction from HT2 based on available information or logical reasoning. Judge the overall plausibility of the hypothesis, noting supporting arguments, counter-arguments, alternative explanations, and any necessary caveats.", "dependencies": ["HT_Gamification.HT2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Often follows Assumption Challenging, where the challenged assumption becomes the hypothesis to test.
-* **4. Constraint Analysis**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Scope:** Clearly define the problem, project, system, or goal for which constraints are being analyzed.
-    2. **Identify Potential Constraints:** Brainstorm and list all limitations, restrictions, boundaries, or bottlenecks that could affect the defined scope. Categorize them (e.g., technical, resource-based (time, budget, personnel), market, legal/regulatory, operational, ethical).
-    3. **Analyze Each Constraint:** For each identified constraint, examine its:
-       * **Nature:** What is it? How does it manifest?
-       * **Impact:** How significantly does it affect the scope, options, or outcomes?
-       * **Flexibility:** Is it fixed and unchangeable, or can it be influenced, negotiated, or mitigated?
-    4. **Prioritize Critical Constraints:** Determine which constraints are most critical or binding â€“ those that most severely limit options or pose the greatest risk to success.
-    5. **Develop Strategies for Constraints:** For critical constraints, explore and outline potential strategies:
-       * **Work within:** Accept the constraint and find solutions that fit.
-       * **Mitigate:** Reduce the impact of the constraint.
-       * **Overcome/Remove:** Find ways to eliminate or bypass the constraint (if possible).
-       * **Accept:** Acknowledge the constraint and its impact if unchangeable.
-  * ***Why It's Effective:***
-    * Ensures that proposed solutions or plans are realistic, feasible, and implementable within given limitations.
-    * Helps in identifying potential roadblocks, risks, and critical dependencies early in the process.
-    * Guides resource allocation and helps optimize processes by focusing on the most impactful limitations.
-  * ***Ideal Problem Factors / Characteristics:***
-    * The task involves finding feasible solutions within given limits or optimizing a process under restrictions.
-    * Problems characterized by limited resources (time, budget, personnel), technical limitations, regulatory requirements, or other fixed boundaries.
-    * Need to understand critical dependencies and potential roadblocks for successful project execution or problem-solving.
-    * Prompts like: "Identify the key constraints for implementing project X," "How can we achieve Y given resource limitation Z?" "What are the bottlenecks in process A?"
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "CA_NewProductLaunch",
-          "strategy": "Constraint Analysis",
-          "overview": "Analyze constraints for launching a new software product within a 6-month timeframe.",
-          "steps": [
-            { "step_id": "CA1", "instructions": "Catalogue all potential constraints for the 6-month product launch. Categorize them into: technical (e.g., platform limitations, integration complexity), resource (e.g., budget, team size/skills), market (e.g., competitor actions, customer adoption rate), and operational (e.g., deployment processes, support capacity)." },
-            { "step_id": "CA2", "instructions": "For each constraint identified in CA1, assess its potential severity and impact on meeting the 6-month launch deadline. Rate impact as High, Medium, or Low.", "dependencies": ["CA_NewProductLaunch.CA1"] },
-            { "step_id": "CA3", "instructions": "For each constraint rated as 'High' impact in CA2, propose at least one specific mitigation strategy. Note any residual risk even with mitigation.", "dependencies": ["CA_NewProductLaunch.CA2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Informs Pathfinding Strategy Mapping by defining boundaries for possible paths. Essential for realistic Scenario Modeling.
-* **5. Pro/Con Evaluation (Trade-off Analysis)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Subject of Evaluation:** Clearly identify the specific idea, proposal, decision, course of action, or option to be evaluated.
-    2. **Generate Pros (Advantages):** Systematically brainstorm and list all potential advantages, benefits, or positive outcomes associated with the subject. For each "pro," briefly explain why it's an advantage and its potential positive impact.
-    3. **Generate Cons (Disadvantages):** Systematically brainstorm and list all potential disadvantages, drawbacks, risks, or negative outcomes associated with the subject. For each "con," briefly explain why it's a disadvantage and its potential negative impact.
-    4. **Weigh/Prioritize (Optional but Recommended):** Assign relative importance or weight to each pro and con, considering the overall goals or context. Not all pros and cons are equally significant.
-    5. **Analyze and Summarize Trade-offs:** Compare the collective weight and impact of the pros against the cons. Identify the key trade-offs (what is gained vs. what is sacrificed). Formulate a balanced judgment or recommendation based on this analysis.
-  * ***Why It's Effective:***
-    * Provides a balanced and structured assessment of an option by explicitly considering both positive and negative aspects.
-    * Facilitates more objective and considered decision-making.
-    * Helps to identify potential risks and benefits comprehensively, clarifying the implications of a choice.
-  * ***Ideal Problem Factors / Characteristics:***
-    * A significant decision needs to be made regarding a specific course of action, proposal, or change.
-    * Need to evaluate the overall implications of adopting a particular option.
-    * A balanced judgment is required, weighing potential upsides against downsides.
-    * Prompts like: "Should we adopt technology X?" "Analyze the pros and cons of strategy Y." "Evaluate the proposal to..."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "PC_Outsourcing",
-          "strategy": "Pro/Con Evaluation",
-          "overview": "Evaluate the pros and cons of outsourcing customer support.",
-          "steps": [
-            { "step_id": "PC1", "instructions": "Generate at least 4 significant pros of outsourcing customer support. For each pro, explain its specific benefit and potential positive impact on the business (e.g., cost reduction, access to specialized skills)." },
-            { "step_id": "PC2", "instructions": "Generate at least 4 significant cons of outsourcing customer support. For each con, explain its specific downside and potential negative impact on the business (e.g., loss of direct customer contact, quality control issues).", "dependencies": [] },
-            { "step_id": "PC3", "instructions": "Compare the overall weight and significance of the identified pros versus cons. Summarize the key trade-offs involved in the decision to outsource customer support. Provide a concluding judgment if appropriate.", "dependencies": ["PC_Outsourcing.PC1", "PC_Outsourcing.PC2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can be a component of Comparative Analysis (applied to each option) or Dialectical Inquiry (pros forming the thesis, cons contributing to the antithesis).
-* **6. Scenario Modeling (Conceptual & Exploratory)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Focal Issue & Key Uncertainties:** Identify the central question, decision, or area of interest. Determine the 2-3 most critical and uncertain driving forces or variables that will shape its future.
-    2. **Develop Scenario Logics:** Based on different plausible combinations of how the key uncertainties might unfold, construct 2-4 distinct scenario logics (e.g., by creating a 2x2 matrix if using two key uncertainties, leading to four scenarios).
-    3. **Flesh Out Scenarios:** For each scenario logic, create a rich, narrative description of that future. Give each scenario a memorable name. Describe what the world/situation would look like, key events, conditions, and the "story" of how it came to be. Ensure internal consistency. (Examples: Optimistic, Pessimistic, Most Likely, Wildcard/Disruptive).
-    4. **Analyze Implications:** For each scenario, analyze its specific implications for the focal issue. What challenges, opportunities, risks, and strategic responses would be relevant in that particular future?
-    5. **Identify Leading Indicators & Strategic Options:** For each scenario, identify "signposts" or early indicators that would suggest it is becoming more likely. Consider potential strategic actions, contingency plans, or robust strategies that would perform well across multiple scenarios.
-  * ***Why It's Effective:***
-    * Helps organizations and individuals think strategically about an uncertain future and prepare for a range of plausible outcomes, rather than relying on a single forecast.
-    * Encourages proactive risk management and identification of opportunities.
-    * Improves adaptability and resilience by considering diverse future contexts.
-    * Can challenge existing assumptions and foster more robust strategies.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Strategic planning, foresight exercises, risk management, or policy development in contexts of high uncertainty and complexity.
-    * Long-term decision-making where multiple external factors can significantly influence outcomes.
-    * Exploring potential impacts of major trends, disruptive technologies, or significant events.
-    * Prompts like: "What are the potential impacts of event X on industry Y?" "Explore future scenarios for technology Z over the next 10 years." "How should we prepare for different outcomes of policy A?"
-  * ***Global View & Pipeline Integration:***
-    * **How it gives a global view:** Explores multiple plausible futures for the entire system/problem based on key uncertainties.
-    * **Pipeline Fit:** Planner: "Identify key uncertainties for [problem]," "Develop 2-3 scenario logics," "Flesh out implications for each scenario."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "SM_AICodeGen",
-          "strategy": "Scenario Modeling",
-          "overview": "Explore future scenarios for the impact of AI code generation on software development jobs over the next decade.",
-          "steps": [
-            { "step_id": "SM1", "instructions": "Identify two key uncertainties (e.g., 'Pace of AI Capability Advancement' [Rapid/Moderate] and 'Rate of Industry Adoption & Integration' [High/Low]). Draft core assumptions for three distinct scenarios based on combinations of these: 1. Transformative Growth (Rapid/High), 2. Significant Displacement (Rapid/Low or Moderate/High with displacement focus), 3. Niche Augmentation (Moderate/Low)." },
-            { "step_id": "SM2", "instructions": "For each of the three scenarios defined in SM1, detail the likely evolution of software development roles, required skills, and potential socio-economic effects (e.g., job creation/loss, wage impacts, new job categories).", "dependencies": ["SM_AICodeGen.SM1"] },
-            { "step_id": "SM3", "instructions": "For each scenario, list 2-3 leading indicators or signposts that would suggest that particular scenario is unfolding. Briefly outline a plan or key areas to monitor for these indicators.", "dependencies": ["SM_AICodeGen.SM2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Constraint Analysis can inform the boundaries of scenarios; Systems Thinking can help model dynamics within scenarios.
-
----
-
-**II. Brainstorming/Creative Thinking Exploration Strategies**
-
-* **7. SCAMPER**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Identify Target:** Clearly define the existing product, service, process, or problem that is the focus of idea generation.
-    2. **Apply SCAMPER Prompts Systematically:** Go through each of the seven SCAMPER elements, applying them as questions or prompts to the target:
-       * **S**ubstitute: What can be replaced (components, materials, people, processes, rules)?
-       * **C**ombine: What can be merged or combined (ideas, purposes, parts, functions, with other products/services)?
-       * **A**dapt: What else is like this? What other ideas does it suggest? How can it be adjusted for a different context or purpose? Can we borrow from something else?
-       * **M**odify (Magnify/Minify): What can be changed (attributes, meaning, color, motion, sound, form)? What can be magnified, made larger, stronger, more frequent, or added to? What can be minified, made smaller, lighter, less frequent, or subtracted from?
-       * **P**ut to another use: How can it be used differently? Are there new ways to use it as is? Other uses if modified? Who else could use it?
-       * **E**liminate: What can be removed, simplified, or reduced? What parts are non-essential? What if we made it smaller or took something away?
-       * **R**everse (or Rearrange): What if we changed the order, sequence, or layout? Can components be reordered? Can roles be reversed? Can we do the opposite? Turn it upside down or inside out?
-    3. **Generate Ideas:** For each prompt, brainstorm and record as many ideas as possible without immediate judgment or criticism.
-    4. **Evaluate and Select:** After generating a wide range of ideas, review, categorize, and evaluate them for feasibility, novelty, potential impact, and relevance to the original goal.
-  * ***Why It's Effective:***
-    * Provides a structured yet flexible checklist that systematically triggers different ways of thinking about an existing concept or problem.
-    * Helps overcome creative blocks and generate a large volume and variety of ideas.
-    * Encourages looking at familiar things from new perspectives, leading to both incremental improvements and potentially radical innovations.
-  * ***Ideal Problem Factors / Characteristics:***
-    * The task is to generate a wide range of ideas for improvement, innovation, or problem-solving.
-    * Focus on innovating an existing product, service, process, or concept.
-    * Need to find novel solutions or break out of conventional thinking patterns.
-    * Brainstorming sessions aiming for creative output.
-    * Prompts like: "Generate ideas to improve product X," "How can we innovate our service Y?" "Find new uses for Z."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "SCAMPER_CoffeeMaker",
-          "strategy": "SCAMPER",
-          "overview": "Generate innovative feature ideas for a smart coffee maker using SCAMPER.",
-          "steps": [
-            { "step_id": "SCAMPER1", "instructions": "Apply 'Substitute' and 'Combine': Propose 2 feature ideas by substituting a component of the coffee maker OR by combining its functionality with another smart home device. Explain the user benefit." },
-            { "step_id": "SCAMPER2", "instructions": "Apply 'Adapt', 'Modify/Magnify/Minify': Propose 2 feature ideas by adapting a concept from another appliance for the coffee maker OR by modifying (e.g., magnifying customization options, minifying size/complexity) an existing feature. Explain the user benefit.", "dependencies": [] },
-            { "step_id": "SCAMPER3", "instructions": "Apply 'Put to other use', 'Eliminate', and 'Reverse/Rearrange': Propose 2 novel ideas by considering alternative uses for the coffee maker, eliminating a current component/step, or reversing/rearranging its process. Explain the user benefit.", "dependencies": [] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A specific brainstorming technique; ideas generated can be further explored using Mind Mapping or Pro/Con Evaluation.
-* **8. Mind Mapping (Conceptual Structure Generation)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Central Topic:** Start with a single, central concept, problem, or main idea. This is the core of the mind map.
-    2. **Primary Branches:** Identify and radiate the main themes or first-level categories directly related to the central topic. Use keywords or short phrases for these primary branches.
-    3. **Secondary Branches (Sub-topics):** For each primary branch, generate associated sub-topics, ideas, or details. These form secondary branches, extending outwards from the primary ones.
-    4. **Tertiary and Further Branches:** Continue to break down topics into more specific details, creating further levels of branches (tertiary, quaternary, etc.) as needed. Explore associations and connections.
-    5. **Add Keywords, Images, Links (Conceptual for LLM):** (Visually, one would add these). For an LLM, this means using descriptive keywords, and potentially noting cross-connections or relationships between different branches or ideas even if they are on different main branches. The output should reflect the hierarchical and associative structure (e.g., nested lists, outline).
-    6. **Review and Refine:** Examine the map for completeness, clarity, and logical organization. Add or restructure as needed.
-  * ***Why It's Effective:***
-    * Organizes complex information in a structured, hierarchical, and easy-to-understand format (even if text-based for LLMs).
-    * Facilitates brainstorming by allowing free association of ideas and visual exploration of a topic's different facets.
-    * Helps to see the "big picture" as well as details, and to uncover relationships between different pieces of information.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Broadly exploring a complex topic or subject area.
-    * Organizing diverse information or brainstorming a wide array of related ideas.
-    * Outlining a multifaceted concept, project, or piece of writing.
-    * Situations where understanding the structure and interconnections of a topic is key.
-    * Prompts like: "Explore all dimensions of X," "Brainstorm themes related to Y for a new campaign," "Outline the key components of Z."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "MM_RemoteWorkImpact",
-          "strategy": "Mind Mapping",
-          "overview": "Explore the multifaceted impacts of widespread remote work.",
-          "steps": [
-            { "step_id": "MM1", "instructions": "Start with the central topic: 'Impacts of Widespread Remote Work'. Create 5 primary branches representing key areas: Technology, Company Culture, Employee Well-being, Economics (local & national), and Training/Development." },
-            { "step_id": "MM2", "instructions": "For each of the 5 primary branches identified in MM1, list 3-5 relevant sub-themes, specific impacts, or key questions. For example, under 'Technology', sub-themes could be 'Cybersecurity', 'Collaboration Tools', 'Home Internet Infrastructure'.", "dependencies": ["MM_RemoteWorkImpact.MM1"] },
-            { "step_id": "MM3", "instructions": "Organize the central topic, primary branches, and sub-themes into a clear hierarchical structure (e.g., a nested bullet list or outline format) representing the conceptual mind map.", "dependencies": ["MM_RemoteWorkImpact.MM2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can be used to structure information before applying Divide & Conquer, or to organize ideas from SCAMPER.
-* **9. Analogical Thinking**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Target Problem/Domain:** Clearly articulate the problem you are trying to solve or the domain where you need new ideas (the "target").
-    2. **Identify Potential Source Domains (Analogues):** Brainstorm or search for different, seemingly unrelated domains, systems, or situations (the "sources" or "analogues") that might share some underlying structural similarities, functions, or challenges with the target problem, even if the surface features are different.
-    3. **Abstract Principles from Source(s):** Analyze the chosen source domain(s) to understand how they work or how analogous problems are solved within them. Extract the core principles, mechanisms, strategies, or structural properties.
-    4. **Map Analogies to Target:** Systematically "map" or transfer the abstracted principles or solutions from the source domain(s) to the target problem. Ask: "How could this principle/mechanism from domain X be applied to solve problem Y in my target domain?"
-    5. **Generate Novel Ideas:** Develop specific, new ideas or solutions for the target problem based on these analogical mappings. Adapt the borrowed concepts to fit the constraints and context of the target domain.
-    6. **Evaluate Ideas:** Assess the novelty, feasibility, and potential effectiveness of the generated ideas.
-  * ***Why It's Effective:***
-    * Facilitates breakthrough innovations by transferring knowledge and solutions from distant or unexpected domains.
-    * Helps overcome "functional fixedness" and entrenched thinking patterns by providing fresh perspectives.
-    * Can lead to highly creative and non-obvious solutions to challenging problems.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Seeking novel, unconventional, or "out-of-the-box" solutions.
-    * Facing a creative block or when existing approaches are insufficient.
-    * Looking for inspiration from fields unrelated to the immediate problem.
-    * Complex problems where a new paradigm or approach is needed.
-    * Prompts like: "Find an unconventional solution for X," "How can insights from Y domain help us with Z?" "Generate creative ideas for A by looking at B."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "AT_ParkUtilization",
-          "strategy": "Analogical Thinking",
-          "overview": "Generate novel ideas to improve urban park utilization by drawing analogies from other domains.",
-          "steps": [
-            { "step_id": "AT1", "instructions": "Choose a first source domain with high engagement, e.g., 'online gaming community engagement'. Extract 2 core principles or mechanisms that drive participation and sustained interest in that domain." },
-            { "step_id": "AT2", "instructions": "Choose a second, different source domain related to resource management or flow, e.g., 'library book circulation systems' or 'dynamic traffic flow management'. Extract 2 core principles or mechanisms from this domain.", "dependencies": [] },
-            { "step_id": "AT3", "instructions": "For each of the 4 principles extracted in AT1 and AT2, translate and adapt it into a concrete strategy or idea for improving urban park utilization. Aim for 2-4 novel, actionable ideas in total.", "dependencies": ["AT_ParkUtilization.AT1", "AT_ParkUtilization.AT2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A powerful creative thinking method; can be used to generate hypotheses for Hypothesis Testing.
-* **10. First Principles Thinking**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Identify Problem/Concept:** Clearly define the problem, system, or concept to be deconstructed.
-    2. **Deconstruct to Fundamentals:** Break down the problem or concept into its most basic, irreducible truths or core components. Question every assumption and commonly accepted belief about it. Ask "What are we absolutely sure is true here?" repeatedly, until you reach fundamental facts or scientific principles that cannot be deduced further.
-    3. **Challenge Conventions:** Explicitly separate these fundamental first principles from historical conventions, analogies, or current best practices associated with the problem/concept.
-    4. **Reconstruct from Basics:** Starting only from the identified first principles, reason upwards to build a new solution, approach, or understanding from the ground up. Ignore how things have been done before and focus on what is possible based on these fundamentals.
-    5. **Develop Novel Solutions:** Generate one or more solutions or models based purely on this foundational reasoning.
-    6. **Evaluate:** Assess the feasibility, potential, and implications of these first-principles-derived solutions.
-  * ***Why It's Effective:***
-    * Leads to truly innovative and potentially transformative solutions by avoiding reliance on incremental improvements or existing paradigms.
-    * Challenges deeply ingrained assumptions and opens up entirely new possibilities.
-    * Provides a deep and fundamental understanding of a problem, free from historical baggage or conventional wisdom.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Seeking radical innovation or a complete reimagining of a product, service, or system.
-    * Challenging established paradigms or solving complex problems where existing solutions are fundamentally flawed or inadequate.
-    * When conventional approaches are yielding diminishing returns.
-    * Prompts like: "Re-imagine X from first principles," "Develop a fundamental solution to problem Y," "What is the most basic way to achieve Z?"
-  * ***Global View & Pipeline Integration:***
-    * **How it gives a global view:** By deconstructing to fundamentals and reconstructing, it can lead to a novel, overarching understanding or solution that isn't tied to existing local optima.
-    * **Pipeline Fit:** Planner: "Deconstruct [problem] to its fundamental truths," "Challenge current assumptions," "Reconstruct a solution from these principles."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "FPT_Commuting",
-          "strategy": "First Principles Thinking",
-          "overview": "Re-imagine urban commuting from first principles.",
-          "steps": [
-            { "step_id": "FPT1", "instructions": "Deconstruct 'urban commuting'. Identify its most fundamental needs and objectives (e.g., moving people/goods from point A to point B safely, efficiently in terms of time and energy, with minimal negative externalities like pollution or congestion)." },
-            { "step_id": "FPT2", "instructions": "Question and list common assumptions about current commuting methods (e.g., individual car ownership is necessary, public transport must follow fixed routes, physical presence is always required). For each assumption, identify if it's a fundamental truth or a convention. Note constraints often ignored by current solutions (e.g., true environmental cost).", "dependencies": ["FPT_Commuting.FPT1"] },
-            { "step_id": "FPT3", "instructions": "Reasoning up from the fundamental needs (FPT1) and ignoring conventional assumptions (FPT2), propose at least 2 radically different concepts for urban mobility that aim to optimally satisfy those core needs.", "dependencies": ["FPT_Commuting.FPT1", "FPT_Commuting.FPT2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A more profound version of Assumption Challenging. Can provide the foundational elements for Quantitative Modeling or Systems Thinking.
-* **11. Assumption Challenging**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Identify Target:** Clearly define the problem, plan, belief system, statement, or context whose underlying assumptions need to be examined.
-    2. **List Assumptions:** Systematically identify and list all explicit (stated) and implicit (unstated, taken-for-granted) assumptions related to the target. Ask: "What must be true for this plan/belief to make sense or be valid?" "What are we taking for granted here?"
-    3. **Critically Question Each Assumption:** For each assumption on the list:
-       * **Validity:** Is it actually true? Is it universally true, or only in specific contexts?
-       * **Evidence:** What evidence supports it? What evidence contradicts it?
-       * **Origin:** Where did this assumption come from? Is it based on fact, opinion, or outdated information?
-    4. **Consider "What If Not True?":** For each key assumption, explore the consequences if it were false or invalid. How would this change the understanding of the problem, the viability of the plan, or the truth of the belief?
-    5. **Generate Alternatives:** Based on challenging the assumptions, brainstorm alternative perspectives, solutions, plans, or actions that become possible if the original assumptions are relaxed or discarded.
-  * ***Why It's Effective:***
-    * Uncovers hidden biases, blind spots, and flawed reasoning that can undermine plans or lead to poor decisions.
-    * Stimulates critical thinking and fosters a deeper, more nuanced understanding of the subject.
-    * Can reveal new opportunities, identify unconsidered risks, and foster innovation by breaking free from self-imposed or conventional constraints.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Need to stimulate critical thinking, overcome entrenched viewpoints, or de-bias a plan.
-    * When a project or strategy is stuck, underperforming, or based on long-held beliefs.
-    * Before making significant decisions or commitments, to ensure they are based on sound premises.
-    * To identify hidden risks or foster innovation by questioning the status quo.
-    * Prompts like: "What are the core assumptions underlying strategy X? Challenge them." "Identify and question unstated beliefs about customer behavior Y." "Critique the assumptions of plan Z."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "AC_EmployeeTraining",
-          "strategy": "Assumption Challenging",
-          "overview": "Challenge assumptions in the current employee training approach to identify areas for improvement.",
-          "steps": [
-            { "step_id": "AC1", "instructions": "List at least 5 key underlying assumptions in the current employee training approach (e.g., 'all employees learn the same way', 'classroom training is most effective', 'training is a one-time event', 'current content is up-to-date', 'completion equals competency')." },
-            { "step_id": "AC2", "instructions": "For each assumption listed in AC1, critically question its universal validity and relevance in today's context. Provide at least one counter-argument or scenario where the assumption might not hold true.", "dependencies": ["AC_EmployeeTraining.AC1"] },
-            { "step_id": "AC3", "instructions": "For each assumption challenged in AC2, outline at least one alternative training method or approach that could be considered if that specific assumption were proven false or significantly flawed.", "dependencies": ["AC_EmployeeTraining.AC2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A foundational step for First Principles Thinking. Can lead to hypotheses for Hypothesis Testing. Integral to Dialectical Inquiry.
-
----
-
-**III. Question Answering (for Novel Questions without Pre-existing Direct Answers)**
-
-* **12. Constructive Reasoning / Inferential Path Finding**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Clarify Novel Question:** Precisely define the novel question that requires a constructed answer (as no direct answer is readily available).
-    2. **Identify Relevant Knowledge Base:** Gather established facts, fundamental principles, related (but not direct) information, and existing knowledge that can serve as starting points or building blocks for an inferential chain.
-    3. **Formulate Inferential Steps:** Develop a logical sequence of inferences (deductive, inductive, abductive) that connect the known information to a plausible answer for the novel question. Each step in the chain should build logically upon the previous one.
-       * Example step: "Given fact A and principle B, we can infer C."
-       * Next step: "Given C and related information D, we can further infer E."
-    4. **Articulate Reasoning for Each Link:** Explicitly state the justification or logical connection for each inferential link made in the chain.
-    5. **Construct Final Answer:** Synthesize the endpoint of the inferential path into a coherent answer to the original novel question. Acknowledge any assumptions made, uncertainties, or limitations in the reasoning process.
-  * ***Why It's Effective:***
-    * Enables the generation of answers to questions for which no direct, pre-existing solutions or data exists.
-    * Develops problem-solving skills by requiring the explicit construction of logical connections and arguments.
-    * Can lead to novel insights, predictions, or explanations by synthesizing diverse pieces of information.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Hypothetical "what if" questions exploring unprecedented scenarios.
-    * Questions requiring the synthesis of diverse knowledge domains to form an answer.
-    * Predicting potential outcomes or impacts of novel situations, technologies, or events where direct empirical data is unavailable.
-    * Prompts like: "What would be the likely economic impact if X technology becomes mainstream?" "Based on principles A and B, how might society adapt to phenomenon C?" "Infer the consequences of Y."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "CR_TeleportTourism",
-          "strategy": "Constructive Reasoning / Inferential Path Finding",
-          "overview": "Infer the potential impact of widespread, affordable human teleportation on the global tourism industry.",
-          "steps": [
-            { "step_id": "CR1", "instructions": "State the core established effects/attributes of hypothetical widespread, affordable teleportation relevant to travel (e.g., near-instantaneous travel between any two points, potential irrelevance of geographical distance for travel time, shift in infrastructure costs from transport to teleportation hubs)." },
-            { "step_id": "CR2", "instructions": "Based on CR1, infer a first order of cascading impacts on key sectors of the current tourism industry (e.g., airlines, hotels, cruise lines, local transport services at destinations). For each, explain the inferential link.", "dependencies": ["CR_TeleportTourism.CR1"] },
-            { "step_id": "CR3", "instructions": "Building on CR2, identify and explain 3 potentially unforeseen or second-order consequences for tourism patterns, destinations, or tourist behaviors. Clearly articulate the inferential path from the initial premises (CR1) to these consequences.", "dependencies": ["CR_TeleportTourism.CR2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Central to Thought Experimentation & Extrapolation. Can be used within Scenario Modeling to explore the logic of a scenario's development.
-* **13. Multi-Perspective Synthesis for Novel Questions**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Novel Question:** Clearly articulate the complex or novel question that benefits from a multi-faceted exploration.
-    2. **Identify Diverse Perspectives:** Select several (e.g., 3-5) distinct and relevant perspectives, theoretical frameworks, disciplinary lenses, or stakeholder viewpoints from which to examine the question. Examples: economic, sociological, ethical, technological, environmental, historical, user A, provider B.
-    3. **Analyze from Each Perspective:** For each chosen perspective, thoroughly analyze the novel question from that specific viewpoint. What are the key insights, arguments, concerns, interpretations, or potential answers that arise when looking through this particular lens?
-    4. **Identify Convergences and Divergences:** Compare the analyses from all perspectives. Note areas where the perspectives lead to similar conclusions or insights (convergences) and areas where they offer conflicting views, different priorities, or highlight different aspects (divergences).
-    5. **Synthesize into Holistic Understanding:** Integrate the insights from the various perspectives into a more comprehensive, nuanced, and holistic understanding or answer to the novel question. The synthesis should aim to explain the complexity, acknowledge trade-offs, and ideally offer a richer view than any single perspective could provide alone.
-  * ***Why It's Effective:***
-    * Provides a richer, more well-rounded, and comprehensive understanding of complex or novel issues where a single viewpoint is insufficient.
-    * Helps to avoid narrow, biased, or simplistic answers by incorporating diverse insights.
-    * Can reveal hidden interconnections, trade-offs, and complexities that are not apparent from a single perspective.
-    * Particularly useful for questions with no single "correct" answer but where a thorough exploration is valuable.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Complex ethical dilemmas or socio-technical issues.
-    * Exploring the multifaceted implications of new concepts, technologies, or policies.
-    * Questions where a single "correct" answer is unlikely, but a well-rounded, nuanced exploration is the goal.
-    * Situations requiring an understanding of how different stakeholders or disciplines view an issue.
-    * Prompts like: "What are the multifaceted ethical considerations of X?" "Explore the potential long-term societal impacts of trend Y from economic, sociological, and psychological perspectives."
-  * ***Global View & Pipeline Integration:***
-    * **How it gives a global view:** Explicitly combines different viewpoints (economic, social, technical, etc.) to create a richer, more holistic understanding.
-    * **Pipeline Fit:** Planner: "Analyze [problem] from an economic perspective," "Analyze from a social perspective," "Synthesize these perspectives."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "MPS_GenAIArt",
-          "strategy": "Multi-Perspective Synthesis",
-          "overview": "Explore the impact of generative AI on art and creativity from multiple perspectives.",
-          "steps": [
-            { "step_id": "MPS1", "instructions": "Analyze the impact of generative AI on art from the perspective of 'Artists/Creators'. Consider challenges (e.g., copyright, devaluation of skill) and opportunities (e.g., new tools, co-creation)." },
-            { "step_id": "MPS2", "instructions": "Analyze the impact from the perspective of 'Art Consumers/Audience'. Then, select and analyze from at least two additional distinct perspectives (e.g., 'Art Market/Galleries', 'Intellectual Property Law', 'Cultural Historians'). For each, detail key considerations.", "dependencies": ["MPS_GenAIArt.MPS1"] },
-            { "step_id": "MPS3", "instructions": "Synthesize the insights from all analyzed perspectives (MPS1, MPS2) into a cohesive summary. Highlight key areas of agreement, disagreement, and the overall complex nature of generative AI's impact on art and creativity.", "dependencies": ["MPS_GenAIArt.MPS1", "MPS_GenAIArt.MPS2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Builds upon elements of Comparative Analysis but focuses on synthesizing viewpoints rather than just comparing options. Can enrich Scenario Modeling.
-* **14. Thought Experimentation & Extrapolation**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Premise/Hypothetical Scenario:** Clearly state the "what if" question or the core premise of the thought experiment. This usually involves altering a known law, introducing a novel condition, or imagining an extreme situation.
-    2. **Establish Initial Conditions & Rules:** Define the key parameters, assumptions, and governing rules of this hypothetical scenario. What is held constant from reality, and what is changed?
-    3. **Logical Extrapolation of Consequences:** Systematically deduce or infer the logical consequences that would unfold from the initial premise and conditions. Trace the chain of effects: "If [premise] is true, then A would happen. Because of A, B would likely follow. This would lead to C..."
-    4. **Explore Implications & Boundaries:** Analyze the extrapolated consequences to identify significant implications, insights, paradoxes, or conceptual boundaries revealed by the thought experiment. What does this imagined scenario teach us?
-    5. **Reflect and Conclude:** Summarize the key findings of the thought experiment. Reflect on what it reveals about the real world, the limits or validity of a theory, the potential impact of the initial premise, or fundamental principles.
-  * ***Why It's Effective:***
-    * Allows exploration of scenarios or concepts that are impossible or impractical to test empirically (e.g., violating laws of physics, extreme societal changes).
-    * Can clarify complex theories, test their logical consistency, and reveal their underlying assumptions or limitations.
-    * Stimulates creative and critical thinking, potentially leading to new hypotheses, insights, or understanding of fundamental principles.
-  * ***Ideal Problem Factors / Characteristics:***
-    * "What if" questions exploring extreme, unprecedented, or purely theoretical situations.
-    * Testing the logical limits or implications of a scientific theory, philosophical concept, or ethical principle.
-    * Understanding potential consequences where no empirical precedent exists.
-    * Exploring fundamental concepts in fields like physics, philosophy, ethics, or future studies.
-    * Prompts like: "Imagine a world where X fundamental law of physics is different; how would Y evolve?" "What if humans could photosynthesize; what would be a major societal restructuring?"
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "TE_AlienLanguage",
-          "strategy": "Thought Experimentation & Extrapolation",
-          "overview": "Explore the diplomatic impact if humanity discovered an alien language incapable of expressing deception or negativity.",
-          "steps": [
-            { "step_id": "TE1", "instructions": "Define the parameters of the thought experiment: An alien species is discovered, and their language is proven to be universally understood by humans. Crucially, their language structure fundamentally lacks concepts for, and the ability to express, deception, lies, or inherently negative sentiments (e.g., hatred, malice)." },
-            { "step_id": "TE2", "instructions": "Extrapolate the primary and secondary consequences of this linguistic reality on human international diplomacy. Consider changes to trust-building processes, conflict resolution mechanisms, treaty negotiations, and intelligence gathering.", "dependencies": ["TE_AlienLanguage.TE1"] },
-            { "step_id": "TE3", "instructions": "Based on the extrapolation in TE2, determine and justify what would be the single most profound and transformative impact on global diplomatic relations. Explain the reasoning.", "dependencies": ["TE_AlienLanguage.TE2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Relies heavily on Constructive Reasoning / Inferential Path Finding. Can be a method used within Scenario Modeling to explore extreme scenarios.
-* **15. Systems Thinking**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define System & Boundaries:** Clearly identify the system being analyzed and establish its boundaries (what is inside the system, what is outside/in its environment?). State the purpose or key functions of the system.
-    2. **Identify Components & Elements:** List the key parts, actors, variables, and structural elements within the system.
-    3. **Map Relationships & Interconnections:** Identify and map the relationships, influences, and flows (of information, resources, materials, etc.) between the components. How do they interact and affect each other?
-    4. **Identify Feedback Loops:** Look for and describe feedback loops within the system:
-       * **Reinforcing (or amplifying) loops:** Drive accelerating change in one direction.
-       * **Balancing (or stabilizing) loops:** Resist change and seek equilibrium or a goal state.
-    5. **Analyze System Dynamics:** Consider how these components, relationships, and feedback loops interact to produce the system's overall behavior over time. Look for patterns, delays, accumulations (stocks), and rates of flow.
-    6. **Identify Leverage Points:** Pinpoint areas within the system where small changes or interventions could lead to significant, lasting improvements or shifts in the system's behavior.
-  * ***Why It's Effective:***
-    * Provides a holistic understanding of complex problems by focusing on interrelationships and patterns, rather than isolated parts or linear cause-effect.
-    * Helps identify unintended consequences of actions and interventions.
-    * Reveals underlying structures that drive system behavior, leading to more effective and sustainable solutions.
-    * Identifies high-leverage points for intervention, allowing for more efficient use of resources.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Complex problems with many interacting elements, non-linear effects, and feedback loops.
-    * Situations where solutions in one area often create new problems elsewhere (symptom-shifting).
-    * Recurring problems that seem resistant to conventional solutions.
-    * Tasks involving policy analysis, organizational change, ecological modeling, engineering design of complex systems, or understanding market dynamics.
-    * Prompts like: "Analyze the systemic factors contributing to X," "How do components A, B, and C interact to affect outcome Y?" "Identify leverage points to improve system Z."
-  * ***Global View & Pipeline Integration:***
-    * **How it gives a global view:** Its entire purpose is to understand the whole system, its components, interconnections, feedback loops, and emergent behaviors.
-    * **Pipeline Fit:** The Planner can create steps like: "Identify key components of [problem]," "Map relationships between components A and B," "Identify potential feedback loops involving C," "Analyze how these interactions lead to [observed phenomenon]." The Reviewer then assesses if this system map is becoming comprehensive.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "ST_UrbanCongestion",
-          "strategy": "Systems Thinking",
-          "overview": "Analyze urban traffic congestion as a complex system.",
-          "steps": [
-            { "step_id": "ST1", "instructions": "Define the 'urban traffic congestion' system. Identify its key components/actors (e.g., commuters, vehicles, road infrastructure, public transport, traffic signals, city planners) and relevant environmental factors (e.g., population density, economic activity)." },
-            { "step_id": "ST2", "instructions": "Map the primary relationships and interdependencies between the components identified in ST1. Describe key flows (e.g., flow of vehicles, information about delays) and influences (e.g., how road capacity influences travel time, how perceived travel time influences mode choice).", "dependencies": ["ST_UrbanCongestion.ST1"] },
-            { "step_id": "ST3", "instructions": "Identify at least one reinforcing feedback loop (e.g., more congestion -> longer travel times -> more people drive assuming roads are full -> even more congestion) and one balancing feedback loop (e.g., more congestion -> demand for better public transport -> investment -> improved public transport -> some shift from cars) within the system. Describe their likely behavior.", "dependencies": ["ST_UrbanCongestion.ST2"] },
-            { "step_id": "ST4", "instructions": "Based on the analysis in ST1-ST3, pinpoint 2-3 potential leverage points where interventions might effectively reduce urban traffic congestion. Explain why these are considered leverage points.", "dependencies": ["ST_UrbanCongestion.ST3"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Complements "Constraint Analysis" and "Root Cause Analysis" by providing a broader context. "Graph Mapping & Network Insight" can be a tool to visualize parts of the system.
-* **16. Dialectical Inquiry / Devil's Advocacy**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **State Thesis:** Clearly articulate the main proposal, idea, plan, or belief (the "thesis") along with its key supporting arguments, evidence, and assumptions.
-    2. **Develop Antithesis (Devil's Advocacy):**
-       * **Critique Thesis:** Systematically challenge the thesis by identifying its weaknesses, potential flaws, unstated risky assumptions, negative consequences, or overlooked alternatives.
-       * **Formulate Counter-Proposal:** If appropriate, develop an alternative, opposing proposal or viewpoint (the "antithesis") that directly contradicts or offers a significant alternative to the thesis. This is done from the perspective of a "devil's advocate" whose role is to rigorously test the thesis.
-    3. **Structured Debate & Evaluation:** Engage in a conceptual debate between the thesis and the antithesis.
-       * Examine the arguments for and against each.
-       * Identify points of agreement, disagreement, shared assumptions, and irreconcilable differences.
-       * Evaluate the relative strengths and weaknesses of both the thesis and antithesis based on evidence, logic, and potential impact.
-    4. **Synthesize or Decide:**
-       * **Synthesis:** Attempt to create a "synthesis" â€“ a new, more robust proposal or understanding that integrates the valid insights and strengths from both the thesis and antithesis, while addressing their weaknesses.
-       * **Decision:** If synthesis is not possible, use the insights from the structured debate to make a more informed decision about whether to accept, reject, or modify the original thesis.
-  * ***Why It's Effective:***
-    * Reduces confirmation bias and groupthink by systematically forcing consideration of opposing viewpoints and critical counter-arguments.
-    * Leads to more robust, well-vetted, and resilient decisions, plans, or ideas.
-    * Uncovers hidden assumptions, potential flaws, and unconsidered risks in a proposal.
-    * Fosters a deeper and more critical understanding of complex issues by exploring them through structured opposition.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Critical decision-making, especially for high-stakes or strategic choices.
-    * Policy analysis and formulation where proposals need rigorous vetting.
-    * De-biasing strategic plans or stress-testing new ideas against strong opposition.
-    * Situations where a proposal might have strong proponents but potential downsides are not being adequately explored.
-    * Prompts like: "Critically evaluate proposal X using Devil's Advocacy," "Develop a thesis and antithesis for strategy Y," "Debate the merits of A vs. B."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "DI_NewMarketEntry",
-          "strategy": "Dialectical Inquiry / Devil's Advocacy",
-          "overview": "Critically evaluate a proposal to enter a new international market (Market Z).",
-          "steps": [
-            { "step_id": "DI1", "instructions": "Clearly state the thesis: 'The company should enter Market Z within the next 12 months.' List 3-4 key supporting arguments for this thesis (e.g., market size, growth potential, competitive landscape)." },
-            { "step_id": "DI2", "instructions": "Act as Devil's Advocate. Generate the strongest possible antithesis (counter-arguments) to the proposal in DI1. This should include identifying critical weaknesses, significant risks (e.g., cultural barriers, regulatory hurdles, high investment costs), and potentially an alternative strategy (e.g., focus on existing markets, partner instead of direct entry).", "dependencies": ["DI_NewMarketEntry.DI1"] },
-            { "step_id": "DI3", "instructions": "Evaluate the strengths and weaknesses of both the thesis (DI1) and the antithesis (DI2). Identify any shared underlying assumptions, key points of data conflict, or irreconcilable differences in strategic outlook.", "dependencies": ["DI_NewMarketEntry.DI1", "DI_NewMarketEntry.DI2"] },
-            { "step_id": "DI4", "instructions": "Attempt to synthesize a revised proposal or recommendation. This could involve modifying the original thesis to address weaknesses identified by the antithesis (e.g., phased entry, risk mitigation strategies), or concluding that entry is too risky. Justify the synthesis or final recommendation.", "dependencies": ["DI_NewMarketEntry.DI3"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A more structured and adversarial form of Pro/Con Evaluation or Assumption Challenging. Can be enhanced by Multi-Perspective Synthesis to inform the thesis/antithesis.
-* **17. Divide & Conquer**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Complex Problem:** Clearly articulate the large, complex problem or task to be addressed.
-    2. **Decompose into Sub-Problems:** Break down the main problem into a set of smaller, more manageable, and ideally relatively independent sub-problems or components. The decomposition should be logical and cover all essential aspects of the original problem.
-    3. **Solve Sub-Problems:** For each sub-problem, develop and apply a method to solve it. This might involve using other exploration strategies or specific techniques tailored to the nature of that sub-problem. If sub-problems are similar, a common solution approach might be reused.
-    4. **Combine Solutions (Integrate):** Once solutions or partial solutions for the sub-problems are obtained, combine or integrate them to form the solution to the original complex problem. This step may involve:
-       * Sequencing sub-solutions.
-       * Managing dependencies between sub-solutions.
-       * Resolving any conflicts or inconsistencies that arise from combining them.
-       * Synthesizing a cohesive overall strategy or output.
-    5. **Verify Overall Solution:** Check if the combined solution effectively addresses the original complex problem.
-  * ***Why It's Effective:***
-    * Makes overwhelming or highly complex problems more manageable by breaking them into smaller, more focused pieces.
-    * Allows for specialized attention or expertise to be applied to different parts of a problem.
-    * Can simplify the solution process and lead to clearer, more structured outcomes.
-    * Facilitates parallel processing of sub-problems if they are truly independent (though often conceptual for LLMs).
-  * ***Ideal Problem Factors / Characteristics:***
-    * Large, multifaceted challenges that can be logically segmented into distinct parts or components.
-    * Tasks like developing a comprehensive strategy, outlining a complex plan, designing a multi-component system, or formulating a broad policy.
-    * Problems where different aspects require different approaches or types of analysis.
-    * Prompts like: "Develop a comprehensive strategy for X," "Outline a plan to address multifaceted problem Y," "How can we tackle the large-scale challenge of Z by breaking it down?"
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "DC_UrbanMobility",
-          "strategy": "Divide & Conquer",
-          "overview": "Develop a comprehensive strategy for improving urban mobility in a large city.",
-          "steps": [
-            { "step_id": "DC1", "instructions": "Identify and define 3-5 major independent components (sub-problems) of the 'urban mobility improvement' challenge. Examples: Public Transportation Enhancement, Traffic Management & Infrastructure, Promotion of Sustainable Micromobility (bikes, scooters), Integration of New Mobility Technologies (e.g., autonomous vehicles, ride-sharing)." },
-            { "step_id": "DC2", "instructions": "For each major component (sub-problem) identified in DC1, outline 2-3 key sub-problems or specific areas requiring targeted solutions or policy initiatives. For instance, under 'Public Transportation Enhancement', sub-problems could be 'Network Coverage & Frequency', 'Affordability & Accessibility', 'User Experience'.", "dependencies": ["DC_UrbanMobility.DC1"] },
-            { "step_id": "DC3", "instructions": "Conceptually outline potential solutions or strategic directions for each sub-problem detailed in DC2. Then, synthesize these into an integrated urban mobility improvement strategy. Note key interdependencies and potential synergies between the solutions for different components.", "dependencies": ["DC_UrbanMobility.DC2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Mind Mapping can help identify the sub-problems. Each sub-problem might then be tackled with other strategies.
-* **18. Heuristic Search (Informed Search)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Problem & Search Space:** Clearly define the problem to be solved, the goal state or desired outcome, and the conceptual "search space" (the set of all possible solutions, paths, or states to be explored).
-    2. **Develop/Identify Heuristics:** Formulate or select relevant "heuristics" â€“ these are domain-specific rules of thumb, educated guesses, or simplifying criteria used to estimate the promise or closeness to the goal of a particular path or state. Heuristics guide the search efficiently but don't guarantee optimality.
-    3. **Initialize Search:** Start from an initial state or a set of initial options.
-    4. **Generate & Evaluate Next Steps:** From the current state(s), generate potential next steps, states, or options. Apply the heuristic(s) to evaluate each of these, prioritizing those that appear most promising (e.g., estimated lowest cost to goal, highest potential value, closest match to target criteria).
-    5. **Select & Explore:** Choose the most promising path or option according to the heuristic evaluation and explore it further.
-    6. **Iterate:** Repeat steps 4 and 5, iteratively moving through the search space, guided by the heuristics. The process may involve backtracking if a chosen path proves unpromising. Stop when the goal is reached, a satisfactory solution is found, or search limits (e.g., time, number of steps) are exhausted.
-  * ***Why It's Effective:***
-    * More efficient than exhaustive (brute-force) search, especially in large or complex solution spaces, by intelligently pruning less promising paths.
-    * Can find good or "good enough" solutions quickly, even if not always provably optimal.
-    * Leverages domain-specific knowledge or established patterns to guide the search process effectively.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Searching for information, ideas, or solutions in a vast space where exhaustive exploration is impractical or impossible.
-    * Some guiding principles, patterns, or rules of thumb (heuristics) exist to help prioritize options.
-    * Optimization problems where finding an exact optimum is too costly, and a good approximate solution is acceptable.
-    * Tasks like information retrieval based on relevance, identifying promising candidates from a large pool, or initial idea filtering.
-    * Prompts like: "Find the most relevant research papers on X using keywords Y and Z," "Identify promising investment opportunities in sector A based on growth indicators B and C." "Shortlist potential solutions for problem P based on criteria Q and R."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "HS_AIStartups",
-          "strategy": "Heuristic Search",
-          "overview": "Identify high-potential AI startups for investment using defined heuristics.",
-          "steps": [
-            { "step_id": "HS1", "instructions": "Define 3 key heuristics for identifying 'high-potential AI startups'. Examples: H1: Experienced founding team (e.g., prior successful exits, deep AI expertise), H2: Novel or defensible Intellectual Property (IP), H3: Addresses a large and growing market." },
-            { "step_id": "HS2", "instructions": "Conceptually apply these heuristics to a hypothetical list of 100 diverse AI startups. Describe how these heuristics would be used to filter and shortlist approximately 10 promising candidates. (No actual list needed, describe the filtering process).", "dependencies": ["HS_AIStartups.HS1"] },
-            { "step_id": "HS3", "instructions": "From the conceptual shortlist of 10 (from HS2), select the top 3 candidates that would likely score highest across all heuristics. For each of these 3, provide a brief rationale explaining why it's a top candidate based on the defined heuristics.", "dependencies": ["HS_AIStartups.HS2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can be used within Pathfinding Strategy Mapping to choose between alternative paths or actions.
-* **19. Pathfinding Strategy Mapping**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Start & Goal States:** Clearly articulate the current state (starting point, problem situation) and the desired future goal state (objective, solution).
-    2. **Identify Key Milestones/Intermediate States:** Break down the journey from the start state to the goal state into a sequence of critical intermediate states, milestones, or sub-goals. These represent significant progress points.
-    3. **Brainstorm Actions for Each Segment:** For each segment between milestones (or from start to first milestone, and last milestone to goal), brainstorm potential actions, initiatives, decisions, or steps required to transition from one to the next.
-    4. **Evaluate & Select Actions:** Evaluate the potential actions for each segment based on criteria such as feasibility, cost, time, resources, risks, and likelihood of success in achieving the next milestone and ultimately the overall goal. Consider constraints. Select the most effective and coherent set of actions for each segment.
-    5. **Sequence & Map the Path:** Arrange the selected actions and milestones into a logical, sequential roadmap or strategic path. This map outlines the overall strategy, showing how actions build upon each other to reach the goal.
-    6. **Identify Dependencies & Contingencies:** Note any critical dependencies between actions or milestones. Consider potential obstacles and develop contingency plans for key risks.
-  * ***Why It's Effective:***
-    * Provides a clear, structured roadmap for achieving complex, multi-step goals or implementing strategies.
-    * Helps in anticipating challenges, planning resource allocation, and tracking progress.
-    * Ensures that actions are aligned with strategic objectives and contribute logically to the desired outcome.
-    * Facilitates communication and coordination by outlining a shared understanding of the plan.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Strategic planning, project management, product development roadmapping, or negotiation planning.
-    * Any task requiring a defined sequence of actions or decisions to achieve a specific objective over time.
-    * Goal-oriented problems where the path from current situation to desired outcome needs to be explicitly charted.
-    * Prompts like: "Develop a roadmap for launching product X," "Outline the negotiation strategy to achieve agreement Y," "Plan the key phases and steps for organizational change Z."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "PSM_MarketShare",
-          "strategy": "Pathfinding Strategy Mapping",
-          "overview": "Develop a strategy map to increase market share from 5% to 15% within 2 years.",
-          "steps": [
-            { "step_id": "PSM1", "instructions": "Define the current state: 'Current market share is 5%'. Define the desired goal state: 'Achieve 15% market share within 2 years'." },
-            { "step_id": "PSM2", "instructions": "Identify 3-5 critical milestones or intermediate states required to bridge the current state to the goal state. Examples: M1: 'Secure 3 key strategic partnerships (Year 1)', M2: 'Launch revamped product line (Year 1 Q3)', M3: 'Expand sales team by 50% (Year 1 Q4)', M4: 'Achieve 10% market share (End of Year 1)'.", "dependencies": ["PSM_MarketShare.PSM1"] },
-            { "step_id": "PSM3", "instructions": "For each milestone identified in PSM2, list 2-3 key actions or initiatives required to achieve it. For each action, briefly note potential costs, resources needed, or key risks. Ensure actions are sequenced logically.", "dependencies": ["PSM_MarketShare.PSM2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Uses Constraint Analysis to define boundaries. Heuristic Search can help select actions. Strategic Backtracking/Backcasting is a specific method for defining the path.
-* **20. Recursive Refinement**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Initial Output (Version 0):** Produce an initial, often rough or high-level, version of the desired output (e.g., an idea, explanation, design sketch, draft answer, outline).
-    2. **Refinement Cycle (Iteration n):**
-       * **Analyze Current Version (Output_n-1):** Critically examine the current version. Identify areas for improvement, clarification, expansion, or correction. This might involve asking specific questions (e.g., "What is unclear?" "What's missing?" "How can this be more precise/detailed/persuasive?" "Are there inconsistencies?").
-       * **Apply Refinement Operations:** Based on the analysis, apply specific operations to improve the output. This could include: adding detail, elaborating on points, restructuring for clarity, correcting errors, simplifying complex parts, strengthening arguments, addressing gaps.
-       * **Generate New Version (Output_n):** Create a new, refined version of the output incorporating the improvements.
-    3. **Check for Sufficiency:** Evaluate if Output_n meets the desired level of quality, detail, or understanding.
-    4. **Repeat or Conclude:** If further refinement is needed and beneficial, repeat Step 2 with Output_n as the input for the next cycle. If the output is satisfactory or further refinement yields diminishing returns, conclude the process.
-  * ***Why It's Effective:***
-    * Allows for the gradual development and improvement of complex ideas, texts, designs, or solutions through manageable iterative steps.
-    * Facilitates a progressive deepening of understanding and sophistication of the output.
-    * Helps manage complexity by tackling it in layers, building upon previous work.
-    * Improves overall quality through repeated cycles of critical evaluation and enhancement.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Developing complex ideas, nuanced arguments, or detailed explanations.
-    * Creative writing, design processes, or software development where iterative improvement is key.
-    * Refining an initial proposal, answer, or concept to achieve greater clarity, depth, or precision.
-    * Tasks where the final desired output is not immediately obvious and needs to be evolved.
-    * Prompts like: "Elaborate on concept X through multiple levels of detail," "Refine the initial proposal Y based on iterative questioning and feedback," "Explore the implications of Z by recursively asking 'what if?' and detailing the answers."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "RR_SustainableDev",
-          "strategy": "Recursive Refinement",
-          "overview": "Develop a nuanced explanation of 'sustainable urban development' through recursive refinement.",
-          "steps": [
-            { "step_id": "RR1", "instructions": "Provide an initial, concise 1-paragraph explanation of 'sustainable urban development', covering its core idea." },
-            { "step_id": "RR2", "instructions": "Based on the explanation in RR1, ask 3 critical or clarifying 'why' or 'how' questions that would probe deeper into its meaning, components, or challenges. Answer each of these questions thoughtfully, expanding on RR1.", "dependencies": ["RR_SustainableDev.RR1"] },
-            { "step_id": "RR3", "instructions": "Synthesize the initial explanation (RR1) and the answers from the clarifying questions (RR2) into a more comprehensive and nuanced 3-paragraph explanation of 'sustainable urban development'. This refined version should highlight key interdependencies and complexities.", "dependencies": ["RR_SustainableDev.RR1", "RR_SustainableDev.RR2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can be applied to the outputs of almost any other strategy to improve them (e.g., refining a Mind Map, a First Principles solution, or a Scenario).
-* **21. Strategic Backtracking / Backcasting**
-
-  * ***SEARCH PROCESS (Focus on Backcasting):***
-    1. **Define Desired Future State (Vision):** Clearly and vividly articulate a specific, ambitious, and desired future state or long-term goal (e.g., "carbon neutrality by 2040," "market leadership in X by 2035").
-    2. **Work Backward from the Future:**
-       * **Identify Final Precursors:** Starting from the desired future state, ask: "For this future state to be achieved by [Future Date], what critical conditions, achievements, or milestones must be in place immediately before it (e.g., 1 year before, or at the penultimate major stage)?"
-       * **Iterate Backwards:** Take each of those identified precursors and, for each one, ask again: "For [this precursor milestone] to be achieved by [its date], what must be in place immediately before *that*?"
-    3. **Continue to Present:** Repeat this backward questioning process, identifying the necessary preceding milestones, conditions, and capabilities, until you reach the present time or a point where actionable steps for the near future can be clearly defined.
-    4. **Formulate Forward Path:** The sequence of milestones and conditions identified (now in reverse chronological order from how they were derived) forms a forward-looking strategic pathway from the present to the desired future.
-    5. **Identify Immediate Actions:** Focus on the earliest steps in this backward-planned path to determine immediate priorities and actions needed now to start moving towards the long-term vision.
-  * ***SEARCH PROCESS (Focus on Backtracking from Failure/Setback):***
-    1. **Identify Failure/Setback Point:** Clearly define the point at which a strategy failed, a project went off course, or an undesirable outcome occurred.
-    2. **Trace Back Decisions/Events:** Reconstruct the sequence of decisions, actions, and events that led from a prior successful state to the point of failure.
-    3. **Identify Critical Divergence Point:** Pinpoint a key prior decision point or event where an alternative choice or action could have been taken that might have led to a different outcome.
-    4. **Explore Alternative Path:** From that divergence point, conceptually explore the alternative path: What would have been the likely consequences of making that different choice?
-    5. **Learn and Adapt:** Use the insights to revise strategy, learn from mistakes, and identify more robust paths forward.
-  * ***Why It's Effective:***
-    * **Backcasting:** Encourages ambitious, vision-driven planning by starting from the desired end-state, often revealing necessary steps that might be missed in purely forward-looking, incremental planning. Helps overcome perceived current constraints.
-    * **Backtracking:** Provides a structured way to learn from failures or setbacks, identify alternative strategic options from past decision points, and avoid repeating mistakes.
-  * ***Ideal Problem Factors / Characteristics:***
-    * **Backcasting:** Long-range strategic planning, achieving ambitious or transformative goals, developing visions for the future, sustainability planning.
-    * **Backtracking:** Analyzing why a project or strategy failed, revising plans after significant setbacks, learning from past experiences to inform future decisions.
-    * Prompts like: "Outline the steps to achieve 10-year vision X by working backward," "If goal Z is to be met by [date], what must be true 5 years prior?" "Analyze why project Y failed and identify alternative paths that could have been taken from decision point D."
-  * ***Example Plan Step (How to Use - Backcasting):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "BC_CarbonNeutralCity",
-          "strategy": "Strategic Backtracking / Backcasting",
-          "overview": "Outline a strategic path for a city to achieve carbon neutrality by 2040 using backcasting.",
-          "steps": [
-            { "step_id": "BC1", "instructions": "Clearly define the desired future state: 'The city achieves full carbon neutrality across all sectors (energy, transport, buildings, waste) by the end of 2040.'" },
-            { "step_id": "BC2", "instructions": "Working backward from the 2040 goal (BC1), identify critical milestones, conditions, or capabilities that must be in place by 2035, then by 2030, and then by 2025 to make the 2040 goal feasible. For each time point, list 2-3 major achievements required (e.g., for 2035: '80% renewable energy grid', for 2030: '50% of private vehicles are EVs').", "dependencies": ["BC_CarbonNeutralCity.BC1"] },
-            { "step_id": "BC3", "instructions": "Focusing on the 2025 milestones identified in BC2, list 3 key strategic initiatives or policies that must be implemented starting now (or in the very near term) to ensure those 2025 milestones are met. Provide a brief rationale for each initiative.", "dependencies": ["BC_CarbonNeutralCity.BC2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A specific method for developing a Pathfinding Strategy Map. Scenario Modeling can help define the desired future state for backcasting.
-* **22. Dynamic Programming Optimization (Conceptual)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Problem Structure:**
-       * **Stages:** Break the problem into a sequence of stages where decisions are made.
-       * **States:** At each stage, define the possible states the system can be in (e.g., remaining budget, current inventory level).
-       * **Decisions:** Identify the decisions available at each state within each stage.
-       * **Objective Function:** Define the value or cost function to be optimized (e.g., maximize profit, minimize cost, maximize utility) over the sequence of decisions.
-       * **Transitions:** Define how decisions at a given state/stage lead to a state in the next stage.
-    2. **Establish Recurrence Relation (Principle of Optimality):** Formulate a recursive relationship that defines the optimal value for a state at a given stage in terms of the optimal values of states at subsequent (or previous) stages. This embodies the principle of optimality: an optimal policy has the property that whatever the initial state and initial decision are, the remaining decisions must constitute an optimal policy with regard to the state resulting from the first decision.
-       * Typically, one works backward from the final stage or forward from the initial stage.
-       * For stage `j` and state `s`, `OptimalValue(j, s) = optimize_over_decisions {ImmediateReturn(decision) + OptimalValue(j+1, next_state)}`.
-    3. **Solve Subproblems and Store Results (Memoization/Tabulation):** Conceptually solve the recurrence relation for all relevant states, typically starting at the final stage and working backward (or vice-versa). Store the optimal value and the optimal decision for each state/stage to avoid re-computation (this is the core of dynamic programming's efficiency for overlapping subproblems).
-    4. **Reconstruct Optimal Policy:** Once the optimal values for all relevant initial states are computed, trace back the sequence of optimal decisions that led to this overall optimal value. This sequence forms the optimal policy or plan.
-  * ***Why It's Effective:***
-    * Finds globally optimal solutions for sequential decision-making problems that exhibit optimal substructure (optimal solutions to the overall problem are composed of optimal solutions to its subproblems) and overlapping subproblems.
-    * More efficient than brute-force enumeration of all possible decision sequences, especially for complex problems.
-    * Provides a structured and rigorous way to handle multi-stage optimization problems where current choices impact future optimal options.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Problems involving a sequence of interdependent decisions made over time or stages.
-    * Resource allocation over multiple periods, multi-stage investment decisions, inventory management, equipment replacement, shortest/longest path problems in certain types of graphs, or long-term policy planning where optimality is key.
-    * The problem can be broken down into stages, with states at each stage, and decisions leading from one state to another.
-    * The objective is to optimize a cumulative value (e.g., total profit, minimum cost) over the entire sequence.
-    * Prompts like: "Determine the optimal budget allocation for project X over 3 years to maximize ROI," "How to manage inventory Y sequentially over 12 months to minimize total holding and shortage costs?" "Plan the optimal sequence of investments for Z."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "DPO_R&DBudget",
-          "strategy": "Dynamic Programming Optimization (Conceptual)",
-          "overview": "Conceptually determine the optimal allocation of a $100k R&D budget over 3 project phases to maximize expected return.",
-          "steps": [
-            { "step_id": "DPO1", "instructions": "Define the problem structure: Stages (3 project phases), State at each phase (remaining budget), Decisions (amount to allocate in current phase), Objective (maximize total expected return from all phases). Assume a (simplified) function relating allocation in a phase to expected return for that phase (e.g., diminishing returns)." },
-            { "step_id": "DPO2", "instructions": "Outline the backward recursive logic: Start with Phase 3 (final stage). For any remaining budget, the optimal decision is to allocate it all to maximize Phase 3 return. Then for Phase 2: for each possible budget entering Phase 2, decide allocation to Phase 2 to maximize (Phase 2 return + optimal expected return from Phase 3 with budget remaining after Phase 2 allocation). Repeat for Phase 1 considering optimal returns from Phases 2 & 3.", "dependencies": ["DPO_R&DBudget.DPO1"] },
-            { "step_id": "DPO3", "instructions": "Describe how this conceptual process would lead to an optimal budget allocation for each of the 3 phases. Explain how the principle of optimality ensures the overall $100k allocation is maximized by making optimal sequential decisions. (No actual calculation, just the logic flow).", "dependencies": ["DPO_R&DBudget.DPO2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A sophisticated form of Pathfinding Strategy Mapping focused on provable optimality for specific problem structures.
-* **23. Graph Mapping & Network Insight**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Identify Entities (Nodes):** Determine the key entities, actors, items, or concepts within the system or domain of interest. These will be represented as nodes (or vertices) in the graph.
-    2. **Define Relationships (Edges):** Identify the types of connections, interactions, influences, or relationships that exist between these entities. These will be represented as edges (or links) connecting the nodes. Edges can be:
-       * **Directed** (A â†’ B, indicating a one-way relationship) or **Undirected** (A â†” B, a two-way relationship).
-       * **Weighted** (e.g., strength of connection, frequency of interaction, cost of traversal) or **Unweighted**.
-       * **Typed** (e.g., "reports to," "supplies," "competes with").
-    3. **Construct Graph (Conceptual or Visual):** Represent the nodes and draw the edges between them based on the identified relationships. For an LLM, this is a conceptual construction described textually (e.g., list of nodes and an adjacency list/matrix or list of edge tuples).
-    4. **Analyze Network Structure & Properties:** Apply graph analysis techniques to uncover insights. This can involve:
-       * **Centrality Measures:** Identify key nodes (e.g., degree centrality, betweenness centrality, closeness centrality).
-       * **Community Detection/Clustering:** Find densely connected subgroups of nodes.
-       * **Path Analysis:** Find shortest paths, identify critical paths, or analyze flow.
-       * **Connectivity & Robustness:** Assess how connected the graph is and identify vulnerabilities (e.g., cut vertices, bridges).
-    5. **Interpret Insights in Context:** Translate the structural properties and analytical findings from the graph back into meaningful insights about the original system or domain. For example, identify key influencers, bottlenecks, hidden dependencies, community structures, or points of vulnerability.
-  * ***Why It's Effective:***
-    * Provides a powerful visual (when applicable) and analytical framework for understanding complex systems defined by relationships and interdependencies.
-    * Helps identify key players, critical connections, vulnerabilities, and structural patterns that might not be obvious from other forms of analysis.
-    * Applicable to a wide range of domains, including social networks, supply chains, biological networks, information flows, and market interdependencies.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Analyzing systems where the relationships and interactions between entities are crucial to understanding behavior or outcomes.
-    * Tasks involving supply chain analysis, social network analysis, market interdependency mapping, organizational structure analysis, or identifying influence pathways.
-    * Need to understand network structure, identify key nodes/links, detect communities, or assess system robustness.
-    * Prompts like: "Map the key stakeholders and their influence in industry X," "Analyze the vulnerabilities in supply chain Y by mapping its components and dependencies," "Identify central actors and communication patterns in the Z network."
-  * ***Global View & Pipeline Integration:***
-    * **How it gives a global view:** Visualizes and analyzes the structure of relationships, revealing central nodes, clusters, and pathways.
-    * **Pipeline Fit:** Planner: "Identify entities for [problem]," "Define types of relationships," "Conceptually map these," "Analyze for key influencers/bottlenecks."
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "GM_LocalFoodSupply",
-          "strategy": "Graph Mapping & Network Insight",
-          "overview": "Analyze the local food supply system using graph mapping to identify key players and potential bottlenecks.",
-          "steps": [
-            { "step_id": "GM1", "instructions": "Identify the key types of entities (nodes) in the 'local food supply system'. Examples: Farms (by type), Distributors, Processors, Farmers Markets, Grocery Stores, Restaurants, Consumers, Regulatory Agencies." },
-            { "step_id": "GM2", "instructions": "Define the primary types of relationships (edges) that connect these nodes. Examples: 'supplies food to', 'buys food from', 'regulates', 'competes with', 'collaborates with'. Specify if these are typically directed or undirected. Conceptually map these relationships between the node types.", "dependencies": ["GM_LocalFoodSupply.GM1"] },
-            { "step_id": "GM3", "instructions": "Based on the conceptual graph map from GM1 and GM2, identify 2-3 potential bottlenecks (nodes or relationships whose failure would significantly disrupt the system) or key influencers (nodes with high connectivity or control over flows). Explain your reasoning based on network structure.", "dependencies": ["GM_LocalFoodSupply.GM2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A key tool for implementing Systems Thinking. Can visualize dependencies identified in Constraint Analysis.
-* **24. Quantitative Modeling & Step-wise Derivation**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Problem & Required Output:** Clearly articulate the quantitative problem and specify the exact numerical answer, model, or derivation required.
-    2. **Identify Inputs & Parameters:** List all known input values, variables, constants, and any governing parameters or assumptions.
-    3. **Decompose into Calculation Steps:** Break down the overall problem into a logical sequence of smaller, interdependent calculation steps. Each step should be well-defined and build upon previous steps or initial inputs.
-    4. **Specify Formula/Logic per Step:** For each step, explicitly state the mathematical formula, statistical principle, logical rule, or algorithmic operation to be applied. Define the inputs required for this specific step (which may be outputs from prior steps) and the output it will produce.
-    5. **Execute Calculations Sequentially (with precision):** Perform each calculation step in the defined order. For LLMs, this typically involves instructing a code execution tool to perform the calculation, ensuring precision and storing intermediate results accurately.
-    6. **Verify Intermediate Results (if possible):** Where feasible, check intermediate results for plausibility or correctness before proceeding.
-    7. **Synthesize Final Result:** Combine the results of the intermediate steps to arrive at the final quantitative answer or model output. Ensure the final answer is presented in the required format and precision.
-  * ***Why It's Effective:***
-    * Enables the solution of complex quantitative problems that cannot be solved in a single leap by breaking them into a manageable sequence of precise calculations.
-    * Ensures accuracy and reduces errors by focusing on one calculation at a time and maintaining a clear flow of data.
-    * Provides a transparent and auditable trail of how a numerical result was derived, making it easier to verify and debug.
-    * Leverages the precision of computational tools for executing mathematical operations.
-  * ***Ideal Problem Factors / Characteristics:***
-    * The task requires deriving a specific numerical answer based on a defined set of rules, formulas, parameters, and interdependencies.
-    * Problems in fields like physics, engineering, finance, epidemiology, statistics, or operations research that involve multi-step calculations.
-    * Situations where precision is critical and the solution path involves building up the answer piece by piece through sequential calculations.
-    * The problem structure lends itself to a step-by-step derivation where outputs of earlier steps become inputs for later ones.
-    * Prompts like: "Calculate the net present value of a project given a series of cash flows and a discount rate," "Model the spread of an infectious disease using an SIR model with specified parameters," "Determine the stress on a beam under a complex load using stepwise application of engineering formulas."
-  * ***Example Plan Step (How to Use for a detailed financial modeling problem):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "QM_NPVProject",
-          "strategy": "Quantitative Modeling & Step-wise Derivation",
-          "overview": "Calculate the Net Present Value (NPV) of a proposed investment project by modeling annual cash flows, applying discounting, and aggregating results step by step for transparency and precision.",
-          "steps": [
-            { "step_id": "QM1", "instructions": "Problem Statement: A project requires an initial investment of $200,000 and is expected to generate the following net cash flows: Year 1: $50,000, Year 2: $60,000, Year 3: $70,000, Year 4: $80,000, Year 5: $90,000. The required rate of return (discount rate) is 8% per annum. Task: List all input parameters and assumptions for the NPV calculation. Output: InitialInvestment, CashFlows (by year), DiscountRate." },
-            { "step_id": "QM2", "instructions": "For each year, calculate the present value (PV) of the net cash flow using the formula: PV = CashFlow / (1 + DiscountRate)^Year. Use code execution for accuracy. Output: List of (Year, CashFlow, PresentValue).", "dependencies": ["QM_NPVProject.QM1"] },
-            { "step_id": "QM3", "instructions": "Sum the present values of all annual cash flows from QM_NPVProject.QM2 to obtain the total present value of future cash inflows. Output: TotalPresentValue.", "dependencies": ["QM_NPVProject.QM2"] },
-            { "step_id": "QM4", "instructions": "Calculate the Net Present Value (NPV) by subtracting the initial investment from the total present value of future cash inflows: NPV = TotalPresentValue - InitialInvestment. Output: NPV (rounded to the nearest dollar).", "dependencies": ["QM_NPVProject.QM1", "QM_NPVProject.QM3"] },
-            { "step_id": "QM5", "instructions": "Interpret the NPV result from QM_NPVProject.QM4: If NPV > 0, the project is financially viable; if NPV < 0, it is not. Provide a brief rationale for the investment decision based on the calculated NPV.", "dependencies": ["QM_NPVProject.QM4"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Complements "First Principles Thinking" by applying fundamental rules to quantitative domains. Enhances "Divide & Conquer" with a specific focus on sequential calculation and precision, often requiring a code execution tool for accuracy.
-
----
-
-**IV. Contextual and Symbolic Reasoning Strategies**
-
-This section covers algorithms and frameworks that excel at applying rules or reasoning based on specific contexts, or interpreting and manipulating symbols beyond simple pattern matching.
-
-* **25. Case-Based Reasoning (CBR)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Retrieve:** Given a new problem (target case), search a case base (a library of previously solved problems, or "past cases") to find the most similar case(s). Similarity is typically measured by comparing features or contextual attributes of the target case with those of the past cases.
-    2. **Reuse/Adapt:** Adapt the solution from the retrieved similar case(s) to fit the specifics of the new target problem. This adaptation can range from simple substitution of values to more complex structural modifications or rule-based adjustments.
-    3. **Revise:** Evaluate the proposed solution in the context of the target problem. If the solution is successful, it's confirmed. If it fails or is suboptimal, revise the solution (potentially by retrieving other cases or applying domain knowledge) or explain the reason for the failure.
-    4. **Retain:** Store the newly solved problem (target case) along with its validated solution (and potentially the reasoning process) as a new case in the case base. This allows the system to learn from experience.
-  * ***Why It's Effective:***
-    * Leverages past experience to solve new problems quickly, especially when solutions are highly context-dependent and past solutions are good precedents.
-    * Avoids the need to explicitly codify all possible rules, making it suitable for domains where knowledge is primarily experiential or anecdotal rather than formalized.
-    * Supports incremental learning and adaptation as new cases are added to the case base.
-    * Can provide justifications for solutions by referencing similar past successful cases.
-    * Handles ill-defined or incomplete problem specifications better than purely rule-based systems if similar past cases exist.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Problems where experience and past examples are strong guides for finding solutions.
-    * Situations where the context significantly influences the appropriate solution, and similar contexts have likely been encountered before.
-    * Domains where explicit, comprehensive rules are hard to define or maintain, but a rich set of examples (cases) is available or can be collected.
-    * Tasks requiring adaptation of known solutions rather than generation from first principles.
-    * Examples include medical diagnosis (based on patient history and similar past patient cases), customer support/helpdesks (resolving issues based on past tickets), legal reasoning (citing precedents), design problems (adapting previous designs), and fault diagnosis.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "CBR_LoanEligibility",
-          "strategy": "Case-Based Reasoning (CBR)",
-          "overview": "Determine loan eligibility for Applicant Y (moderate income, small previous default 2 years ago, stable employment for 5 years) by retrieving and adapting similar past loan applications.",
-          "steps": [
-            { "step_id": "CBR1", "instructions": "Define key features for Applicant Y: Income_Level=Moderate, Default_History={Severity:Small, Recency:2_years_ago}, Employment_Stability=5_years. Retrieve 2-3 past loan application cases from a conceptual case base that are most similar to Applicant Y's profile based on these features. For each retrieved case, list its key features and outcome (e.g., Case Alpha: Mod_Income, No_Default, Stable_Emp -> Approved)." },
-            { "step_id": "CBR2", "instructions": "Compare Applicant Y's feature values to those of the retrieved cases from CBR1. Identify key similarities and differences, particularly concerning the features most relevant to loan approval (e.g., default history, income). Note how Applicant Y's default is older/smaller than Case Beta (denied) but employment is more stable than Case Gamma (approved with conditions).", "dependencies": ["CBR_LoanEligibility.CBR1"] },
-            { "step_id": "CBR3", "instructions": "Adapt the solution/outcome from the most similar and relevant case(s) to fit Applicant Y. If multiple cases are relevant, synthesize or interpolate a solution. For example, if Applicant Y is between Case Alpha (approved) and Case Gamma (approved with conditions), and considering Applicant Y's better income than Gamma, propose an adaptation (e.g., approve with slightly better terms than Gamma). Justify the adaptation.", "dependencies": ["CBR_LoanEligibility.CBR2"] },
-            { "step_id": "CBR4", "instructions": "State the final proposed solution (e.g., loan approved, denied, or approved with specific conditions like higher interest rate or smaller amount) for Applicant Y. Briefly summarize the reasoning based on the CBR process (retrieval of specific cases and adaptation logic).", "dependencies": ["CBR_LoanEligibility.CBR3"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can be seen as a form of analogical reasoning focused on concrete past examples.
-* **26. Rule Engines with Contextual Conditions**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Fact Assertion:** The current problem context is represented as a set of facts in the engine's "working memory."
-    2. **Rule Definition:** A knowledge base contains a set of rules, typically in an "IF `<conditions>` THEN `<actions>`" format. Conditions refer to patterns in the facts.
-    3. **Matching (Pattern Matching):** The rule engine's inference component continuously matches the conditions of all rules against the current facts in the working memory. This identifies all rules whose conditions are currently satisfied (these are "activated" or "triggered").
-    4. **Conflict Resolution:** If multiple rules are activated simultaneously, a conflict resolution strategy is applied to select one rule (or a subset) to "fire" (execute). Common strategies include:
-       * **Priority/Salience:** Rules are assigned explicit priorities.
-       * **Specificity:** Rules with more specific conditions (matching more detailed fact patterns) are preferred.
-       * **Recency:** Rules whose conditions match more recently asserted facts are preferred.
-    5. **Action Execution (Firing):** The actions of the selected rule(s) are executed. These actions can:
-       * Modify facts in the working memory (assert new facts, retract existing facts, update fact attributes).
-       * Perform external actions (e.g., call a function, output a result).
-    6. **Iteration (Inference Cycle):** After actions are executed, the working memory may have changed. The engine re-evaluates all rules against the new set of facts (back to Step 3), potentially activating a new set of rules. This cycle continues until no more rules can be fired or a specific goal state is reached.
-  * ***Why It's Effective:***
-    * Provides a clear and declarative way to represent complex decision logic based on contextual conditions.
-    * Separates the logic (rules) from the control flow (engine), making rules easier to understand, modify, and maintain.
-    * Enables transparent decision-making, as the sequence of fired rules (the "inference trace") can be inspected to understand how a conclusion was reached.
-    * Efficiently handles situations where many rules interact with a changing set of facts.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Problems with a well-defined set of explicit conditional rules that govern behavior or decisions.
-    * Tasks where decisions depend on a dynamic combination of many discrete contextual factors (facts).
-    * Situations requiring transparency and auditability in the decision-making process.
-    * Applications like policy enforcement, business process automation, financial transaction validation, expert systems for diagnosis or configuration, and workflow management.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "RuleEngine_ShippingCost",
-          "strategy": "Rule Engines with Contextual Conditions",
-          "overview": "Determine the shipping cost for an online order based on order total, customer status, destination, and item category using a rule engine.",
-          "steps": [
-            { "step_id": "RE1", "instructions": "Initial Context (Facts): Order_Total=$75, Customer_Status='Gold', Destination='International', Item_Category='Electronics'. Define a set of rules (e.g., R1: IF Order_Total < $50 THEN Base_Shipping=$10; R2: IF Customer_Status='Gold' THEN Discount_Rate=0.10; R3: IF Destination='International' THEN International_Fee=$25; R4: IF Item_Category='Electronics' AND Destination='International' THEN Electronics_Surcharge=$15; R5: Total_Shipping = (Base_Shipping_From_R1_or_Default_0) + International_Fee + Electronics_Surcharge - (Base_Shipping * Discount_Rate_From_R2_or_Default_0))." },
-            { "step_id": "RE2", "instructions": "Simulate the rule engine's first pass: Evaluate R1 against context (Order_Total=$75 -> R1 NOT FIRED). Evaluate R2 (Customer_Status='Gold' -> R2 FIRED, Action: Set Discount_Rate=0.10). Evaluate R3 (Destination='International' -> R3 FIRED, Action: Set International_Fee=$25). Evaluate R4 (Item_Category='Electronics', Destination='International' -> R4 FIRED, Action: Set Electronics_Surcharge=$15). Note activated rules and changes to working memory/context variables." },
-            { "step_id": "RE3", "instructions": "Simulate the next pass (if applicable, or final calculation): Evaluate R5. Context now includes Discount_Rate=0.10, International_Fee=$25, Electronics_Surcharge=$15. (Base_Shipping default is $0 as R1 didn't fire). R5 calculates: Total_Shipping = $0 + $25 + $15 - ($0 * 0.10) = $40. Action: Set Total_Shipping=$40." },
-            { "step_id": "RE4", "instructions": "State the final derived value (Total_Shipping=$40) and list the sequence of rules that fired to reach this conclusion." }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Related to forward-chaining logical deduction. Can be used to implement complex state transitions in Agent-Based Models.
-* **27. Decision Trees / Random Forests (Interpretable Versions)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Tree Structure:** A decision tree is a hierarchical structure consisting of:
-       * **Root Node:** The starting point of the decision process.
-       * **Internal Nodes:** Represent a test or question about a specific feature (contextual factor).
-       * **Branches/Edges:** Emanate from internal nodes, representing the possible outcomes or answers to the test (e.g., "feature X > value Y" vs. "feature X <= value Y", or different categorical values).
-       * **Leaf Nodes:** Terminal nodes that provide a classification (decision) or a regression value (prediction).
-    2. **Traversal for a New Instance:** Given a new instance with specific feature values (the context):
-       * Start at the root node.
-       * At each internal node, evaluate the feature test defined at that node using the instance's corresponding feature value.
-       * Follow the branch that matches the outcome of the test to the next node.
-       * Repeat this process until a leaf node is reached.
-    3. **Output:** The classification or value associated with the reached leaf node is the output (decision/prediction) for the new instance.
-    4. **(For Random Forests - Interpretable Path):** A Random Forest is an ensemble of many decision trees. For interpretation of a single prediction, one might trace the path through one representative tree, or analyze feature importance scores aggregated from all trees. The focus here is on a single, interpretable tree path.
-  * ***Why It's Effective:***
-    * Highly interpretable: The decision-making process is transparent and can be easily visualized and understood as a sequence of simple conditional checks.
-    * Handles both numerical and categorical data.
-    * Implicitly performs feature selection, as more important features tend to appear closer to the root.
-    * Relatively fast for making predictions once the tree is built.
-    * Non-parametric, making no strong assumptions about data distribution.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Classification or regression tasks where the decision logic can be modeled as a hierarchical sequence of conditional checks on input features.
-    * When interpretability and transparency of the decision process are crucial (e.g., explaining a credit decision, medical diagnosis path).
-    * Contextual factors are directly usable as features for the decision nodes.
-    * Problems where non-linear relationships between features and outcome exist but can be approximated by piece-wise constant regions (defined by tree paths).
-    * Examples include medical diagnosis (based on symptoms and test results), credit scoring (based on applicant characteristics), spam filtering (based on email features), and identifying customer segments.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "DT_LoanApproval",
-          "strategy": "Decision Trees (Interpretable Version)",
-          "overview": "Decide whether to approve a small personal loan for Applicant C (Credit Score=620, Income=$40k/year, Loan Amount=$3k, Employed > 1 year=True) by traversing a conceptual decision tree.",
-          "steps": [
-            { "step_id": "DT1", "instructions": "Define the features for Applicant C: Credit_Score=620, Income=40000, Loan_Amount=3000, Employed_Over_1Year=True. Assume a pre-existing decision tree for loan approval. Start at the Root Node of this conceptual tree." },
-            { "step_id": "DT2", "instructions": "Trace the path: At Root Node, Test: 'Credit_Score < 600?'. Applicant C's Credit_Score (620) is NOT < 600. Follow the 'No' branch to Node 2." },
-            { "step_id": "DT3", "instructions": "At Node 2, Test: 'Income < $30,000/year?'. Applicant C's Income ($40k) is NOT < $30k. Follow the 'No' branch to Node 3." },
-            { "step_id": "DT4", "instructions": "At Node 3, Test: 'Employed_Over_1Year == True?'. Applicant C's value is True. Follow the 'Yes' branch to Node 4." },
-            { "step_id": "DT5", "instructions": "At Node 4, Test: 'Loan_Amount > $5,000?'. Applicant C's Loan_Amount ($3k) is NOT > $5k. Follow the 'No' branch to a Leaf Node. Assume this Leaf Node's decision is 'Approve Loan'." },
-            { "step_id": "DT6", "instructions": "State the final decision ('Approve Loan' for Applicant C) and the sequence of feature tests and outcomes that led to this leaf node." }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** A single decision tree is a simple form of a rule-based system. Random Forests build on this for improved accuracy but reduce direct interpretability of a single path.
-* **28. Constraint Satisfaction Problems (CSPs)**
-
-  * ***SEARCH PROCESS (How It Works - using Backtracking Search):***
-    1. **Problem Definition:**
-       * **Variables:** Identify a set of variables `X = {X1, X2, ..., Xn}` that need to be assigned values.
-       * **Domains:** For each variable `Xi`, define its domain `Di` of possible values.
-       * **Constraints:** Define a set of constraints `C = {C1, C2, ..., Cm}` that specify allowable combinations of values for subsets of variables. These constraints must all be satisfied simultaneously.
-    2. **Initialization:** Start with no variables assigned.
-    3. **Recursive Backtracking Search (Conceptual for Planner):**
-       * The Planner would define steps that guide a conceptual backtracking process.
-       * a.  **Select Unassigned Variable (Planner Step):** Instruct Thinker to identify the next variable to assign based on a heuristic (e.g., MRV) or a predefined order.
-       * b.  **Try Value & Check Consistency (Planner Step):** Instruct Thinker to try assigning a value to the selected variable and check consistency with already assigned variables (passed as dependencies).
-       * c.  **Branch or Backtrack (Reviewer/Planner Decision):** Based on Thinker's consistency check:
-         * If consistent and more variables to assign, Reviewer guides Planner to `CONTINUE_DFS_PATH` by creating a new plan to assign the next variable.
-         * If inconsistent, Reviewer guides Planner to `RETRY_STEP_WITH_MODIFICATION` (try a different value for the current variable) or backtrack to a previous variable.
-         * If all variables assigned consistently, a solution is found.
-    4. **Solution/Failure:** Determined by the overall pipeline flow.
-  * ***Why It's Effective:***
-    * Provides a general and systematic framework for solving problems that can be modeled as finding assignments that satisfy a set of interacting rules or conditions.
-    * Can handle complex interactions between constraints.
-    * The pipeline structure (Planner, Thinker, Reviewer) can manage the state and decision points of the backtracking search.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Problems with a clear set of variables, finite (or discretizable) domains for these variables, and explicit constraints that must hold true simultaneously.
-    * Rules or conditions interact heavily, meaning the choice for one variable restricts choices for others.
-    * Tasks involving assignment, scheduling, allocation, or configuration where multiple conditions must be met.
-    * Examples include scheduling (e.g., course timetabling, employee rostering), resource allocation, puzzles (Sudoku, N-Queens, map coloring), hardware configuration, and some types of planning.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "CSP_MapColoring",
-          "strategy": "Constraint Satisfaction Problems (CSPs)",
-          "overview": "Assign colors (Red, Blue, Green) to 3 map regions (A, B, C) such that no two adjacent regions have the same color. Adjacencies: A-B, B-C. Using a pipeline-managed backtracking search.",
-          "steps": [
-            { "step_id": "CSP1", "instructions": "Problem Definition: Variables: Region_A_Color, Region_B_Color, Region_C_Color. Domains: {Red, Blue, Green}. Constraints: Region_A_Color != Region_B_Color; Region_B_Color != Region_C_Color. Current Assignment: {}. Next variable to assign: Region_A_Color. Assign 'Red' to Region_A_Color. Is this consistent? Output: {Assignment: {Region_A_Color: Red}, Consistent: True, Next_Variable_Suggestion: Region_B_Color}." },
-            { "step_id": "CSP2", "instructions": "Current Assignment: {Region_A_Color: Red} (from CSP_MapColoring.CSP1). Next variable to assign: Region_B_Color. Try assigning 'Red' to Region_B_Color. Is this consistent with current assignment and constraints? Output: {Assignment: {Region_A_Color: Red, Region_B_Color: Red}, Consistent: False, Violated_Constraint: Region_A_Color != Region_B_Color}.", "dependencies": ["CSP_MapColoring.CSP1"] },
-            { "step_id": "CSP3", "instructions": "Current Assignment: {Region_A_Color: Red} (from CSP_MapColoring.CSP1). Next variable to assign: Region_B_Color. Try assigning 'Blue' to Region_B_Color. Is this consistent? Output: {Assignment: {Region_A_Color: Red, Region_B_Color: Blue}, Consistent: True, Next_Variable_Suggestion: Region_C_Color}.", "dependencies": ["CSP_MapColoring.CSP1"] }
-            // Further steps would be generated in subsequent iterations based on Reviewer guidance
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Related to logical satisfiability problems (SAT). Can be used as a sub-problem solver in more complex planning systems. The pipeline itself manages the search tree.
-* **29. Game Theory (e.g., Minimax for Zero-Sum Games)**
-
-  * ***SEARCH PROCESS (How It Works - Minimax, adapted for pipeline):***
-    1. **Game Representation:** Define players, moves, rules, terminal states, utility function.
-    2. **Game Tree Exploration (Planner-Guided):** The Planner defines steps to explore parts of the game tree.
-       * **Planner Step (e.g., Evaluate Current Player's Moves):** "Current game state is S. Current player is MAX. Identify all possible moves for MAX. For each move M, leading to state S', what is the estimated utility or next state?"
-       * **Planner Step (Simulate Opponent's Best Response - shallow):** "Given MAX made move M leading to S' (MIN's turn). What is MIN's best counter-move from S' (look ahead 1 ply) and the resulting state S''?"
-    3. **Recursive Evaluation (Managed by Pipeline Iterations):**
-       * The depth of the Minimax search is built up over multiple pipeline iterations.
-       * The Reviewer assesses the current evaluation and can guide `DEEPEN` on a promising branch (e.g., "Explore further from state S'' assuming player X does Y").
-    4. **Optimal Move Selection:** After sufficient exploration (determined by Reviewer or iteration limit), the Synthesizer or a final Reviewer assessment determines the best initial move based on the explored tree.
-  * ***Why It's Effective:***
-    * Allows for strategic lookahead, anticipating opponent's counter-moves, managed iteratively.
-    * The pipeline structure can manage the state of the game tree exploration.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Two-player adversarial games with perfect information.
-    * Tasks requiring strategic decision-making where one needs to anticipate an opponent's or competitor's optimal reactions.
-    * The pipeline can manage the iterative deepening of the search.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "Minimax_TicTacToe",
-          "strategy": "Game Theory (Minimax)",
-          "overview": "Player X (MAX) to make an optimal move in Tic-Tac-Toe. Board: XOX / O_O / X_ _. Utility: +1 for X win, -1 for O win, 0 for draw. Current depth of analysis: 0.",
-          "steps": [
-            { "step_id": "MM1", "instructions": "Current State: XOX / O_O / X_ _. It's X's (MAX) turn. List all valid moves for X and the resulting board states. For each resulting state, provide a heuristic evaluation (e.g., +0.5 if X has two in a row, -0.5 if O blocks, 0 otherwise) if it's not a terminal state." },
-            { "step_id": "MM2", "instructions": "From MM1, take the state resulting from X playing at (1,1) (center). Board: XOX / OXO / X_ _. It's O's (MIN) turn. List all valid moves for O from this state. For each, if it's a terminal state, give its utility (from X's perspective). If not terminal, give a heuristic evaluation.", "dependencies": ["Minimax_TicTacToe.MM1"] }
-            // Reviewer would then pick a path to deepen or broaden the search.
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Related to search algorithms. The pipeline manages the search depth and breadth.
-* **30. Agent-Based Modeling (Conceptual Trace)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Agents:**
-       * Identify the types of autonomous entities (agents) in the system.
-       * Define the state variables for each agent type (attributes that change over time).
-       * Define the behavioral rules for each agent type: how they perceive their environment (and other agents), make decisions, and act. These rules are typically local, based on the agent's current state and local context.
-    2. **Define Environment:**
-       * Specify the space or context in which agents exist and interact (e.g., a grid, a network, a continuous space).
-       * Define any environmental properties or resources that agents can interact with or that change over time.
-    3. **Define Interactions:** Specify how agents interact with each other and with the environment (e.g., direct communication, indirect interaction via environmental changes like pheromones, competition for resources).
-    4. **Initialization (Planner Step):** Instruct Thinker to set up the initial state of agents and environment.
-    5. **Simulation Loop (Planner Steps over Pipeline Iterations):**
-       * **Planner Step (One Time Step):** "Given current agent states and environment [from dependency], simulate one time step: agents perceive, decide, act. Output new agent/environment states."
-       * The Reviewer observes emergent patterns and guides further simulation steps (e.g., "Run for 10 more steps," "Change agent rule X and re-simulate").
-    6. **Observation & Analysis:** Done by Thinker (reporting state) and Reviewer (identifying patterns).
-  * ***Why It's Effective:***
-    * Allows modeling of complex systems where global behavior emerges from local interactions.
-    * The pipeline can manage the step-by-step simulation and allow for intervention/parameter changes.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Understanding complex adaptive systems where macroscopic patterns arise from microscopic interactions (emergence).
-    * Rules are applied by individual entities (agents) simultaneously or in sequence, and these rules and agent actions interact through a shared environment or direct connections.
-    * Exploring the impact of individual heterogeneity and local interactions on system-level outcomes.
-    * Examples: modeling traffic flow, spread of epidemics or information, market dynamics, social behavior.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "ABM_PedestrianFlow",
-          "strategy": "Agent-Based Modeling (Conceptual Trace)",
-          "overview": "Model two 'pedestrian' agents (P1, P2) approaching each other in a narrow hallway to observe collision avoidance. Rule: If another agent is directly ahead and close (e.g., <= 2 units), and space is available to the right, move slightly right; otherwise, continue forward.",
-          "steps": [
-            { "step_id": "ABM1", "instructions": "Initialize Agents: P1 (starts at x=0, y=5, moves towards y=0), P2 (starts at x=0, y=1, moves towards y=5). State: (x,y) position. Hallway: x can be 0 or 1. Rule: As in overview. Environment: Grid. Output initial agent positions." },
-            { "step_id": "ABM2", "instructions": "Given agent positions from ABM_PedestrianFlow.ABM1, simulate Time_Step 1: P1 perceives, decides, acts. P2 perceives, decides, acts. Record new positions and any notable interactions or rule firings.", "dependencies": ["ABM_PedestrianFlow.ABM1"] },
-            { "step_id": "ABM3", "instructions": "Given agent positions from ABM_PedestrianFlow.ABM2, simulate Time_Step 2. Record new positions and interactions.", "dependencies": ["ABM_PedestrianFlow.ABM2"] }
-            // Reviewer would assess if collision was avoided, if more steps are needed, etc.
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Can incorporate rule engines for agent decision logic. Game theory concepts can define agent interaction strategies.
-* **31. Knowledge Graphs and Semantic Networks + Traversal Algorithms**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Knowledge Representation:** Information is structured as a graph (nodes as entities/concepts, edges as relationships).
-    2. **Query Formulation (Planner):** The Planner defines a query or information need.
-    3. **Traversal/Search Strategy Selection (Planner Step):** Planner instructs Thinker on how to traverse.
-       * "Starting from node 'Paris', find all nodes connected by 'isCapitalOf' relationship."
-       * "Find the shortest path between 'Entity A' and 'Entity B' using relationship types 'X' and 'Y'."
-    4. **Execution of Traversal (Thinker):** Thinker performs the specified traversal on a conceptual or provided KG snippet.
-    5. **Result Generation & Interpretation:** Thinker outputs found nodes/paths. Reviewer assesses relevance.
-  * ***Why It's Effective:***
-    * Flexible representation of complex knowledge.
-    * Planner can define specific, bounded graph search tasks for the Thinker.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Tasks requiring understanding of complex relationships between numerous concepts or entities.
-    * Question answering from structured knowledge.
-    * Semantic search, recommendation systems, data integration.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "KG_MovieRecommender",
-          "strategy": "Knowledge Graphs + Traversal",
-          "overview": "Using a conceptual knowledge graph about movies, actors, and genres, find movies similar to 'Movie A' (Sci-Fi, Director D, Actor X) for a user who likes Actor X.",
-          "steps": [
-            { "step_id": "KG1", "instructions": "Conceptual KG Snippet: (Movie_A, hasGenre, Sci-Fi), (Movie_A, directedBy, Director_D), (Movie_A, hasActor, Actor_X), (Movie_B, hasGenre, Sci-Fi), (Movie_B, hasActor, Actor_X), (Movie_C, hasGenre, Comedy), (Movie_C, hasActor, Actor_X), (Movie_D, hasGenre, Sci-Fi), (Movie_D, hasActor, Actor_Y). User likes Actor_X. Task: Identify movies connected to Actor_X via 'hasActor'." },
-            { "step_id": "KG2", "instructions": "From the KG snippet (KG1) and Movie_A's details, identify movies that share the genre 'Sci-Fi' with Movie_A.", "dependencies": ["KG_MovieRecommender.KG1"] },
-            { "step_id": "KG3", "instructions": "Based on results from KG1 and KG2, synthesize a list of recommended movies for the user. Prioritize movies sharing the actor, then genre. List up to 2 recommendations with justification.", "dependencies": ["KG_MovieRecommender.KG1", "KG_MovieRecommender.KG2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Foundational for many AI systems dealing with structured knowledge.
-* **32. Formal Logic and Automated Theorem Proving (Simplified)**
-
-  * ***SEARCH PROCESS (How It Works - Simplified for Pipeline):***
-    1. **Knowledge Base Formulation (Planner Step):** "Given facts F1, F2 and rule R1 (e.g., A & B -> C), formalize them."
-    2. **Goal/Hypothesis Formulation (Planner Step):** "The goal is to prove/disprove statement G."
-    3. **Inference Rule Application (Thinker Step):**
-       * Planner: "Given axioms [from dependency] and goal G, apply one step of Modus Ponens (or another specified rule) to derive new facts. Can G be derived directly?"
-       * Thinker executes this single inference step.
-    4. **Proof Construction (Iterative via Pipeline):** The Reviewer examines if the goal is met or if more inference steps are needed, guiding the Planner for the next iteration.
-  * ***Why It's Effective:***
-    * Allows rigorous, verifiable reasoning, one step at a time.
-    * The pipeline manages the proof search process.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Problems requiring verifiable reasoning from axioms.
-    * Verification tasks, logical queries.
-    * The Planner can break down the proof search into manageable inference steps.
-  * ***Example Plan Step (How to Use - Simplified Modus Ponens):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "Logic_Socrates",
-          "strategy": "Formal Logic (Simplified Deduction)",
-          "overview": "Given Axiom 1: 'All men are mortal' and Axiom 2: 'Socrates is a man', prove 'Socrates is mortal'.",
-          "steps": [
-            { "step_id": "Logic1", "instructions": "Formalize Knowledge Base: Axiom 1: Forall X (Man(X) -> Mortal(X)). Axiom 2: Man(Socrates). Goal: Mortal(Socrates). Apply Universal Instantiation to Axiom 1 with X=Socrates. Output the resulting instantiated formula." },
-            { "step_id": "Logic2", "instructions": "Given Axiom 2: Man(Socrates) and the instantiated formula from Logic_Socrates.Logic1 (Man(Socrates) -> Mortal(Socrates)). Apply Modus Ponens. What is the derived conclusion? Is it the goal 'Mortal(Socrates)'?", "dependencies": ["Logic_Socrates.Logic1"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Underpins many AI reasoning systems.
-* **33. Conceptual Dependency Theory or Frame Semantics (Abstract Representation)**
-
-  * ***SEARCH PROCESS (How It Works - Mapping to Structures):***
-    **A. Conceptual Dependency (CD) Theory Approach (Planner-guided):**
-    1. **Identify Primitive Act (Planner Step):** "Analyze sentence S. What is the core primitive action (e.g., PTRANS, ATRANS)?"
-    2. **Identify & Fill Conceptual Roles (Planner Step):** "For primitive act P from [dependency], identify and fill its conceptual roles (Actor, Object, To, From) from sentence S."
-       **B. Frame Semantics Approach (Planner-guided):**
-    3. **Evoke Frame (Planner Step):** "Analyze sentence S. What semantic frame (e.g., COMMERCE_BUY) is evoked by keyword K?"
-    4. **Identify & Fill Frame Elements (Planner Step):** "For frame F from [dependency], identify and fill its frame elements (Buyer, Seller, Goods) from sentence S."
-  * ***Why It's Effective:***
-    * Creates language-independent or structured semantic representations.
-    * Planner breaks down the complex NLP task into manageable semantic interpretation steps.
-  * ***Ideal Problem Factors / Characteristics:***
-    * Natural language understanding requiring deep semantic interpretation.
-    * Information extraction, Q&A requiring understanding of underlying meaning.
-  * ***Example Plan Step (How to Use - Frame Semantics example):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "FrameSem_PurchaseEvent",
-          "strategy": "Frame Semantics (Abstract Representation)",
-          "overview": "Represent the meaning of the sentence 'The customer bought a laptop from the online store for $800.' using Frame Semantics.",
-          "steps": [
-            { "step_id": "FS1", "instructions": "Input Sentence: 'The customer bought a laptop from the online store for $800.' Identify the main verb or action word that evokes a semantic frame. What frame is it (e.g., COMMERCE_BUY, TRANSACTION)?" },
-            { "step_id": "FS2", "instructions": "Given the frame identified in FrameSem_PurchaseEvent.FS1 (e.g., COMMERCE_BUY), list its typical frame elements (e.g., Buyer, Seller, Goods, Money).", "dependencies": ["FrameSem_PurchaseEvent.FS1"] },
-            { "step_id": "FS3", "instructions": "Map constituents from the input sentence ('The customer bought a laptop from the online store for $800.') to the frame elements identified in FrameSem_PurchaseEvent.FS2. Output the filled frame structure.", "dependencies": ["FrameSem_PurchaseEvent.FS2"] }
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Related to semantic role labeling in NLP.
-* **34. Agent-Based Modeling (Conceptual Trace - Pipeline Managed)**
-
-  * ***SEARCH PROCESS (How It Works):***
-    1. **Define Agents & Environment (Planner Step):** Planner instructs Thinker to define agent types (with states and rules) and the environment. This includes initial conditions.
-    2. **Simulation Step (Planner Step for Thinker):** Planner instructs Thinker: "Given current agent states and environment [from dependency], simulate one time step: agents perceive, decide according to their rules, and act. Output new agent/environment states and any emergent global patterns observed."
-    3. **Review & Iterate (Reviewer to Planner):** The Reviewer examines the Thinker's output (new states, observed patterns). Based on this, the Reviewer guides the Planner for the next iteration:
-       * `CONTINUE_DFS_PATH`: "Run for N more steps with current rules."
-       * `DEEPEN`: "Focus on agent type X, what if its rule Y was changed to Z? Re-simulate from step S."
-       * `BROADEN`: "The current model isn't showing interesting behavior. Try adding agent type Q with rule R."
-       * `HALT_SUFFICIENT`: "The simulation has clearly demonstrated phenomenon P."
-    4. **Observation & Analysis:** Done by Thinker (reporting state changes and local observations) and critically by the Reviewer (identifying emergent global patterns, assessing if the simulation is answering the core question, and guiding further simulation).
-  * ***Why It's Effective:***
-    * Allows for the iterative exploration and refinement of agent-based models, where macroscopic, system-level patterns emerge from local agent interactions.
-    * The pipeline (Planner, Thinker, Reviewer) manages the step-by-step simulation, allowing for intervention, parameter changes, rule modifications, and focused observation of emergent behaviors.
-    * Facilitates understanding of how changes in agent rules or environmental conditions impact the overall system dynamics over time.
-  * ***Global View & Pipeline Integration:***
-    * **How it gives a global view:** Simulates how macroscopic, system-level patterns emerge from local agent interactions. The iterative nature allows for observing the evolution of these global patterns.
-    * **Pipeline Fit:** Planner: "Define agent types and rules for [problem]," "Initialize a small scenario," Thinker: "Trace N steps of the simulation," Reviewer: "What global patterns are emerging? Do we need more agents/steps/different rules?"
-  * ***Ideal Problem Factors / Characteristics:***
-    * Understanding complex adaptive systems where macroscopic patterns arise from microscopic interactions (emergence), and where iterative exploration of these interactions is key.
-    * Problems where the impact of different agent rules, initial conditions, or environmental changes needs to be explored step-by-step.
-    * Situations where the goal is to observe and understand emergent behavior rather than predict a single outcome.
-    * Suitable for conceptual modeling where the exact parameters might be unknown, but the interaction logic can be defined and explored.
-  * ***Example Plan Step (How to Use):***
-    ```json
-    {
-      "exploration_plans": [
-        {
-          "plan_id": "ABM_Pipeline_Traffic",
-          "strategy": "Agent-Based Modeling (Conceptual Trace - Pipeline Managed)",
-          "overview": "Model basic traffic flow with two agent types (Car, TrafficLight) to observe queue formation. Car rule: move forward if space, stop if light red or car ahead. Light rule: cycle Red-Green.",
-          "steps": [
-            { "step_id": "ABM_P1_Init", "instructions": "Define Agents: Car (state: position, speed; rule: if light_is_green AND no_car_ahead, speed=1; else speed=0. Move by speed). TrafficLight (state: color; rule: cycle Red(3 steps)-Green(3 steps)). Environment: 1D road (10 cells). Initialize 3 Cars at cells 0,1,2 (speed 0). Light at cell 5 (Red, 1st step of Red). Output initial agent and environment state." },
-            { "step_id": "ABM_P2_Step1", "instructions": "Given initial state from ABM_Pipeline_Traffic.ABM_P1_Init, simulate 1 time step. All agents perceive, decide, act. Output new agent/environment state and any observed car movements or light changes.", "dependencies": ["ABM_Pipeline_Traffic.ABM_P1_Init"] },
-            { "step_id": "ABM_P3_Step2", "instructions": "Given state from ABM_Pipeline_Traffic.ABM_P2_Step1, simulate 1 time step. Output new agent/environment state and any observed car movements or light changes.", "dependencies": ["ABM_Pipeline_Traffic.ABM_P2_Step1"] }
-            // Reviewer would then assess queue formation, light cycling, and guide further steps or modifications.
-          ]
-        }
-      ]
-    }
-    ```
-  * ***Alignment (Optional):*** Complements Systems Thinking by providing a dynamic simulation method. Can use Rule Engines for complex agent decision logic.
+import functools
+import hashlib
+import json
+import os
+import re
+import textwrap
+from importlib import resources
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+def _compact(text: str) -> str:
+    """Drops indentation, trailing whitespace and surplus blank lines the LLM does not need."""
+    text = textwrap.dedent(text)
+    # Indentation inside fenced JSON examples carries no meaning for the model.
+    text = re.sub(
+        r"```.*?```",
+        lambda m: re.sub(r"^[ \t]+", "", m.group(0), flags=re.MULTILINE),
+        text,
+        flags=re.DOTALL,
+    )
+    text = re.sub(r"^(\s*)\*   ", r"\1- ", text, flags=re.MULTILINE)
+    text = re.sub(r"^(\s*\d+\.) {2,}", r"\1 ", text, flags=re.MULTILINE)
+    text = re.sub(r"[ \t]+\n", "\n", text)
+    return re.sub(r"\n{3,}", "\n\n", text)
+
+def _read_strategies_resource() -> str:
+    return resources.files(__package__ or "app").joinpath("prompts").joinpath("exploration_strategies.md").read_text(encoding="utf-8")
+
+# Titles are read straight off the authored source so that importing the module (the
+# response schemas need them) does not parse or render the catalog itself; the text is
+# not kept.
+STRATEGY_NAMES = tuple(re.findall(r"^[ \t]*\* \*\*\d+\. (.+?)\*\*[ \t]*$", _read_strategies_resource(), re.MULTILINE))
+
+@functools.cache
+def get_exploration_strategies() -> str:
+    return _compact(_read_strategies_resource())
+
+@dataclass(frozen=True)
+class Strategy:
+    number: int
+    name: str
+    category: str
+    tag: str
+    body: str
+    alignment: str
+    example_steps: Tuple[str, ...]
+    use_when: str
+
+_STRATEGY_HEADER_RE = re.compile(r"^\* \*\*(\d+)\. (.+?)\*\*$", re.MULTILINE)
+_CATEGORY_HEADER_RE = re.compile(r"^\*\*[IVX]+\. .+\*\*$", re.MULTILINE)
+_CATEGORY_TAGS = {"I": "problem_solving", "II": "creative", "III": "qa", "IV": "contextual"}
+_USE_WHEN_RE = re.compile(r"\*\*\*Ideal Problem Factors[^\n]*\n\s*\* (.+)")
+_EXAMPLE_RE = re.compile(r"^ *\* \*\*\*Example Plan Step[^\n]*\n *```json\n(.*?)```\n", re.MULTILINE | re.DOTALL)
+
+# Openers every "Ideal Problem Factors" bullet repeats; the index line keeps only what follows.
+_USE_WHEN_BOILERPLATE_RE = re.compile(
+    r"^(?:The task (?:involves|requires|is to)|Need to|Tasks? requiring|"
+    r"Problems? (?:involving|requiring|where|with)|Understanding)\s+"
+)
+
+def _summarize_use_when(bullet: str) -> str:
+    text = re.sub(r"^[A-Z][\w ]*: ", "", re.sub(r"\*+", "", bullet))
+    text = _USE_WHEN_BOILERPLATE_RE.sub("", text).rstrip(".")
+    return text[:1].upper() + text[1:]
+
+def _parse_example(example_json: str) -> dict:
+    return json.loads(re.sub(r"^\s*//.*$", "", example_json, flags=re.MULTILINE))
+
+def _parse_strategies(catalog: str) -> Tuple[Dict[str, Strategy], dict]:
+    """
+    Splits the authored catalog into one `Strategy` per entry, keyed by its title. Each worked
+    JSON example is reduced to its ordered step instructions; the first one is returned whole
+    so it can be shown once as the canonical plan shape. `use_when` is the first "Ideal Problem
+    Factors" bullet, used as the one-line summary in `get_strategy_index`.
+    """
+    strategies: Dict[str, Strategy] = {}
+    canonical_example: dict = {}
+    category = ""
+    blocks = re.split(r"^(?=\* \*\*\d+\. )|^(?=\*\*[IVX]+\. )", catalog, flags=re.MULTILINE)
+    for block in blocks:
+        block = block.strip()
+        if block.endswith("---"):
+            block = block[:-3].rstrip()
+        if _CATEGORY_HEADER_RE.match(block):
+            category = block
+            continue
+        header = _STRATEGY_HEADER_RE.match(block)
+        if not header:
+            continue
+
+        example = _EXAMPLE_RE.search(block)
+        plan = _parse_example(example.group(1))["exploration_plans"][0]
+        canonical_example = canonical_example or {**plan, "strategy": header.group(2)}
+
+        step_numbers = {f"{plan['plan_id']}.{s['step_id']}": i for i, s in enumerate(plan["steps"], 1)}
+        example_steps = []
+        for step in plan["steps"]:
+            after = [str(step_numbers[d]) for d in step.get("dependencies", []) if d in step_numbers]
+            prefix = f"(after {', '.join(after)}) " if after else ""
+            example_steps.append(f"{prefix}{step['instructions']}")
+
+        body = block[:example.start()].rstrip()
+        strategies[header.group(2)] = Strategy(
+            number=int(header.group(1)),
+            name=header.group(2),
+            category=category,
+            tag=_CATEGORY_TAGS[category[2:].split(".", 1)[0]],
+            body=body,
+            alignment=block[example.end():].strip(),
+            example_steps=tuple(example_steps),
+            use_when=_summarize_use_when(_USE_WHEN_RE.search(body).group(1)),
+        )
+    return strategies, canonical_example
+
+@functools.cache
+def get_strategies() -> Dict[str, Strategy]:
+    return _parse_strategies(get_exploration_strategies())[0]
+
+@functools.cache
+def _canonical_example() -> str:
+    canonical_plan = _parse_strategies(get_exploration_strategies())[1]
+    return f"""Every strategy below lists only its example step instructions; they fill the same plan shape as this fully worked example:
+```json
+{json.dumps({"exploration_plans": [canonical_plan]})}
+```"""
+
+# How much of each strategy the Planner is shown: "full" entries, "terse" one-liners for the
+# well-known techniques the model already knows by name, or "name_only". Switch away from
+# "full" only after comparing plan quality on a set of representative tasks.
+STRATEGY_DETAIL = "full"
+
+# This repo's own composite strategies; model priors are weak here, so "terse" keeps them whole.
+_ALWAYS_FULL_STRATEGIES = frozenset({
+    "Constructive Reasoning / Inferential Path Finding",
+    "Multi-Perspective Synthesis for Novel Questions",
+    "Quantitative Modeling & Step-wise Derivation",
+    "Agent-Based Modeling (Conceptual Trace - Pipeline Managed)",
+})
+
+def _render_strategy(strategy: Strategy, detail: str = "full") -> str:
+    if detail == "name_only":
+        return f"{strategy.number}. {strategy.name}"
+    if detail == "terse" and strategy.name not in _ALWAYS_FULL_STRATEGIES:
+        return f"{strategy.number}. {strategy.name} - Use when: {strategy.use_when}."
+    steps = " ".join(f"[{i}] {text}" for i, text in enumerate(strategy.example_steps, 1))
+    return f"{strategy.body}\n  * ***Example steps:*** {steps}\n  {strategy.alignment}"
+
+@functools.cache
+def _render_catalog(names: FrozenSet[str] = frozenset(STRATEGY_NAMES), detail: str = "full") -> str:
+    parts = []
+    category = None
+    for strategy in get_strategies().values():
+        if strategy.name not in names:
+            continue
+        if strategy.category != category:
+            category = strategy.category
+            parts.append(category)
+        parts.append(_render_strategy(strategy, detail))
+    # The worked plan shape only accompanies entries that list example steps.
+    if detail == "full" or (detail == "terse" and names & _ALWAYS_FULL_STRATEGIES):
+        parts.insert(0, _canonical_example())
+    return ("\n" if detail == "name_only" else "\n\n").join(parts)
+
+# Always offered, whatever the task looks like, so the Planner keeps room for diverse plans.
+_CORE_STRATEGIES = frozenset({
+    "First Principles Thinking",
+    "Assumption Challenging",
+    "Divide & Conquer",
+    "Multi-Perspective Synthesis for Novel Questions",
+})
+
+_STRATEGY_KEYWORDS: List[Tuple[str, Tuple[str, ...]]] = [
+    (r"\b(why|causes?|caused|root|fail\w*|bugs?|broken|declin\w*|diagnos\w*|drop(ped)?|incidents?|outages?)\b",
+     ("Root Cause Analysis (RCA)", "Hypothesis Testing (Conceptual)", "Systems Thinking", "Strategic Backtracking / Backcasting")),
+    (r"\b(compare|comparison|vs\.?|versus|evaluate|better|choose|choice|trade-?offs?|pros|cons|alternatives?)\b",
+     ("Comparative Analysis", "Pro/Con Evaluation (Trade-off Analysis)", "Decision Trees / Random Forests (Interpretable Versions)", "Dialectical Inquiry / Devil's Advocacy")),
+    (r"\b(ideas?|brainstorm\w*|creative|invent\w*|novel|innovat\w*|design\w*|improve\w*)\b",
+     ("SCAMPER", "Mind Mapping (Conceptual Structure Generation)", "Analogical Thinking", "Thought Experimentation & Extrapolation")),
+    (r"\b(calculat\w*|probabilit\w*|estimat\w*|how (many|much)|percent\w*|costs?|optimi[sz]\w*|maximi[sz]\w*|minimi[sz]\w*|\d+)\b",
+     ("Quantitative Modeling & Step-wise Derivation", "Dynamic Programming Optimization (Conceptual)", "Constraint Analysis", "Heuristic Search (Informed Search)")),
+    (r"\b(plan|roadmap|steps? to|how (do|can|should) (i|we)|achieve|goals?|path)\b",
+     ("Pathfinding Strategy Mapping", "Strategic Backtracking / Backcasting", "Heuristic Search (Informed Search)", "Recursive Refinement")),
+    (r"\b(puzzles?|schedul\w*|constraints?|allocat\w*|assign\w*|satisf\w*|rules?)\b",
+     ("Constraint Satisfaction Problems (CSPs)", "Constraint Analysis", "Rule Engines with Contextual Conditions", "Formal Logic and Automated Theorem Proving (Simplified)")),
+    (r"\b(future|what if|scenarios?|predict\w*|forecast\w*|impacts?|would happen)\b",
+     ("Scenario Modeling (Conceptual & Exploratory)", "Thought Experimentation & Extrapolation", "Systems Thinking", "Agent-Based Modeling (Conceptual Trace)")),
+    (r"\b(prove|proof|logic\w*|deduc\w*|infer\w*|implies|valid\w*)\b",
+     ("Formal Logic and Automated Theorem Proving (Simplified)", "Constructive Reasoning / Inferential Path Finding", "Hypothesis Testing (Conceptual)")),
+    (r"\b(networks?|relationships?|connect\w*|graphs?|dependenc\w*|ecosystems?|stakeholders?)\b",
+     ("Graph Mapping & Network Insight", "Knowledge Graphs and Semantic Networks + Traversal Algorithms", "Systems Thinking")),
+    (r"\b(compet\w*|opponents?|games?|negotiat\w*|adversar\w*)\b",
+     ("Game Theory (e.g., Minimax for Zero-Sum Games)", "Dialectical Inquiry / Devil's Advocacy", "Scenario Modeling (Conceptual & Exploratory)")),
+    (r"\b(meanings?|means|interpret\w*|symbol\w*|metaphors?|semantic\w*|context\w*)\b",
+     ("Conceptual Dependency Theory or Frame Semantics (Abstract Representation)", "Case-Based Reasoning (CBR)", "Knowledge Graphs and Semantic Networks + Traversal Algorithms")),
+    (r"\b(similar|precedents?|past cases?|histor\w*|examples?)\b",
+     ("Case-Based Reasoning (CBR)", "Analogical Thinking")),
+    (r"\b(simulat\w*|agents?|emergen\w*|crowds?|traffic|populations?)\b",
+     ("Agent-Based Modeling (Conceptual Trace)", "Agent-Based Modeling (Conceptual Trace - Pipeline Managed)", "Systems Thinking")),
+    (r"\b(refine\w*|iterat\w*|drafts?|polish\w*|rewrite\w*)\b",
+     ("Recursive Refinement", "Assumption Challenging")),
+]
+_STRATEGY_KEYWORD_RES = [(re.compile(pattern, re.IGNORECASE), names) for pattern, names in _STRATEGY_KEYWORDS]
+
+def select_strategies(parent_task: str) -> FrozenSet[str]:
+    """
+    Keyword-scores `parent_task` against broad task types and returns the strategies worth
+    offering the Planner. Falls back to the whole catalog when no task type is recognized.
+    """
+    selected = set()
+    for pattern, names in _STRATEGY_KEYWORD_RES:
+        if pattern.search(parent_task):
+            selected.update(names)
+    if not selected:
+        return frozenset(STRATEGY_NAMES)
+    return frozenset(selected | _CORE_STRATEGIES)
+
+@functools.cache
+def build_strategy_catalog(names: FrozenSet[str] = frozenset(STRATEGY_NAMES), detail: str = "full") -> str:
+    return f"""
+## Exploration Strategies and Algorithms
+<EXPLORATION_STRATEGIES>
+{_render_catalog(names, detail)}
+</EXPLORATION_STRATEGIES>
+"""
 
+def build_strategies_section(names: Iterable[str]) -> str:
+    """Catalog section restricted to `names` at STRATEGY_DETAIL; unknown names are ignored."""
+    return build_strategy_catalog(frozenset(names) & frozenset(STRATEGY_NAMES), STRATEGY_DETAIL)
+
+@functools.cache
+def get_strategy_index() -> str:
+    """Title plus a one-line "when to use" per strategy, for the strategy-selection call."""
+    return "\n".join(f"- {s.name}: {s.use_when}" for s in get_strategies().values())
+
+@functools.cache
+def build_strategy_index_catalog() -> str:
+    """
+    Index-only stand-in for the catalog, for DEEPEN/RETRY planning: those plans extend a step
+    whose strategy is already chosen, so titles and one-liners are enough to name one.
+    """
+    return f"""
+## Exploration Strategies and Algorithms
+<EXPLORATION_STRATEGIES>
+{get_strategy_index()}
+</EXPLORATION_STRATEGIES>
+"""
+
+def filter_strategies(category: Optional[str] = None, exclude: Iterable[str] = ()) -> FrozenSet[str]:
+    """
+    Strategy titles in `category` (a tag such as "creative"; all categories when None),
+    minus the `exclude`d ones, e.g. those a BROADEN review ruled out.
     """
+    excluded = frozenset(exclude)
+    return frozenset(
+        s.name for s in get_strategies().values()
+        if (category is None or s.tag == category) and s.name not in excluded
+    )
 
-PLANNER_INSTRUCTIONS = f"""
-## Primary Mission: Breadth-First Global Mapping
-Your primary responsibility is to create a broad, breadth-first set of exploration plans that collectively map the solution space for the `parent_task`. Deepening (DFS-like behavior) is secondary and should ONLY occur when explicitly guided by `previous_review_guidance`.
+def offered_strategies(chosen: Iterable[str]) -> FrozenSet[str]:
+    """Strategies to offer the Planner for an explicit choice: the known `chosen` ones plus the core set."""
+    return (frozenset(chosen) & frozenset(STRATEGY_NAMES)) | _CORE_STRATEGIES
 
+def get_strategy_catalog() -> str:
+    """
+    The full catalog, shared across agents as one byte-identical prefix so a single server-side
+    cached content object can serve every call that needs it. Each allow-list from
+    `select_strategies` renders its own stable prefix as well.
+    """
+    return build_strategy_catalog(detail=STRATEGY_DETAIL)
+
+# Rules shared verbatim by several agents, so they are worded (and edited) in one place.
+_SCHEMA_ENFORCED_NOTE = "The response schema is enforced by the API, so only its content rules are listed here:"
+_NO_META_COMMENTARY_RULE = (
+    "No meta-commentary about your role, the process or its iterations "
+    '(e.g. "As the ThinkerAgent...", "Based on the provided history...", '
+    '"The iterative process revealed...", "Synthesizing the findings...").'
+)
+
+@functools.cache
+def get_strategy_selector_instructions() -> str:
+    return f"""
 ## Goal/Task
-Create a strategic Exploration Plan to address the provided `parent_task`.
-*   **Default Behavior (No specific guidance or BROADEN guidance):** Generate multiple distinct exploration plans (up to 10) that cover different facets of the `parent_task` using diverse strategies. This is a Breadth-First Search (BFS) approach. Aim for 3-4 diverse plans.
-*   **Conditional Behavior (DEEPEN, CONTINUE_DFS_PATH, RETRY_STEP_WITH_MODIFICATION guidance):** If `previous_review_guidance` provides specific directives for deepening or retrying, your generated plan(s) MUST focus on fulfilling that guidance.
-
-## Meta-Cognitive Instructions
-
-1.  **Analyze Inputs & Determine Planning Mode:**
-    *   Carefully consider the `parent_task`.
-    *   Examine `previous_review_guidance` (if provided). Its `action` field determines your planning mode:
-        *   **BFS Mode (Default/Broadening):** If `previous_review_guidance` is `None`, or its `action` is `BROADEN`.
-            *   **Objective:** Generate a diverse set of initial plans (typically 3-5, max 10) to achieve broad coverage of the `parent_task`.
-            *   **Breadth-First Generation Algorithm:**
-                1.  Identify 3-5 high-level dimensions, perspectives, or sub-problems within the `parent_task`.
-                2.  For each dimension, create one `ExplorationPlan`.
-                3.  Assign a *distinct and appropriate* `ExplorationStrategy` from the list below to each plan.
-                4.  Ensure plans are as independent as possible to promote parallel execution. Minimize cross-plan dependencies.
-                5.  If `previous_review_guidance.action == "BROADEN"`, ensure new plans use strategies different from `excluded_strategies` and consider `suggested_strategy` if available.
-        *   **DFS Mode (Targeted/Deepening):** If `previous_review_guidance.action` is `DEEPEN`, `CONTINUE_DFS_PATH`, or `RETRY_STEP_WITH_MODIFICATION`.
-            *   **Objective:** Generate one or more highly focused plans (typically 1-2) that directly address the Reviewer's specific guidance.
-            *   **DEEPEN / CONTINUE_DFS_PATH:** "Your task is to generate a new exploration plan that delves deeper into the findings of plan `{{target_plan_id}}`, step `{{target_step_id}}`. The previous output was: `{{snippet_of_target_step_output}}`. Focus on exploring/validating/expanding on: `{{refinement_details}}`. The overall parent task is still `{{parent_task}}`. If continuing a DFS path, the path so far is `{{dfs_path_summary}}`."
-                *   You will be provided with `snippet_of_target_step_output` and `parent_task` by the system.
-                *   Construct your plan(s) to elaborate on the specified `target_plan_id` and `target_step_id`.
-            *   **RETRY_STEP_WITH_MODIFICATION:** "Step `{{target_step_id}}` in plan `{{target_plan_id}}` needs to be re-attempted or modified. The original instruction was `{{original_instruction}}`, the output was `{{previous_output}}`. The Reviewer suggests focusing on/modifying: `{{refinement_details}}`. Create a plan step to address this."
-                *   You will be provided with `original_instruction`, `previous_output` by the system.
-                *   Create a plan focused on re-addressing this specific step.
+Pick the exploration strategies best suited to the `parent_task`. A Planner will then build 3-5 diverse exploration plans, each applying one of them.
+
+## Output Instructions
+{_SCHEMA_ENFORCED_NOTE}
+* 4-8 exact titles from `STRATEGY_INDEX`, most suitable first.
+* Prefer strategies that attack the task from different angles over near-synonyms.
+
+<STRATEGY_INDEX>
+{get_strategy_index()}
+</STRATEGY_INDEX>
+"""
 
+SECTION_HEADERS = ("## Goal/Task", "## Meta-Cognitive Instructions", "## Output Instructions", "## Note")
+
+def render_instruction(*, goal: str, meta: str, output: str, notes: str = "", mission: str = "") -> str:
+    """
+    Assembles an agent prompt from its sections under the canonical SECTION_HEADERS, in order.
+    `mission` is an optional self-headed section placed first; empty sections are left out.
+    """
+    sections = [mission] if mission else []
+    sections += [f"{header}\n{body}" for header, body in zip(SECTION_HEADERS, (goal, meta, output, notes)) if body]
+    return "\n" + _compact("\n\n".join(sections)) + "\n"
+
+# The Planner's guidance action selects one planning mode; each mode's prompt carries only
+# the behaviour for that mode instead of every branch.
+PLANNER_MODES: Dict[Optional[str], str] = {
+    None: "BFS",
+    "BROADEN": "BFS",
+    "DEEPEN": "DEEPEN",
+    "CONTINUE_DFS_PATH": "DEEPEN",
+    "RETRY_STEP_WITH_MODIFICATION": "RETRY",
+}
+
+_PLANNER_MODE_GOALS = {
+    "BFS": "*   **BFS Behavior (no guidance, or BROADEN guidance):** Generate multiple distinct exploration plans (up to 5) that cover different facets of the `parent_task` using diverse strategies. Aim for 3-4 diverse plans.",
+    "DEEPEN": "*   **DFS Behavior (DEEPEN or CONTINUE_DFS_PATH guidance):** `previous_review_guidance` directs you to deepen a specific finding; your generated plan(s) MUST focus on fulfilling that guidance.",
+    "RETRY": "*   **DFS Behavior (RETRY_STEP_WITH_MODIFICATION guidance):** `previous_review_guidance` directs you to retry a specific step; your generated plan(s) MUST focus on fulfilling that guidance.",
+}
+
+_PLANNER_MODE_ANALYSIS = {
+    "BFS": """1.  **Analyze Inputs (BFS Mode):**
+    *   Carefully consider the `parent_task`. There is no `previous_review_guidance`, or its `action` is `BROADEN`.
+    *   **Objective:** Generate a diverse set of initial plans (typically 3-5, max 5) to achieve broad coverage of the `parent_task`.
+    *   **Breadth-First Generation Algorithm:**
+        1.  Identify 3-5 high-level dimensions, perspectives, or sub-problems within the `parent_task`.
+        2.  For each dimension, create one `ExplorationPlan`.
+        3.  Assign a *distinct and appropriate* `ExplorationStrategy` from the catalog to each plan.
+        4.  Ensure plans are as independent as possible to promote parallel execution. Minimize cross-plan dependencies.
+        5.  If `previous_review_guidance.action == "BROADEN"`, ensure new plans use strategies different from `excluded_strategies` and consider `suggested_strategy` if available.
+""",
+    "DEEPEN": """1.  **Analyze Inputs (DFS Mode):**
+    *   Carefully consider the `parent_task` and `previous_review_guidance`; its `action` is `DEEPEN` or `CONTINUE_DFS_PATH`.
+    *   **Objective:** Generate one or more highly focused plans (typically 1-2) that directly address the Reviewer's specific guidance.
+    *   **Task:** "Generate a new exploration plan that delves deeper into the findings of plan `{target_plan_id}`, step `{target_step_id}`. The previous output was: `{snippet_of_target_step_output}`. Focus on exploring/validating/expanding on: `{refinement_details}`. The overall parent task is still `{parent_task}`. If continuing a DFS path, the path so far is `{dfs_path_summary}`."
+        *   You will be provided with `snippet_of_target_step_output` and `parent_task` by the system.
+        *   Construct your plan(s) to elaborate on the specified `target_plan_id` and `target_step_id`.
+""",
+    "RETRY": """1.  **Analyze Inputs (DFS Mode):**
+    *   Carefully consider the `parent_task` and `previous_review_guidance`; its `action` is `RETRY_STEP_WITH_MODIFICATION`.
+    *   **Objective:** Generate one highly focused plan that directly addresses the Reviewer's specific guidance.
+    *   **Task:** "Step `{target_step_id}` in plan `{target_plan_id}` needs to be re-attempted or modified. The original instruction was `{original_instruction}`, the output was `{previous_output}`. The Reviewer suggests focusing on/modifying: `{refinement_details}`. Create a plan step to address this."
+        *   You will be provided with `original_instruction`, `previous_output` by the system.
+        *   Create a plan focused on re-addressing this specific step.
+""",
+}
+
+@functools.cache
+def get_planner_instructions(mode: str = "BFS") -> str:
+    """Planner prompt for one of the PLANNER_MODES values."""
+    return render_instruction(
+        mission="""## Primary Mission: Breadth-First Global Mapping
+Your primary responsibility is to create a broad, breadth-first set of exploration plans that collectively map the solution space for the `parent_task`. Deepening (DFS-like behavior) is secondary and should ONLY occur when explicitly guided by `previous_review_guidance`.""",
+        goal=f"""Create a strategic Exploration Plan to address the provided `parent_task`.
+{_PLANNER_MODE_GOALS[mode]}""",
+        meta=f"""{_PLANNER_MODE_ANALYSIS[mode]}
 2.  **Define Steps and Dependencies for Each Plan:**
     *   **CRITICAL NOTE ON THINKERAGENT CONTEXT:** The `ThinkerAgent` will *always* receive the `overall_parent_task` context (if one exists for the job) in addition to its specific step `instructions` and any `dependency_outputs`.
     *   Therefore, your `instructions` for each `PlanStep` must be precise for the *specific sub-task* of that step. The ThinkerAgent is instructed to prioritize `instructions` and `dependency_outputs` for its immediate action, using the `overall_parent_task` for broader understanding when needed.
@@ -1489,55 +450,33 @@ Create a strategic Exploration Plan to address the provided `parent_task`.
 3.  **Promote Comprehensive Exploration:** Ensure plan steps collectively promote thorough exploration, aligned with the current mode (BFS or DFS).
 
 ### Exploration Strategies and Algorithms
-<EXPLORATION_STRATEGIES>
-{EXPLORATION_STRATEGIES}
-</EXPLORATION_STRATEGIES>
-
-## Output Instructions
-Return a JSON object with a single key: `exploration_plans`.
-Value is a list of up to 10 plan objects. In BFS mode, aim for 3-5 diverse plans. In DFS mode, 1-2 focused plans are typical. Example:
-```json
-{{
-  "exploration_plans": [
-    {{
-      "plan_id": "A",
-      "strategy": "First Principles Thinking",
-      "overview": "Optional one-sentence summary of this plan's angle",
-      "steps": [
-        {{ "step_id": "A1", "instructions": "Break concept X..." }},
-        {{ "step_id": "A2", "instructions": "Question assumption Y related to X.A1...", "dependencies": ["A.A1"] }}
-      ]
-    }},
-    {{
-      "plan_id": "B",
-      "strategy": "Root Cause Analysis",
-      "overview": "Analyze failure Z from a different perspective",
-      "steps": [
-        {{ "step_id": "B1", "instructions": "Identify symptoms of failure Z."}},
-        {{ "step_id": "B2", "instructions": "List potential root causes for symptoms in B.B1.", "dependencies": ["B.B1"]}}
-      ]
-    }}
-  ]
-}}
-```
-Rules:
-* Up to 10 plans.
-* One `strategy` per plan.
-* `steps[*]` objects: `step_id`, `instructions`, and optional `dependencies` (list of strings like "PLAN_ID.STEP_ID").
-* Outer `exploration_plans` list must exist.
-
-## Note
-Ensure each step is actionable for a ThinkerAgent.
+The `EXPLORATION_STRATEGIES` catalog is provided ahead of these instructions. Assign each plan a `strategy` from that catalog.""",
+        output=f"""{_SCHEMA_ENFORCED_NOTE}
+* At most 5 plans. In BFS mode, aim for 3-5 diverse plans. In DFS mode, 1-2 focused plans are typical.
+* `strategy` is the exact title of one `EXPLORATION_STRATEGIES` entry (e.g. "Root Cause Analysis (RCA)").
+* `dependencies` are fully qualified `"PLAN_ID.STEP_ID"` strings.
+* If a `plan_budget` is given, the total number of steps across all plans must not exceed it.""",
+        notes="""Ensure each step is actionable for a ThinkerAgent.
 Ensure dependency IDs are accurate.
-Prioritize breadth and diverse strategies in initial/BFS planning. Focus narrowly when Reviewer guides a deep dive.
-"""
+Prioritize breadth and diverse strategies in initial/BFS planning. Focus narrowly when Reviewer guides a deep dive.""",
+    )
 
-THINKER_INSTRUCTIONS = """
-## Goal/Task
-Perform deep, methodical exploration and reasoning strictly on the assigned `step_instructions`, following all provided directives and utilizing any provided context.
-
-## Meta-Cognitive Instructions
-1.  **Understand Directives & Context:**
+@functools.cache
+def get_planner_instructions_sha() -> str:
+    """
+    Fingerprint of everything the Planner is conditioned on besides its user prompt;
+    cached plans keyed on it are invalidated by any edit to the catalog or instructions.
+    """
+    prompts = [get_planner_instructions(mode) for mode in sorted(set(PLANNER_MODES.values()))]
+    return hashlib.sha256(
+        (get_strategy_catalog() + "".join(prompts)).encode("utf-8")
+    ).hexdigest()
+
+@functools.cache
+def get_thinker_instructions() -> str:
+    return render_instruction(
+        goal="""Perform deep, methodical exploration and reasoning strictly on the assigned `step_instructions`, following all provided directives and utilizing any provided context.""",
+        meta="""1.  **Understand Directives & Context:**
     *   **CRITICAL:** Your understanding of the task and its broader context comes from the following sources, which will be clearly delineated in your prompt:
         1.  `<overall_parent_task>` (if an overall parent task exists for the job): This provides the broadest context.
         2.  `<dependency_outputs>` (if provided): These are the results from prerequisite steps and are critical inputs for your current step.
@@ -1567,143 +506,145 @@ Perform deep, methodical exploration and reasoning strictly on the assigned `ste
         *   **When `step_instructions` directs you to calculate a specific numerical value, derive a quantity, apply a formula, or perform statistical/probabilistic computations, you MUST attempt to use the Code Execution tool.** Generate Python code to perform the calculation.
         *   **Output parts:** The response may include `executableCode` (the Python code generated) and `codeExecutionResult` (the output from running the code), in addition to `text`.
             *   **Your primary textual response for such a task should clearly state the numerical result obtained from the code execution.**
-            *   **Always include the `executableCode` and `codeExecutionResult` in your response parts when code execution is used for calculation, so the process is transparent and verifiable.**
-
-## Output Instructions
-Provide a comprehensive, well-reasoned textual response directly addressing `step_instructions`.
+            *   **Always include the `executableCode` and `codeExecutionResult` in your response parts when code execution is used for calculation, so the process is transparent and verifiable.**""",
+        output=f"""Provide a comprehensive, well-reasoned textual response directly addressing `step_instructions`.
 Your response must clearly reflect how you are using the information from `step_instructions` and, crucially, from any `<dependency_outputs>`.
 If search/URL context was used, integrate key findings.
 Structure thoughts clearly (paragraphs, bullets if appropriate).
+{_NO_META_COMMENTARY_RULE}""",
+        notes="""Your output is self-contained for the sub-task defined in `step_instructions`. Do not deviate. Your reasoning should explicitly show how you are using the provided dependency outputs if they are present.""",
+    )
 
-## Note
-Your output is self-contained for the sub-task defined in `step_instructions`. Do not deviate. Your reasoning should explicitly show how you are using the provided dependency outputs if they are present.
-"""
+@functools.cache
+def get_thinker_instructions_sha() -> str:
+    """Cached Thinker responses are keyed on it, like `get_planner_instructions_sha` for plans."""
+    return hashlib.sha256(get_thinker_instructions().encode("utf-8")).hexdigest()
 
-REVIEWER_INSTRUCTIONS = """
-## Primary Goal: Maximize Solution Quality Through Iterative Refinement
-Your **critical mission** is to rigorously evaluate the `ThinkerAgent` outputs (`plans_with_responses`) against the `parent_task`. Your default stance should be that **further improvement is almost always possible**. You are the gatekeeper of quality, ensuring the process continues until an *exceptional* solution is developed or clear limitations are hit.
-
-Your main responsibilities are:
-1.  **Identify "Gems" for Synthesis (`selected_context`):** Pinpoint innovative, pivotal, and directly helpful insights from the current iteration. The absence of new gems is a strong indicator of insufficient progress.
-2.  **Formulate `NextIterationGuidance`:** Provide precise, actionable guidance for the Planner to steer the next iteration towards higher-value exploration. **`HALT_SUFFICIENT` is an exceptional action, not a default.**
-
-## Meta-Cognitive Instructions: The Art of Critical Review
-
-1.  **Deeply Understand Context:**
-    *   `parent_task`: The ultimate objective. Re-read it each iteration. What are its explicit and *implicit* requirements?
-    *   `plans_with_responses`: The raw material from the Thinker. Don't just skim; analyze the depth, relevance, and novelty of responses.
-    *   `current_iteration`: How far along are we? Early iterations might need broader exploration, later ones more focused deepening.
-
-2.  **Curate `selected_context` (Pivotal Insights for Synthesis) – Focusing the Solution Path:**
-    *   Scrutinize each Thinker response. The purpose of `selected_context` is to distill the most valuable information from the current iteration's outputs, which will directly inform the Synthesizer. This process also implicitly filters out information from paths that proved unhelpful or were disproven.
-    *   **Criteria for selecting an insight for `selected_context`:**
-        *   **Direct Contribution:** The insight directly solves a key part of the `parent_task` or provides a crucial piece of the final solution.
-        *   **Strategic Advancement:** The insight unlocks a new, demonstrably promising avenue of exploration that is likely to lead closer to the solution, or validates a critical hypothesis.
-        *   **Significant Understanding:** The insight represents a significant, novel understanding, clarifies a complex aspect of the problem, or provides a breakthrough in how to approach the `parent_task`.
-        *   **Correction & Validation:** The insight corrects a previous misunderstanding, refutes a flawed path (e.g., based on code execution results or logical deduction), or provides strong evidence for a particular approach.
-        *   **Indirect Value:** The insight, while not a direct solution component, provides essential context, constraints, or foundational knowledge necessary for building the solution.
-    *   **Focus on Verified Value:** Prioritize insights that are well-supported by evidence, reasoning, or (if applicable) code execution results.
-    *   **Quality and Relevance over Quantity:** Select only the most impactful and relevant information that directly contributes to solving the `parent_task`. Avoid including redundant information or outputs from clearly unproductive exploration paths.
-    *   **Indicator of Progress:** The identification of new, significant insights for `selected_context` is a key indicator of progress. **If no such insights are found in an iteration, it is a major red flag.** This strongly suggests the current exploration strategy is stagnating, the solution is far from complete, or previously explored paths need to be definitively marked as unviable. `HALT_SUFFICIENT` is highly unlikely in this scenario.
-
-3.  **Strategic Guidance for Lucrative Pathfinding (`NextIterationGuidance`) â€“ Your Core Function:**
-    *   **Overarching Principle: Iterative Value Maximization.** Your guidance must aim to maximize the "value" or "lucrativeness" of insights gained in subsequent iterations.
-    *   **Default to Iteration:** Assume the process needs to continue. Your first thought should be: "How can the *next* iteration be even better?"
-    *   **Exploitation vs. Exploration (Adaptive Strategy):**
-        *   **Exploit (DEEPEN, CONTINUE_DFS_PATH):** If a specific "gem" or line of inquiry is yielding high-value results and shows clear promise for more, direct the Planner to dig deeper.
-        *   **Explore (BROADEN):** If current paths show diminishing returns, if the solution space seems inadequately covered, if critical aspects of the `parent_task` are unaddressed, or if no new gems were found, direct the Planner to explore *genuinely new* avenues with *different* strategies.
-    *   **Information Gain:** Prioritize guidance that will yield the most critical new information, address key unknowns, or resolve ambiguities.
-    *   **Challenge Assumptions:** Are the plans and responses truly addressing the `parent_task`, or are they stuck on superficial aspects?
-
-4.  **Formulating `NextIterationGuidance` â€“ The Decision Framework:**
-
-    *   **Step 1: Assess Sufficiency (Be Extremely Critical):**
-        *   Is the `parent_task` *comprehensively and exceptionally* addressed?
-        *   Are all explicit and implicit requirements met to a high standard?
-        *   Would a demanding stakeholder be fully satisfied with the current collective insights as a final solution?
-        *   Are there *any* unexplored angles, potential improvements, or unverified assumptions that could significantly enhance the solution?
-        *   **If the answer to ANY of these is "no" or "uncertain," then the context is NOT `SUFFICIENT_FOR_SYNTHESIS`.**
-
-    *   **Step 2: If NOT Sufficient, Strategize (Prioritize Continuation):**
-        *   **`DEEPEN` / `CONTINUE_DFS_PATH`:** Is there a specific plan/step output that is highly promising but incomplete? Is there a clear "next logical step" to exploit a recent breakthrough?
-        *   **`BROADEN`:**
-            *   Are we missing perspectives? Are there unaddressed facets of the `parent_task`?
-            *   Have the current strategies yielded little, or are we seeing diminishing returns?
-            *   Were no significant insights identified for `selected_context` in this iteration? (Strong signal for `BROADEN` to find new productive paths, or to confirm that existing paths are exhausted).
-            *   Ensure `suggested_strategy` is genuinely different and appropriate.
-        *   **`RETRY_STEP_WITH_MODIFICATION`:** Was a step conceptually good but executed poorly or based on a misunderstanding? Provide clear guidance for correction.
-        *   **Consider Stagnation (Use `STAGNATION_THRESHOLD` and `iterations_no_progress` provided by the system):**
-            *   If `iterations_no_progress >= STAGNATION_THRESHOLD`:
-                *   If confidence in solving the `parent_task` is still reasonable, strongly prefer `BROADEN` with *radically different* strategies.
-                *   If confidence is low and multiple `BROADEN` attempts have failed to yield gems, then `HALT_STAGNATION` may be appropriate. Your `reasoning` must justify why further attempts are unlikely to succeed.
-
-    *   **Step 3: Populate `NextIterationGuidance` Fields:**
-        *   `action`: (DEEPEN, BROADEN, CONTINUE_DFS_PATH, RETRY_STEP_WITH_MODIFICATION, HALT_SUFFICIENT, HALT_STAGNATION, HALT_NO_FEASIBLE_PATH).
-        *   `reasoning`: **This is critical.** Provide a clear, detailed justification for your chosen `action`, explaining *why* it's the best next step (or why halting is *unavoidably* necessary). If halting, explain why further iteration won't add value.
-        *   `target_plan_id`, `target_step_id`: For DEEPEN, CONTINUE_DFS_PATH, RETRY_STEP_WITH_MODIFICATION.
-        *   `refinement_details`: For DEEPEN, RETRY_STEP_WITH_MODIFICATION.
-        *   `excluded_strategies`: For BROADEN (strategies already tried and failed, or clearly unsuitable).
-        *   `suggested_strategy`: For BROADEN (a specific, promising, *different* strategy).
-        *   `dfs_path_summary`: For CONTINUE_DFS_PATH.
-
-    *   **Step 4: The `HALT` Actions (Use Sparingly and with Strong Justification):**
-        *   **`HALT_SUFFICIENT`:**
-            *   **This is the rarest action.** Only use if the solution is truly exceptional, comprehensive, and no further meaningful improvement is conceivable.
-            *   Your `reasoning` must be exceptionally strong, detailing *why* the current state is considered perfect and unimprovable.
-            *   The presence of a comprehensive set of high-quality insights in `selected_context` that collectively address the `parent_task` is a prerequisite.
-        *   **`HALT_STAGNATION`:** Use if multiple iterations (especially after `BROADEN` attempts) have yielded no significant progress (no new gems), and you assess that further effort with current capabilities is unlikely to solve the `parent_task`.
-        *   **`HALT_NO_FEASIBLE_PATH`:** Use if all explored avenues consistently lead to dead ends, the task seems fundamentally intractable with the available strategies/information, or initial plans are impossible to execute meaningfully.
+# The Reviewer and Synthesizer prompts live in app/prompts/*.md and are read on first use.
+# `{_NAME}` placeholders in them are filled from the shared rules above.
+_SHARED_RULES = {
+    "_SCHEMA_ENFORCED_NOTE": _SCHEMA_ENFORCED_NOTE,
+    "_NO_META_COMMENTARY_RULE": _NO_META_COMMENTARY_RULE,
+}
 
-## Output Instructions
-Return a JSON object matching the `ReviewerOut` schema:
-```python
-class NextIterationGuidance(BaseModel):
-    action: Literal[
-        "DEEPEN", "BROADEN", "CONTINUE_DFS_PATH",
-        "RETRY_STEP_WITH_MODIFICATION", "HALT_SUFFICIENT",
-        "HALT_STAGNATION", "HALT_NO_FEASIBLE_PATH"
-    ]
-    reasoning: str # MANDATORY: Detailed justification for the action.
-    target_plan_id: Optional[str] = None
-    target_step_id: Optional[str] = None
-    refinement_details: Optional[str] = None
-    excluded_strategies: Optional[List[str]] = None
-    suggested_strategy: Optional[str] = None
-    dfs_path_summary: Optional[str] = None
-
-class ReviewerOut(BaseModel):
-    iteration_assessment: str # Qualitative summary of this iteration's value.
-    synthesis_ready: bool # True ONLY if next_iteration_guidance.action == "HALT_SUFFICIENT"
-    selected_context: Optional[List[ContextSelection]] = None # List of gems. Omit or empty if no new significant gems.
-    next_iteration_guidance: NextIterationGuidance
-```
-*   `iteration_assessment`: Your qualitative summary of the iteration's progress and the value of its outputs. Be honest about shortcomings.
-*   `synthesis_ready`: Set to `True` **if and only if** `next_iteration_guidance.action == "HALT_SUFFICIENT"`. Otherwise, always `False`.
-*   `selected_context`: Crucial. List `ContextSelection` objects for the Synthesizer. If no *new, significant* gems were found, this should be empty or omitted.
-*   `next_iteration_guidance`: The fully populated `NextIterationGuidance` object. **Your `reasoning` here is paramount.**
-
-## Final Admonition
-Your role is to be the toughest critic. Push the system to produce its best work. Do not accept mediocrity. Do not halt prematurely. Your guidance drives the entire refinement process.
-"""
+@functools.cache
+def _load_prompt(filename: str) -> str:
+    text = resources.files(__package__ or "app").joinpath("prompts").joinpath(filename).read_text(encoding="utf-8")
+    return "\n" + _compact(text.format_map(_SHARED_RULES))
 
-SYNTHESIZER_INSTRUCTIONS = """
-## Goal/Task
-Synthesize a final, coherent, and comprehensive solution to the `parent_task` using the provided `process_history` and, critically, the `selected_context` from the *final* review iteration.
-
-## Meta-Cognitive Instructions
-1.  **Thoroughly Review History & Prioritized Context:**
-    *   Carefully examine the `process_history`. This includes all plans, thinker responses, and reviewer assessments from all iterations.
-    *   **Crucially, the `selected_context` (passed as `selected_step_responses` in your prompt) from the *final review* highlights the most pivotal information. This should form the backbone of your synthesis.**
-2.  **Integrate Key Insights:**
-    *   Your primary focus is to synthesize information from the `selected_step_responses` (derived from the final `selected_context`).
-    *   While the `selected_step_responses` are paramount, ensure your synthesis also incorporates any crucial supporting details or complementary insights from the broader `process_history` to provide a complete and well-rounded answer to the `parent_task`. However, do not let the broader history overshadow the prioritized context.
-3.  **Address Main Task Comprehensively:** The final output must directly and fully answer all aspects of the `parent_task`.
-4.  **Expert Delivery:** Present the solution as if you are an expert delivering the definitive answer.
-5.  **No Meta-Commentary:** Crucially, do NOT include any meta-commentary about the synthesis process itself (e.g., avoid phrases like "Based on the provided history...", "The iterative process revealed...", "Synthesizing the findings...").
+def get_reviewer_instructions() -> str:
+    return _load_prompt("reviewer.md")
 
-## Output Instructions
-Deliver a complete, actionable (if applicable), and ready-for-use textual answer that directly and comprehensively addresses the `parent_task`. The output should be polished and stand alone as the final solution.
+def get_synthesizer_instructions() -> str:
+    return _load_prompt("synthesizer.md")
 
-## Note
-The final output must be free of any notes about the process of synthesis or references to the historical iterations. Focus solely on delivering the answer to the `parent_task`. Your synthesis must heavily rely on the `selected_step_responses` (final `selected_context`).
-"""
+
+_BLOCK_HEADING_RE = re.compile(r"^#{2,3} .*$", re.MULTILINE)
+
+def prompt_block_hashes(prompt: str) -> Dict[str, str]:
+    """
+    Splits `prompt` at its `##`/`###` headings and returns {heading: blake2b-64 digest} per block,
+    so an edit can be traced to the block it touched. Text before the first heading is "(preamble)".
+    """
+    starts = [m.start() for m in _BLOCK_HEADING_RE.finditer(prompt)]
+    bounds = zip([0] + starts, starts + [len(prompt)])
+    hashes: Dict[str, str] = {}
+    for begin, end in bounds:
+        block = prompt[begin:end]
+        if not block.strip():
+            continue
+        heading = block.splitlines()[0].strip() if begin in starts else "(preamble)"
+        hashes[heading] = hashlib.blake2b(block.encode("utf-8"), digest_size=8).hexdigest()
+    return hashes
+
+def all_prompt_block_hashes() -> Dict[str, Dict[str, str]]:
+    return {
+        "STRATEGY_CATALOG": prompt_block_hashes(get_strategy_catalog()),
+        "PLANNER_INSTRUCTIONS": prompt_block_hashes(get_planner_instructions()),
+        "THINKER_INSTRUCTIONS": prompt_block_hashes(get_thinker_instructions()),
+        "REVIEWER_INSTRUCTIONS": prompt_block_hashes(get_reviewer_instructions()),
+        "SYNTHESIZER_INSTRUCTIONS": prompt_block_hashes(get_synthesizer_instructions()),
+    }
+
+PROMPT_BLOCK_HASHES_PATH = os.path.join(os.path.dirname(__file__), "prompt_block_hashes.json")
+
+def changed_prompt_blocks(path: str = PROMPT_BLOCK_HASHES_PATH) -> List[str]:
+    """
+    Compares the current prompt block hashes with the committed snapshot at `path` and returns
+    "PROMPT / heading" for every block that was added or edited since. Each such prompt gets a
+    new cache key, so its server-side cache is rebuilt on the next call; unchanged prompts keep theirs.
+    Read-only: the snapshot only moves through `write_prompt_block_hashes`.
+    """
+    current = all_prompt_block_hashes()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+
+    changed = [
+        f"{prompt_name} / {heading}"
+        for prompt_name, blocks in current.items()
+        for heading, digest in blocks.items()
+        if previous.get(prompt_name, {}).get(heading) != digest
+    ]
+    return changed
+
+def write_prompt_block_hashes(path: str = PROMPT_BLOCK_HASHES_PATH) -> None:
+    """
+    Maintainer step after an intended prompt edit: records the current block hashes as the new
+    snapshot (`python -m app.instructions`).
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(all_prompt_block_hashes(), f, indent=2)
+        f.write("\n")
+
+# The former prompt constants, still importable by name but built on first access (PEP 562).
+_LAZY_CONSTANTS = {
+    "EXPLORATION_STRATEGIES": get_strategy_catalog,
+    "STRATEGY_SELECTOR_INSTRUCTIONS": get_strategy_selector_instructions,
+    "PLANNER_INSTRUCTIONS": get_planner_instructions,
+    "THINKER_INSTRUCTIONS": get_thinker_instructions,
+    "REVIEWER_INSTRUCTIONS": get_reviewer_instructions,
+    "SYNTHESIZER_INSTRUCTIONS": get_synthesizer_instructions,
+}
+
+def __getattr__(name: str) -> str:
+    if name in _LAZY_CONSTANTS:
+        return _LAZY_CONSTANTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = [
+    *_LAZY_CONSTANTS,
+    "STRATEGY_NAMES",
+    "STRATEGY_DETAIL",
+    "PLANNER_MODES",
+    "SECTION_HEADERS",
+    "PROMPT_BLOCK_HASHES_PATH",
+    "Strategy",
+    "get_exploration_strategies",
+    "get_strategies",
+    "select_strategies",
+    "filter_strategies",
+    "offered_strategies",
+    "build_strategy_catalog",
+    "build_strategies_section",
+    "build_strategy_index_catalog",
+    "get_strategy_index",
+    "get_strategy_catalog",
+    "get_strategy_selector_instructions",
+    "render_instruction",
+    "get_planner_instructions",
+    "get_planner_instructions_sha",
+    "get_thinker_instructions",
+    "get_thinker_instructions_sha",
+    "get_reviewer_instructions",
+    "get_synthesizer_instructions",
+    "prompt_block_hashes",
+    "all_prompt_block_hashes",
+    "changed_prompt_blocks",
+    "write_prompt_block_hashes",
+]
+
+if __name__ == "__main__":
+    write_prompt_block_hashes()
@@ -1,55 +1,216 @@
 # app/main.py
 
+import argparse
+import asyncio
+import atexit
+import functools
 import os
+import queue
+import threading
 import sys
-import json
 import datetime
+import enum
 import re
-from typing import Optional, List, Dict, Any, Tuple, Set
-from pydantic import BaseModel
+from collections import ChainMap, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, FrozenSet, Final
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
 import dotenv
 
-dotenv.load_dotenv()
-
 from app.instructions import (
-    PLANNER_INSTRUCTIONS,
-    THINKER_INSTRUCTIONS,
-    REVIEWER_INSTRUCTIONS,
-    SYNTHESIZER_INSTRUCTIONS,
+    get_strategy_catalog,
+    get_strategy_selector_instructions,
+    build_strategies_section,
+    build_strategy_index_catalog,
+    offered_strategies,
+    filter_strategies,
+    select_strategies,
+    changed_prompt_blocks,
+    PLANNER_MODES,
+    get_planner_instructions,
+    get_thinker_instructions,
+    get_reviewer_instructions,
+    get_synthesizer_instructions,
 )
-from app.client import Client
+from app.thinker_cache import ThinkerCache
+from app import prompt_cache
+from app.prompt_cache import CACHE_DIR, PromptCache, memoize_llm, memoize_synth, prompt_key
+from app.response_dedup import dedupe_responses
+from app.compression import compress_responses
 from app.schemas import (
     PlannerOut,
+    StrategySelection,
     ReviewerOut,
     NextIterationGuidance,
     ExplorationPlan,
     PlanStep,
     ContextSelection,
 )
-from google.genai import types # Added for ToolCodeExecution
-from google.genai.types import Tool, GoogleSearch
+
+@functools.cache
+def _thinker_tools() -> list:
+    """
+    Stateless tool configs shared by every Thinker call; the SDK copies them into each request
+    config and never mutates the list. Built on first use so importing this module does not
+    load the Gemini SDK.
+    """
+    from google.genai import types
+    return [
+        types.Tool(google_search=types.GoogleSearch()),
+        types.Tool(code_execution=types.ToolCodeExecution()),
+    ]
+
+# Serializes plan lists straight to JSON in pydantic-core, without intermediate dicts.
+_PLANS_ADAPTER = TypeAdapter(List[ExplorationPlan])
+
+@functools.cache
+def _model_list_adapter(model_cls: type) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
 
 class BColors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+    __slots__ = ()
+    HEADER: Final[str] = '\033[95m'
+    OKBLUE: Final[str] = '\033[94m'
+    OKCYAN: Final[str] = '\033[96m'
+    OKGREEN: Final[str] = '\033[92m'
+    WARNING: Final[str] = '\033[93m'
+    FAIL: Final[str] = '\033[91m'
+    ENDC: Final[str] = '\033[0m'
+    BOLD: Final[str] = '\033[1m'
+    UNDERLINE: Final[str] = '\033[4m'
+
+# Bound once for the logging hot path: a global load instead of a class attribute lookup per entry.
+_OKCYAN = BColors.OKCYAN
+_ENDC = BColors.ENDC
+
+class LogLevel(enum.IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+# Entries below LOG_LEVEL are dropped before any formatting or serialization work. JSON log
+# payloads are pretty-printed only for a person at a terminal (or when debugging); piped or
+# redirected output gets compact JSON, which is cheaper to encode and write.
+LOG_LEVEL: int = LogLevel.INFO
+_LOG_JSON_INDENT: Optional[int] = None
+
+def _configure_log_level() -> None:
+    """
+    Reads DEEPREASON_LOG_LEVEL, as a level name (DEBUG, INFO, WARNING, ERROR) or a number;
+    anything else falls back to INFO with a warning. `main` calls it again once `.env` is loaded.
+    """
+    global LOG_LEVEL, _LOG_JSON_INDENT
+    value = os.environ.get("DEEPREASON_LOG_LEVEL", "").strip()
+    try:
+        if not value:
+            LOG_LEVEL = LogLevel.INFO
+        elif value.lstrip("-").isdigit():
+            LOG_LEVEL = int(value)
+        else:
+            LOG_LEVEL = LogLevel[value.upper()]
+    except KeyError:
+        LOG_LEVEL = LogLevel.INFO
+        sys.stderr.write(
+            f"{BColors.WARNING}Warning: unknown DEEPREASON_LOG_LEVEL {value!r}; expected one of "
+            f"{', '.join(LogLevel.__members__)} or a number. Using INFO.{BColors.ENDC}\n"
+        )
+    _LOG_JSON_INDENT = 2 if sys.stdout.isatty() or LOG_LEVEL <= LogLevel.DEBUG else None
+
+_configure_log_level()
 
 LOG_FILE_PATH: Optional[str] = None
+# One JSON line per completed iteration, so a crashed run's findings survive on disk.
+HISTORY_FILE_PATH: Optional[str] = None
+
+# Log lines are appended by one background writer holding the files open, so agents never
+# wait on disk I/O. `None` on the queue asks the writer to drain and stop.
+_LOG_QUEUE: "queue.SimpleQueue[Optional[Tuple[str, str]]]" = queue.SimpleQueue()
+_LOG_WRITER: Optional[threading.Thread] = None
+_LOG_WRITER_LOCK = threading.Lock()
+
+def _log_writer() -> None:
+    files: Dict[str, Any] = {}
+    try:
+        while True:
+            batch = [_LOG_QUEUE.get()]
+            while True:
+                try:
+                    batch.append(_LOG_QUEUE.get_nowait())
+                except queue.Empty:
+                    break
+            for entry in batch:
+                if entry is None:
+                    return
+                entry_path, text = entry
+                try:
+                    f = files.get(entry_path)
+                    if f is None:
+                        f = files[entry_path] = open(entry_path, "a", encoding="utf-8")
+                    f.write(_strip_ansi_codes(text))
+                except Exception as e:
+                    print(f"{BColors.FAIL}Error writing to log file {entry_path}: {e}{BColors.ENDC}")
+            for f in files.values():
+                f.flush()
+    finally:
+        for f in files.values():
+            os.fsync(f.fileno())
+            f.close()
+
+def _write_log(text: str, path: Optional[str] = None) -> None:
+    """
+    Queues `text` for appending to `path` (LOG_FILE_PATH by default); the writer thread starts
+    on first use and strips any ANSI colors there, off the caller's thread.
+    """
+    global _LOG_WRITER
+    path = path or LOG_FILE_PATH
+    if not path:
+        return
+    with _LOG_WRITER_LOCK:
+        if _LOG_WRITER is None:
+            _LOG_WRITER = threading.Thread(target=_log_writer, name="log-writer", daemon=True)
+            _LOG_WRITER.start()
+            atexit.register(_close_log)
+    _LOG_QUEUE.put((path, text))
+
+def _close_log() -> None:
+    """Flushes every queued log line and stops the writer."""
+    global _LOG_WRITER
+    with _LOG_WRITER_LOCK:
+        writer, _LOG_WRITER = _LOG_WRITER, None
+    if writer:
+        _LOG_QUEUE.put(None)
+        writer.join()
+
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
 def _strip_ansi_codes(text: str) -> str:
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    if '\x1B' not in text:
+        return text
+    return _ANSI_ESCAPE_RE.sub('', text)
 
 def _build_prompt_xml_style(parts: List[Tuple[str, str]]) -> str:
-    return "\n\n".join(
-        f"<{tag}>{content}</{tag}>" for tag, content in parts if content is not None
-    )
+    """
+    Joins `parts` into the `<tag>content</tag>` layout every agent prompt uses, skipping empty
+    contents. Callers order `parts` from most to least stable (run-wide context first, per-call
+    payload last) so consecutive calls share the longest byte-identical prefix after the static
+    system instruction, which is what provider-side prompt caching keys on.
+    """
+    # Fragments are joined once, so large contents (plans_json runs to tens of KB) are copied
+    # a single time instead of once into an f-string and again by the join.
+    fragments: List[str] = []
+    for tag, content in parts:
+        if not content:
+            continue
+        if fragments:
+            fragments.append("\n\n")
+        fragments.extend(("<", tag, ">", content, "</", tag, ">"))
+    return "".join(fragments)
+
+@functools.cache
+def _agent_tag(agent_name: str) -> str:
+    return f"{_OKCYAN}[{agent_name}]{_ENDC}"
 
 def _log_agent_activity(
     agent_name: str,
@@ -58,8 +219,10 @@ def _log_agent_activity(
     color: str = BColors.WARNING,
     is_json: bool = False,
     snippet_length: Optional[int] = None,
+    level: int = LogLevel.INFO,
 ):
-    header = f"\n{BColors.OKCYAN}[{agent_name}]{BColors.ENDC} {phase}:"
+    if level < LOG_LEVEL:
+        return
     content_to_log = (
         content[:snippet_length] + "..." if snippet_length and isinstance(content, str) and len(content) > snippet_length
         else content
@@ -67,39 +230,73 @@ def _log_agent_activity(
 
     if is_json:
         if isinstance(content_to_log, list) and all(isinstance(item, BaseModel) for item in content_to_log):
-            log_content = json.dumps([item.model_dump(exclude_none=True) for item in content_to_log], indent=2)
+            adapter = _model_list_adapter(type(content_to_log[0])) if content_to_log else _PLANS_ADAPTER
+            log_content = adapter.dump_json(content_to_log, exclude_none=True, indent=_LOG_JSON_INDENT).decode()
         elif isinstance(content_to_log, BaseModel):
-            log_content = json.dumps(content_to_log.model_dump(exclude_none=True), indent=2)
+            log_content = content_to_log.model_dump_json(exclude_none=True, indent=_LOG_JSON_INDENT)
         else:
-            log_content = json.dumps(content_to_log, indent=2)
+            # pydantic-core's encoder also covers nested models and datetimes, which json.dumps rejects.
+            log_content = to_json(content_to_log, indent=_LOG_JSON_INDENT, fallback=str).decode()
     elif isinstance(content_to_log, str):
         log_content = content_to_log
     else:
         log_content = str(content_to_log)
 
-    print(f"{header}\n{color}{log_content}{BColors.ENDC}")
+    # One write per entry; only warnings and failures force a flush, routine output is left
+    # to the stream's own buffering.
+    sys.stdout.write(f"\n{_agent_tag(agent_name)} {phase}:\n{color}{log_content}{_ENDC}\n")
+    if level >= LogLevel.WARNING:
+        sys.stdout.flush()
 
-    global LOG_FILE_PATH
-    if LOG_FILE_PATH:
-        try:
-            with open(LOG_FILE_PATH, "a", encoding="utf-8") as f:
-                f.write(f"{_strip_ansi_codes(header)}\n{_strip_ansi_codes(log_content)}\n\n")
-        except Exception as e:
-            print(f"{BColors.FAIL}Error writing to log file {LOG_FILE_PATH}: {e}{BColors.ENDC}")
+    # The file copy is formatted without colors, so the writer has no escape codes to strip.
+    _write_log(f"\n[{agent_name}] {phase}:\n{log_content}\n\n")
 
 class PlannerAgent:
-    def __init__(self, client, model):
+    __slots__ = ("client", "model", "INSTRUCTIONS", "selector_model")
+
+    def __init__(
+        self,
+        client,
+        model,
+        selector_model: Optional[str] = None,
+    ):
         self.client = client
         self.model = model
-        self.INSTRUCTIONS = PLANNER_INSTRUCTIONS
+        self.INSTRUCTIONS = get_planner_instructions()
+        self.selector_model = selector_model or model
+
+    def select_strategies(self, parent_task: str) -> FrozenSet[str]:
+        """
+        Asks the selector model to shortlist strategies for `parent_task` from the one-line
+        strategy index, so the Planner call carries only those catalog entries.
+        Falls back to keyword matching if the selection call fails.
+        """
+        try:
+            selection = self.client.call(
+                model=self.selector_model,
+                system_instruction=get_strategy_selector_instructions(),
+                user_prompt=_build_prompt_xml_style([("parent_task", parent_task)]),
+                schema=StrategySelection,
+            )
+            _log_agent_activity("PlannerAgent", "Selected Strategies", ", ".join(selection.strategies), color=BColors.OKCYAN)
+            return offered_strategies(selection.strategies)
+        except Exception as e:
+            _log_agent_activity("PlannerAgent", f"Strategy selection failed: {e}. Using keyword selection.", "", color=BColors.WARNING, level=LogLevel.WARNING)
+            return select_strategies(parent_task)
 
     def generate_plan(
         self,
         parent_task: str,
         review_guidance_str: Optional[str] = None,
+        action: Optional[str] = None,
+        excluded_strategies: Optional[List[str]] = None,
+        max_steps: Optional[int] = None,
     ) -> List[ExplorationPlan]:
         """
         Generates exploration plans based on the parent task and optional previous review guidance.
+        The guidance `action` picks the planning mode, and with it the specialized instructions.
+        On BROADEN, `excluded_strategies` are left out of the catalog the Planner sees.
+        `max_steps` caps the total number of steps across all plans.
 
         The user_prompt is constructed in an XML-like format:
 
@@ -118,50 +315,118 @@ class PlannerAgent:
         - Current DFS path summary for CONTINUE_DFS_PATH.
         </review_guidance>
 
-        Note: The <review_guidance> tag and its content are only included
-        if `review_guidance_str` is provided.
+        <plan_budget>Maximum total number of steps across all plans.</plan_budget>
+
+        Note: The <review_guidance> and <plan_budget> tags are only included
+        if `review_guidance_str` / `max_steps` are provided.
         ```
         """
         prompt_parts = [("parent_task", parent_task)]
         if review_guidance_str:
             prompt_parts.append(("review_guidance", review_guidance_str))
+        if max_steps:
+            prompt_parts.append(("plan_budget", str(max_steps)))
         user_prompt = _build_prompt_xml_style(prompt_parts)
 
         # _log_agent_activity("PlannerAgent", "Instructions (snippet)", self.INSTRUCTIONS, color=BColors.OKCYAN, snippet_length=500)
-        _log_agent_activity("PlannerAgent", "User Prompt", user_prompt)
+        _log_agent_activity("PlannerAgent", "User Prompt", user_prompt, level=LogLevel.DEBUG)
+
+        # Guided iterations (notably BROADEN) may need strategies outside the shortlist,
+        # so only the initial plan is restricted to it. DEEPEN/RETRY plans stay on a strategy
+        # already in play and only need the index to name it.
+        mode = PLANNER_MODES.get(action, "BFS")
+        if mode != "BFS":
+            strategy_catalog = build_strategy_index_catalog()
+        elif action == "BROADEN" and excluded_strategies:
+            strategy_catalog = build_strategies_section(filter_strategies(exclude=excluded_strategies))
+        elif review_guidance_str:
+            strategy_catalog = get_strategy_catalog()
+        else:
+            strategy_catalog = build_strategies_section(self.select_strategies(parent_task))
 
         try:
-            response: PlannerOut = self.client.planner_call(
-                self.model,
-                self.INSTRUCTIONS,
-                user_prompt,
-                schema=PlannerOut,
-            )
+            response = self._plan(get_planner_instructions(mode), user_prompt, strategy_catalog)
             _log_agent_activity("PlannerAgent", "Generating Exploration Plan...", "", color=BColors.OKCYAN)
             if response and response.exploration_plans:
-                _log_agent_activity("PlannerAgent", "Generated Plans", response.exploration_plans, color=BColors.OKGREEN, is_json=True)
+                _log_agent_activity("PlannerAgent", "Generated Plans", response.exploration_plans, color=BColors.OKGREEN, is_json=True, level=LogLevel.DEBUG)
                 return response.exploration_plans
             else:
-                _log_agent_activity("PlannerAgent", "Warning: Planner returned no exploration plans or an invalid response.", "", color=BColors.FAIL)
+                _log_agent_activity("PlannerAgent", "Warning: Planner returned no exploration plans or an invalid response.", "", color=BColors.FAIL, level=LogLevel.ERROR)
                 return []
         except Exception as e:
-            _log_agent_activity("PlannerAgent", f"Error: {e}. Returning empty plan.", "", color=BColors.FAIL)
+            _log_agent_activity("PlannerAgent", f"Error: {e}. Returning empty plan.", "", color=BColors.FAIL, level=LogLevel.ERROR)
             return []
 
+    @memoize_llm(
+        "planner",
+        key=lambda self, instructions, user_prompt, strategy_catalog: prompt_key(self.model, instructions, strategy_catalog, user_prompt),
+        dump=lambda response: response.model_dump_json(),
+        load=PlannerOut.model_validate_json,
+    )
+    def _plan(self, instructions: str, user_prompt: str, strategy_catalog: str) -> Optional[PlannerOut]:
+        """The Planner call; only responses that contain plans are returned, and so persisted."""
+        response: PlannerOut = self.client.planner_call(
+            self.model,
+            instructions,
+            user_prompt,
+            schema=PlannerOut,
+            shared_context=strategy_catalog,
+        )
+        return response if response and response.exploration_plans else None
+
 class ThinkerAgent:
-    def __init__(self, client, model):
+    __slots__ = ("client", "model", "cache", "INSTRUCTIONS", "_inflight", "_inflight_lock", "tools")
+
+    def __init__(self, client, model, cache: Optional[ThinkerCache] = None):
         self.client = client
         self.model = model
-        self.INSTRUCTIONS = THINKER_INSTRUCTIONS
+        self.cache = cache
+        self.INSTRUCTIONS = get_thinker_instructions()
+        # Calls currently running, keyed by prompt; identical concurrent steps wait on the first one.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.tools = _thinker_tools()
+
+    @staticmethod
+    def _shared_context(overall_parent_task_context: Optional[str]) -> Optional[str]:
+        if not overall_parent_task_context:
+            return None
+        return _build_prompt_xml_style([("overall_parent_task", overall_parent_task_context)])
+
+    @staticmethod
+    def _user_prompt(step_instructions: str, dependency_outputs_context: Optional[str]) -> str:
+        # Built once per step, so the fixed two-segment layout of _build_prompt_xml_style is
+        # written out as a single f-string rather than assembled from a fragment list.
+        step = f"<step_instructions>{step_instructions}</step_instructions>"
+        if not dependency_outputs_context:
+            return step
+        return f"<dependency_outputs>\n{dependency_outputs_context}\n</dependency_outputs>\n\n{step}"
+
+    def prime(self, overall_parent_task_context: Optional[str]) -> None:
+        """
+        Creates the cached prefix (instructions, tools, parent task) that every step of the run
+        shares, before the steps fan out, so concurrent calls don't each try to create it.
+        """
+        self.client.cache_content(
+            model=self.model,
+            text=self._shared_context(overall_parent_task_context),
+            system_instruction=self.INSTRUCTIONS,
+            tools=self.tools,
+        )
 
     def think(
         self,
         step_instructions: str,
         dependency_outputs_context: Optional[str] = None,
         overall_parent_task_context: Optional[str] = None,
+        strategy: Optional[str] = None,
     ) -> str:
         """
         Executes a specific task (a step in an exploration plan) using available tools.
+        When a cache is configured, an earlier response to the same prompt is reused instead of
+        calling the model; with the cache's semantic tier enabled, the step's plan `strategy`
+        also scopes reuse of responses to near-identical steps. A step whose
+        prompt is identical to one already in flight waits for that call instead of making its own.
         The ThinkerAgent's understanding comes from `step_instructions`,
         any `dependency_outputs_context`, and the `overall_parent_task_context` (if available).
 
@@ -184,44 +449,179 @@ class ThinkerAgent:
 
         Notes:
         - <overall_parent_task> is included if `overall_parent_task_context` is provided.
-        - <dependency_outputs> and its content are included if `dependency_outputs_context` is provided.
-          This context itself is pre-formatted as an XML string.
+        - <dependency_outputs> is included if `dependency_outputs_context` is provided.
+          That context holds the pre-formatted <output> elements.
         - <step_instructions> is always included.
-        - The segments are joined by double newlines.
+        - The segments are joined by double newlines, run-wide context first.
+        - <overall_parent_task> is identical for every step of a run, so it is sent as the
+          shared (cached) prefix together with the instructions and tools; only the remaining
+          segments are sent per step.
         ```
         """
-        prompt_elements = []
-        if overall_parent_task_context:
-            prompt_elements.append(f"<overall_parent_task>{overall_parent_task_context}</overall_parent_task>")
-        if dependency_outputs_context:
-            # Assuming dependency_outputs_context is already a well-formed XML string
-            prompt_elements.append(dependency_outputs_context)
-        prompt_elements.append(f"<step_instructions>{step_instructions}</step_instructions>")
-        
-        user_prompt = "\n\n".join(prompt_elements)
-
-        tools_to_use = [
-            Tool(google_search=GoogleSearch()),
-            types.Tool(code_execution=types.ToolCodeExecution()) # Added Code Execution
-        ]
+        shared_context = self._shared_context(overall_parent_task_context)
+        user_prompt = self._user_prompt(step_instructions, dependency_outputs_context)
+        key, call, shared = self._claim(shared_context, user_prompt)
+        if shared:
+            _log_agent_activity("ThinkerAgent", "Joining In-Flight Call", step_instructions, color=BColors.OKGREEN, level=LogLevel.DEBUG)
+        else:
+            self._fulfil(key, call, shared_context, user_prompt, step_instructions, dependency_outputs_context, overall_parent_task_context, strategy)
+        return call.result()
 
-        _log_agent_activity("ThinkerAgent", "User Prompt", user_prompt)
+    def submit(
+        self,
+        executor: ThreadPoolExecutor,
+        step_instructions: str,
+        dependency_outputs_context: Optional[str] = None,
+        overall_parent_task_context: Optional[str] = None,
+        strategy: Optional[str] = None,
+    ) -> Tuple[Future, bool]:
+        """
+        Non-blocking `think`: runs the step on `executor` and returns (future of its response,
+        shared). `shared` means an identical prompt was already in flight and the future is that
+        call's, so nothing is submitted. The claim is made on the calling thread, so identical
+        steps submitted back to back never both reach the model or both hold a worker.
+        """
+        shared_context = self._shared_context(overall_parent_task_context)
+        user_prompt = self._user_prompt(step_instructions, dependency_outputs_context)
+        key, call, shared = self._claim(shared_context, user_prompt)
+        if not shared:
+            try:
+                executor.submit(
+                    self._fulfil, key, call, shared_context, user_prompt,
+                    step_instructions, dependency_outputs_context, overall_parent_task_context, strategy,
+                )
+            except BaseException as e:
+                with self._inflight_lock:
+                    del self._inflight[key]
+                call.set_exception(e)
+        return call, shared
+
+    def _claim(self, shared_context: Optional[str], user_prompt: str) -> Tuple[str, Future, bool]:
+        """Returns (prompt key, future of the response, whether another call already owns it)."""
+        key = prompt_key(self.model, shared_context or "", user_prompt)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                return key, pending, True
+            self._inflight[key] = owned = Future()
+        return key, owned, False
+
+    def _fulfil(
+        self,
+        key: str,
+        call: Future,
+        shared_context: Optional[str],
+        user_prompt: str,
+        step_instructions: str,
+        dependency_outputs_context: Optional[str],
+        overall_parent_task_context: Optional[str],
+        strategy: Optional[str],
+    ) -> None:
+        """Answers the claimed `call` from the cache or the model, then releases the claim."""
+        _log_agent_activity("ThinkerAgent", "User Prompt", "\n\n".join(filter(None, [shared_context, user_prompt])), level=LogLevel.DEBUG)
+
+        chunks: List[str] = []
+        try:
+            cache_args = None
+            embedding = None
+            if self.cache:
+                cache_args = (self.model, strategy, overall_parent_task_context or "", step_instructions, dependency_outputs_context)
+                cached_response, embedding = self.cache.get(*cache_args)
+                if cached_response is not None:
+                    _log_agent_activity("ThinkerAgent", "Reusing Cached Response", cached_response, color=BColors.OKGREEN, level=LogLevel.DEBUG)
+                    call.set_result(cached_response)
+                    return
+
+            # Chunks are logged as they arrive (at DEBUG; concurrent steps are told apart by
+            # prompt key), and whatever arrived is kept in the log if the stream breaks off.
+            for text in self.client.thinker_call_stream(
+                model=self.model,
+                instructions=self.INSTRUCTIONS,
+                user_prompt=user_prompt,
+                tools=self.tools,
+                shared_context=shared_context,
+            ):
+                chunks.append(text)
+                _log_agent_activity("ThinkerAgent", f"Partial Response [{key[:8]}]", text, level=LogLevel.DEBUG)
+            response_str = "".join(chunks).strip()
+            _log_agent_activity("ThinkerAgent", f"Full Response [{key[:8]}]", response_str, color=BColors.OKGREEN, level=LogLevel.DEBUG)
+            if cache_args and response_str:
+                self.cache.put(*cache_args, response_str, embedding)
+            call.set_result(response_str)
+        except BaseException as e:
+            if chunks:
+                _log_agent_activity(
+                    "ThinkerAgent",
+                    f"Stream interrupted [{key[:8]}]: {e}. Partial response",
+                    "".join(chunks),
+                    color=BColors.FAIL,
+                    level=LogLevel.WARNING,
+                )
+            call.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
-        response = self.client.thinker_call(
-            model=self.model,
-            instructions=self.INSTRUCTIONS,
-            user_prompt=user_prompt,
-            tools=tools_to_use,
+    def think_batch(
+        self,
+        steps: List[Tuple[str, Optional[str], Optional[str]]],
+        overall_parent_task_context: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Batch-mode counterpart of `think` for independent steps, each given as
+        (step_instructions, dependency_outputs_context, strategy). Cache hits are answered
+        directly; the rest go to the model as one batch job (a lone miss is sent realtime), and
+        any step the job fails to answer is retried through `think`. Responses are returned in
+        step order.
+        """
+        shared_context = self._shared_context(overall_parent_task_context)
+        responses: List[Optional[str]] = [None] * len(steps)
+        misses: List[Tuple[int, Optional[tuple], Optional[List[float]]]] = []
+        for i, (step_instructions, dependency_outputs_context, strategy) in enumerate(steps):
+            cache_args, embedding = None, None
+            if self.cache:
+                cache_args = (self.model, strategy, overall_parent_task_context or "", step_instructions, dependency_outputs_context)
+                responses[i], embedding = self.cache.get(*cache_args)
+            if responses[i] is None:
+                misses.append((i, cache_args, embedding))
+        if not misses:
+            return responses
+        if len(misses) == 1:
+            # A one-request job would only add the batch queue's minutes of latency.
+            i = misses[0][0]
+            step_instructions, dependency_outputs_context, strategy = steps[i]
+            responses[i] = self.think(step_instructions, dependency_outputs_context, overall_parent_task_context, strategy)
+            return responses
+
+        _log_agent_activity("ThinkerAgent", f"Submitting batch of {len(misses)} steps", "", color=BColors.OKCYAN)
+        batch_results = self.client.thinker_batch_call(
+            self.model,
+            self.INSTRUCTIONS,
+            [self._user_prompt(steps[i][0], steps[i][1]) for i, _, _ in misses],
+            tools=self.tools,
+            shared_context=shared_context,
         )
-        response_str = response.strip() if isinstance(response, str) else str(response)
-        _log_agent_activity("ThinkerAgent", "Full Response", response_str, color=BColors.OKGREEN)
-        return response_str
+        for (i, cache_args, embedding), result in zip(misses, batch_results):
+            if result is None:
+                step_instructions, dependency_outputs_context, strategy = steps[i]
+                responses[i] = self.think(step_instructions, dependency_outputs_context, overall_parent_task_context, strategy)
+                continue
+            responses[i] = result.strip()
+            if cache_args and responses[i]:
+                self.cache.put(*cache_args, responses[i], embedding)
+        return responses
 
 class ReviewerAgent:
+    __slots__ = ("client", "model", "INSTRUCTIONS")
+
     def __init__(self, client, model):
         self.client = client
         self.model = model
-        self.INSTRUCTIONS = REVIEWER_INSTRUCTIONS
+        self.INSTRUCTIONS = get_reviewer_instructions()
+
+    def prime(self) -> None:
+        """Creates or extends the cached prefix (instructions + strategy catalog) every review call sends."""
+        self.client.cache_content(model=self.model, text=get_strategy_catalog(), system_instruction=self.INSTRUCTIONS)
 
     def review(
         self,
@@ -230,6 +630,7 @@ class ReviewerAgent:
         current_iteration: int,
         iterations_no_progress: int,
         STAGNATION_THRESHOLD: int,
+        iterations_remaining: Optional[int] = None,
     ) -> ReviewerOut:
         """
         Reviews the outcomes of the current iteration's exploration plans and provides guidance.
@@ -239,16 +640,20 @@ class ReviewerAgent:
         ```
         <parent_task>The main goal or problem to be solved.</parent_task>
 
-        <current_iteration>Integer representing the current cycle number (e.g., 1, 2, 3...).</current_iteration>
-
         <STAGNATION_THRESHOLD>
         Integer threshold for determining stagnation (e.g., 2 or 3 iterations without progress).
         </STAGNATION_THRESHOLD>
 
+        <current_iteration>Integer representing the current cycle number (e.g., 1, 2, 3...).</current_iteration>
+
         <iterations_no_progress>
         Integer count of iterations since the last time significant progress (new context gems) was made.
         </iterations_no_progress>
 
+        <iterations_remaining>
+        Integer count of iterations left before the run stops regardless; omitted if not given.
+        </iterations_remaining>
+
         <plans_with_responses>
         A JSON string representing a list of ExplorationPlan objects, including their steps and responses.
         Example structure:
@@ -276,38 +681,36 @@ class ReviewerAgent:
         </plans_with_responses>
         ```
         """
-        plans_json = json.dumps(
-            [p.model_dump(exclude_none=True) for p in plans_with_responses], indent=2
-        )
+        # The Reviewer only selects steps by id, so it reads deduplicated, compressed responses;
+        # the full text stays in the plans the Synthesizer later draws from.
+        reviewer_view = compress_responses(dedupe_responses(plans_with_responses))
+        # Compact JSON: the Reviewer parses it, and indentation alone is a sizable share of the tokens.
+        plans_json = _PLANS_ADAPTER.dump_json(reviewer_view, exclude_none=True).decode()
 
         prompt_parts = [
             ("parent_task", parent_task),
-            ("current_iteration", str(current_iteration)),
             ("STAGNATION_THRESHOLD", str(STAGNATION_THRESHOLD)),
+            ("current_iteration", str(current_iteration)),
             ("iterations_no_progress", str(iterations_no_progress)),
+            ("iterations_remaining", None if iterations_remaining is None else str(iterations_remaining)),
             ("plans_with_responses", plans_json),
         ]
         user_prompt = _build_prompt_xml_style(prompt_parts)
 
         # _log_agent_activity("ReviewerAgent", "Instructions (snippet)", self.INSTRUCTIONS, color=BColors.OKCYAN, snippet_length=500)
-        _log_agent_activity("ReviewerAgent", "User Prompt", user_prompt)
+        _log_agent_activity("ReviewerAgent", f"User Prompt (~{len(user_prompt) // 4} tokens)", user_prompt, level=LogLevel.DEBUG)
         
         try:
-            response: ReviewerOut = self.client.reviewer_call(
-                self.model,
-                self.INSTRUCTIONS,
-                user_prompt,
-                schema=ReviewerOut,
-            )
+            response = self._review(user_prompt)
             _log_agent_activity("ReviewerAgent", "Evaluating progress...", "", color=BColors.OKCYAN)
             if not isinstance(response, ReviewerOut):
                 raise ValueError(
                     f"Reviewer did not return a valid ReviewerOut object. Got: {type(response)}"
                 )
-            _log_agent_activity("ReviewerAgent", "Reviewer Output", response, color=BColors.OKGREEN, is_json=True)
+            _log_agent_activity("ReviewerAgent", "Reviewer Output", response, color=BColors.OKGREEN, is_json=True, level=LogLevel.DEBUG)
             return response
         except Exception as e:
-            _log_agent_activity("ReviewerAgent", f"Error: {e}. Defaulting to HALT_NO_FEASIBLE_PATH.", "", color=BColors.FAIL)
+            _log_agent_activity("ReviewerAgent", f"Error: {e}. Defaulting to HALT_NO_FEASIBLE_PATH.", "", color=BColors.FAIL, level=LogLevel.ERROR)
             default_guidance = NextIterationGuidance(
                 action="HALT_NO_FEASIBLE_PATH",
                 reasoning=f"Error during review processing: {type(e).__name__} - {str(e)}",
@@ -319,11 +722,29 @@ class ReviewerAgent:
                 next_iteration_guidance=default_guidance,
             )
 
+    @memoize_llm(
+        "reviewer",
+        key=lambda self, user_prompt: prompt_key(self.model, self.INSTRUCTIONS, get_strategy_catalog(), user_prompt),
+        dump=lambda response: response.model_dump_json(),
+        load=ReviewerOut.model_validate_json,
+    )
+    def _review(self, user_prompt: str) -> ReviewerOut:
+        """The Reviewer call; a review of byte-identical iteration results is reused as is."""
+        return self.client.reviewer_call(
+            self.model,
+            self.INSTRUCTIONS,
+            user_prompt,
+            schema=ReviewerOut,
+            shared_context=get_strategy_catalog(),
+        )
+
 class SynthesizerAgent:
+    __slots__ = ("client", "model", "INSTRUCTIONS")
+
     def __init__(self, client, model):
         self.client = client
         self.model = model
-        self.INSTRUCTIONS = SYNTHESIZER_INSTRUCTIONS
+        self.INSTRUCTIONS = get_synthesizer_instructions()
 
     def synthesize(
         self, parent_task: str, full_history: List[Dict[str, Any]]
@@ -361,7 +782,9 @@ class SynthesizerAgent:
         Notes:
         - <parent_task> is always included.
         - <process_history> contains a structured text summary of each iteration,
-          including plans, responses, and reviewer feedback.
+          including plans, responses, and reviewer feedback. Iterations older than
+          Orchestrator.RAW_HISTORY_ITERATIONS list only their step ids ("Steps Run: A.A1, ...")
+          in place of "Plans & Responses".
         - <selected_step_responses> is included if the final review identified specific step
           responses (ContextSelection) to be used for synthesis. It contains the actual text
           of those selected responses.
@@ -385,147 +808,183 @@ class SynthesizerAgent:
             user_prompt = _build_prompt_xml_style(prompt_parts)
 
         # _log_agent_activity("SynthesizerAgent", "Instructions (snippet)", self.INSTRUCTIONS, color=BColors.OKCYAN, snippet_length=500)
-        _log_agent_activity("SynthesizerAgent", "User Prompt", user_prompt)
+        _log_agent_activity("SynthesizerAgent", f"User Prompt (~{len(user_prompt) // 4} tokens)", user_prompt, level=LogLevel.DEBUG)
+
+        _log_agent_activity("SynthesizerAgent", "Generating Final Solution...", "", color=BColors.OKCYAN)
+        response_str = self._generate(user_prompt)
+        _log_agent_activity("SynthesizerAgent", "Final Solution", response_str, color=BColors.OKGREEN)
+        return response_str
 
+    @memoize_synth(key=lambda self, user_prompt: prompt_key(self.model, self.INSTRUCTIONS, user_prompt))
+    def _generate(self, user_prompt: str) -> str:
+        """Returns the final answer for `user_prompt`; an identical earlier synthesis is reused as is."""
         response = self.client.synthesizer_call(
             self.model,
             self.INSTRUCTIONS,
             user_prompt,
         )
-        _log_agent_activity("SynthesizerAgent", "Generating Final Solution...", "", color=BColors.OKCYAN)
-        response_str = response.strip() if isinstance(response, str) else str(response)
-        _log_agent_activity("SynthesizerAgent", "Final Solution", response_str, color=BColors.OKGREEN)
-        return response_str
+        return response.strip() if isinstance(response, str) else str(response)
+
+    @staticmethod
+    def index_responses(cycle: Dict[str, Any]) -> Dict[str, str]:
+        """Maps "PLAN_ID.STEP_ID" to the step's response for one history entry; frozen once appended."""
+        return {
+            f"{plan_obj.plan_id}.{step_obj.step_id}": step_obj.response or "N/A"
+            for plan_obj in cycle.get('plans_with_responses', [])
+            for step_obj in plan_obj.steps
+        }
+
+    @staticmethod
+    def render_iteration(iteration_number: int, cycle: Dict[str, Any]) -> str:
+        """Renders one history entry; the text depends only on that entry, so it can be frozen once appended."""
+        cycle_summary = f"--- Iteration {iteration_number} ---\n"
+        if 'plans_with_responses' in cycle:
+            plans_json = _PLANS_ADAPTER.dump_json(cycle['plans_with_responses'], exclude_none=True).decode()
+            cycle_summary += f"Plans & Responses: {plans_json}\n"
+        else:
+            # A trimmed entry: its responses live on only in `step_responses`.
+            cycle_summary += f"Steps Run: {', '.join(cycle.get('step_responses') or {}) or 'N/A'}\n"
+
+        review_obj: Optional[ReviewerOut] = cycle.get('review')
+        if review_obj:
+            cycle_summary += f"Review Assessment for this Iteration: {review_obj.iteration_assessment}\n"
+            if review_obj.next_iteration_guidance:
+                cycle_summary += f"Reviewer Guidance Action for Next Iteration: {review_obj.next_iteration_guidance.action}\n"
+                cycle_summary += f"Reviewer Reasoning: {review_obj.next_iteration_guidance.reasoning}\n"
+        else:
+            cycle_summary += "Review: N/A\n"
+        return cycle_summary
+
+    @staticmethod
+    def _build_process_history(full_history: List[Dict[str, Any]]) -> Tuple[str, Optional[List[ContextSelection]]]:
+        # Iterations are append-only: blocks rendered when they were recorded (`summary`) are
+        # reused verbatim, so the history is an unchanged prefix plus the newest block.
+        history_summary_parts = [
+            cycle.get('summary') or SynthesizerAgent.render_iteration(i + 1, cycle)
+            for i, cycle in enumerate(full_history)
+        ]
+        final_review: Optional[ReviewerOut] = full_history[-1].get('review') if full_history else None
+        final_selected_context = final_review.selected_context if final_review else None
 
-    def _build_process_history(self, full_history: List[Dict[str, Any]]) -> Tuple[str, Optional[List[ContextSelection]]]:
-        history_summary_parts = []
-        final_selected_context: Optional[List[ContextSelection]] = None
-
-        for i, cycle in enumerate(full_history):
-            cycle_summary = f"--- Iteration {i+1} ---\n"
-            plans_with_responses_obj: List[ExplorationPlan] = cycle.get('plans_with_responses', [])
-            plans_data_for_json = [p.model_dump(exclude_none=True) for p in plans_with_responses_obj]
-            cycle_summary += f"Plans & Responses: {json.dumps(plans_data_for_json, indent=1)}\n"
-
-            review_obj: Optional[ReviewerOut] = cycle.get('review')
-            if review_obj:
-                cycle_summary += f"Review Assessment for this Iteration: {review_obj.iteration_assessment}\n"
-                if review_obj.next_iteration_guidance:
-                    cycle_summary += f"Reviewer Guidance Action for Next Iteration: {review_obj.next_iteration_guidance.action}\n"
-                    cycle_summary += f"Reviewer Reasoning: {review_obj.next_iteration_guidance.reasoning}\n"
-                if i == len(full_history) - 1:
-                    final_selected_context = review_obj.selected_context
-            else:
-                cycle_summary += "Review: N/A\n"
-            history_summary_parts.append(cycle_summary)
-        
         return "\n".join(history_summary_parts), final_selected_context
 
+    @staticmethod
     def _build_selected_responses_segment(
-        self, 
         final_selected_context: Optional[List[ContextSelection]], 
         full_history: List[Dict[str, Any]]
     ) -> Optional[str]:
         if not final_selected_context:
             return None
 
-        all_step_responses: Dict[str, str] = {}
-        for cycle_data in full_history:
-            plans_obj_list: List[ExplorationPlan] = cycle_data.get('plans_with_responses', [])
-            for plan_obj in plans_obj_list:
-                for step_obj in plan_obj.steps:
-                    key = f"{plan_obj.plan_id}.{step_obj.step_id}"
-                    all_step_responses[key] = step_obj.response or "N/A"
-        
+        # Later iterations win when a plan/step id is reused, as in a left-to-right merge.
+        all_step_responses = ChainMap(*(
+            cycle_data.get('step_responses') or SynthesizerAgent.index_responses(cycle_data)
+            for cycle_data in reversed(full_history)
+        ))
+
         selected_responses_parts = ["<selected_step_responses>"]
         for selection_group in final_selected_context:
             plan_id = selection_group.plan_id
             for step_id in selection_group.step_ids:
                 q_step_id = f"{plan_id}.{step_id}"
-                response_text = all_step_responses.get(q_step_id, "Response not found for this step in history.")
-                selected_responses_parts.append(
-                    f'<step_response plan_id="{plan_id}" step_id="{step_id}">\n{response_text}\n</step_response>'
-                )
+                response_text = all_step_responses.get(q_step_id)
+                if not response_text or response_text == "N/A":
+                    # Placeholders carry no content for the Synthesizer; leave the step out.
+                    continue
+                selected_responses_parts.extend((
+                    f'<step_response plan_id="{plan_id}" step_id="{step_id}">', response_text, '</step_response>'
+                ))
         selected_responses_parts.append("</selected_step_responses>")
         
         return "\n".join(selected_responses_parts) if len(selected_responses_parts) > 2 else None
 
-    def synthesize(
-        self, parent_task: str, full_history: List[Dict[str, Any]]
-    ) -> str:
-        process_history_str, final_selected_context = self._build_process_history(full_history)
-        
-        prompt_parts = [
-            ("parent_task", parent_task),
-            ("process_history", f"\n{process_history_str}\n"),
-        ]
-
-        selected_responses_segment = self._build_selected_responses_segment(final_selected_context, full_history)
-        if selected_responses_segment:
-            user_prompt = "\n\n".join([
-                _build_prompt_xml_style(prompt_parts),
-                selected_responses_segment
-            ])
-        else:
-            user_prompt = _build_prompt_xml_style(prompt_parts)
-
-        # _log_agent_activity("SynthesizerAgent", "Instructions (snippet)", self.INSTRUCTIONS, color=BColors.OKCYAN, snippet_length=500)
-        _log_agent_activity("SynthesizerAgent", "User Prompt", user_prompt)
-
-        response = self.client.synthesizer_call(
-            self.model,
-            self.INSTRUCTIONS,
-            user_prompt,
-        )
-        _log_agent_activity("SynthesizerAgent", "Generating Final Solution...", "", color=BColors.OKCYAN)
-        response_str = response.strip() if isinstance(response, str) else str(response)
-        _log_agent_activity("SynthesizerAgent", "Final Solution", response_str, color=BColors.OKGREEN)
-        return response_str
-
 class Orchestrator:
     MAX_ITERATIONS = 7
+    MAX_CONCURRENT_THINKER_CALLS = 8
+    THINKER_CACHE_TTL_SECONDS = 24 * 3600
+    # Also reuse answers of steps that only embed close to an earlier step (see ThinkerCache).
+    THINKER_SEMANTIC_CACHE = False
     STAGNATION_THRESHOLD = 2
+    # Send each dependency level of steps as one discounted batch job instead of realtime calls.
+    # Batch jobs take minutes, so this is for runs nobody is watching.
+    BATCH_MODE = False
+    # Iterations whose plan objects, and the plans JSON in their summary, stay in the history.
+    # Older cycles keep a summary listing only their step ids, plus the step-response index,
+    # so each of their responses is held once.
+    RAW_HISTORY_ITERATIONS = 2
+
+    # Step budget for the Planner: the Synthesizer reads every iteration's outputs, so each
+    # iteration gets an equal share of the context that remains, capped per iteration.
+    SYNTHESIZER_CONTEXT_TOKENS = 1_000_000
+    ITERATION_OUTPUT_BUDGET_TOKENS = 40_000
+    EXPECTED_STEP_OUTPUT_TOKENS = 2_000
+    CHARS_PER_TOKEN = 4
+
+    # Model per agent. The Reviewer selects and classifies existing step outputs rather than
+    # generating long answers, so it runs on the cheapest tier.
+    PLANNER_MODEL = "gemini-2.5-flash-preview-05-20"
+    STRATEGY_SELECTOR_MODEL = "gemini-2.0-flash-lite"
+    THINKER_MODEL = "gemini-2.5-flash-preview-05-20"
+    REVIEWER_MODEL = "gemini-2.0-flash-lite"
+    SYNTHESIZER_MODEL = "gemini-2.5-flash-preview-05-20"
+    #SYNTHESIZER_MODEL = "gemini-2.5-pro-preview-05-06"
 
     def __init__(
         self,
         api_key: str,
         max_iterations: Optional[int] = None,
         stagnation_threshold: Optional[int] = None,
+        batch_mode: Optional[bool] = None,
+        max_concurrent_thinker_calls: Optional[int] = None,
     ):
+        from app.client import Client
+
         self.client = Client(api_key=api_key)
-        model = "gemini-2.5-flash-preview-05-20"
-        #model = "gemini-2.5-pro-preview-05-06"
-        self.planner = PlannerAgent(self.client, model)
-        self.thinker = ThinkerAgent(self.client, model)
-        self.reviewer = ReviewerAgent(self.client, model)
-        self.synthesizer = SynthesizerAgent(self.client, model)
+        self.planner = PlannerAgent(
+            self.client,
+            self.PLANNER_MODEL,
+            selector_model=self.STRATEGY_SELECTOR_MODEL,
+        )
+        self.thinker = ThinkerAgent(
+            self.client,
+            self.THINKER_MODEL,
+            cache=ThinkerCache(
+                embed=lambda text: self.client.embed([text])[0],
+                embed_batch=self.client.embed,
+                store=PromptCache(os.path.join(CACHE_DIR, "thinker.sqlite3")),
+                ttl_seconds=self.THINKER_CACHE_TTL_SECONDS,
+                semantic=self.THINKER_SEMANTIC_CACHE,
+            ),
+        )
+        self.reviewer = ReviewerAgent(self.client, self.REVIEWER_MODEL)
+        self.synthesizer = SynthesizerAgent(self.client, self.SYNTHESIZER_MODEL)
+        # Runs cache-prefix setup for the next stage while the current one waits on its model call.
+        self._prefetch = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+        # (plan_id, step_id) -> (instructions, response) of the latest recorded run of each step.
+        self._step_index: Dict[Tuple[str, str], Tuple[str, str]] = {}
 
         if max_iterations is not None:
             self.MAX_ITERATIONS = max_iterations
         if stagnation_threshold is not None:
             self.STAGNATION_THRESHOLD = stagnation_threshold
+        if batch_mode is not None:
+            self.BATCH_MODE = batch_mode
+        if max_concurrent_thinker_calls is not None:
+            self.MAX_CONCURRENT_THINKER_CALLS = max_concurrent_thinker_calls
 
-    def _get_step_details_from_history(
-        self, plan_id: str, step_id: str, full_history: List[Dict[str, Any]]
-    ) -> Dict[str, Optional[str]]:
-        details = {"original_instruction": None, "previous_output": None}
-        if not full_history:
-            return details
-        for hist_item in reversed(full_history):
-            plans_with_responses: List[ExplorationPlan] = hist_item.get('plans_with_responses', [])
-            for p_hist in plans_with_responses:
-                if p_hist.plan_id == plan_id:
-                    for s_hist in p_hist.steps:
-                        if s_hist.step_id == step_id:
-                            details["original_instruction"] = s_hist.instructions
-                            details["previous_output"] = s_hist.response or "No response recorded."
-                            return details
-        return details
+    def _index_steps(self, plans_with_responses: List[ExplorationPlan]) -> None:
+        # Later iterations overwrite earlier ones, so lookups see the most recent run of a step.
+        for plan in plans_with_responses:
+            for step in plan.steps:
+                self._step_index[(plan.plan_id, step.step_id)] = (step.instructions, step.response or "No response recorded.")
+
+    def _get_step_details_from_history(self, plan_id: str, step_id: str) -> Dict[str, Optional[str]]:
+        instruction, output = self._step_index.get((plan_id, step_id), (None, None))
+        return {"original_instruction": instruction, "previous_output": output}
 
     def _prepare_planner_guidance_prompt(
         self,
         previous_review_guidance: Optional[NextIterationGuidance],
-        full_history: List[Dict[str, Any]],
     ) -> Optional[str]:
         if not previous_review_guidance:
             return None
@@ -545,7 +1004,6 @@ class Orchestrator:
                 step_details = self._get_step_details_from_history(
                     previous_review_guidance.target_plan_id,
                     previous_review_guidance.target_step_id,
-                    full_history,
                 )
                 if action in ["DEEPEN", "CONTINUE_DFS_PATH"]:
                     guidance_text_parts.append(f"Previous output of target step: {step_details['previous_output'] or 'Not available'}")
@@ -569,6 +1027,125 @@ class Orchestrator:
         
         return "\n".join(guidance_text_parts)
 
+    @staticmethod
+    def _render_output(plan_obj: ExplorationPlan, step_obj: PlanStep) -> str:
+        return (
+            f'  <output plan_id="{plan_obj.plan_id}" step_id="{step_obj.step_id}">\n'
+            f'    {step_obj.response or "No response recorded."}\n  </output>'
+        )
+
+    def _run_step_levels(
+        self,
+        runnable_steps: List[Tuple[str, ExplorationPlan, PlanStep]],
+        parent_task: str,
+    ) -> None:
+        """
+        Batch-mode executor: groups steps by dependency depth and sends each level as one
+        batch job, so a level waits on its slowest step. Steps of a level with the same
+        instructions and dependency outputs (plans often overlap) are sent once.
+        `runnable_steps` must list each step after all of its dependencies.
+        """
+        depth: Dict[str, int] = {}
+        levels: List[List[Tuple[str, ExplorationPlan, PlanStep]]] = []
+        for step_qname, plan_obj, step_obj in runnable_steps:
+            depth[step_qname] = max((depth[d] + 1 for d in step_obj.dependencies or []), default=0)
+            if depth[step_qname] == len(levels):
+                levels.append([])
+            levels[depth[step_qname]].append((step_qname, plan_obj, step_obj))
+
+        rendered_outputs: Dict[str, str] = {}
+        shared_count = 0
+        for level in levels:
+            # (instructions, dependency outputs) -> index of the batch entry answering it.
+            call_index: Dict[Tuple[str, Optional[str]], int] = {}
+            calls: List[Tuple[str, Optional[str], Optional[str]]] = []
+            step_calls: List[int] = []
+            for _, plan_obj, step_obj in level:
+                dependency_outputs_context_str = (
+                    "\n".join(rendered_outputs[d] for d in step_obj.dependencies) if step_obj.dependencies else None
+                )
+                call_key = (step_obj.instructions, dependency_outputs_context_str)
+                if call_key not in call_index:
+                    call_index[call_key] = len(calls)
+                    calls.append((step_obj.instructions, dependency_outputs_context_str, plan_obj.strategy))
+                step_calls.append(call_index[call_key])
+
+            shared_count += len(level) - len(calls)
+            responses = self.thinker.think_batch(calls, overall_parent_task_context=parent_task)
+            for (step_qname, plan_obj, step_obj), i in zip(level, step_calls):
+                step_obj.response = responses[i]
+                rendered_outputs[step_qname] = self._render_output(plan_obj, step_obj)
+        self._log_shared_steps(shared_count)
+
+    @staticmethod
+    def _log_shared_steps(shared_count: int) -> None:
+        if shared_count:
+            _log_agent_activity(
+                "Pipeline",
+                f"{shared_count} duplicate steps shared another step's Thinker call",
+                "",
+                color=BColors.OKCYAN,
+            )
+
+    async def _run_step_graph(
+        self,
+        runnable_steps: List[Tuple[str, ExplorationPlan, PlanStep]],
+        parent_task: str,
+    ) -> None:
+        """
+        Runs every step as soon as its own dependencies have finished, so latency follows the
+        plan's critical path rather than its number of dependency levels.
+        `runnable_steps` must list each step after all of its dependencies.
+
+        Thinker calls block on HTTP, so they get their own pool rather than the default executor,
+        whose CPU-derived size would serialize wide iterations on small hosts. The pool size,
+        capped at MAX_CONCURRENT_THINKER_CALLS, bounds the calls in flight; steps still waiting
+        on dependencies do not hold a thread.
+        """
+        step_tasks: Dict[str, asyncio.Task] = {}
+        # Each finished step's <output> element, rendered once and shared by all of its dependents.
+        rendered_outputs: Dict[str, str] = {}
+        shared_count = 0
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(runnable_steps), self.MAX_CONCURRENT_THINKER_CALLS)),
+            thread_name_prefix="thinker",
+        )
+
+        async def run_step(step_qname: str, plan_obj: ExplorationPlan, step_obj: PlanStep) -> None:
+            nonlocal shared_count
+            await asyncio.gather(*(step_tasks[d] for d in (step_obj.dependencies or [])))
+
+            _log_agent_activity(
+                "ThinkerAgent",
+                f"Processing -> Plan {plan_obj.plan_id}-{step_obj.step_id}",
+                step_obj.instructions,
+                color=BColors.OKCYAN,
+                snippet_length=100
+            )
+
+            dependency_outputs_context_str = (
+                "\n".join(rendered_outputs[d] for d in step_obj.dependencies) if step_obj.dependencies else None
+            )
+
+            # Always pass the parent_task to the thinker. A step identical to one in flight
+            # (plans often overlap) awaits that call here instead of taking a worker thread.
+            call, shared = self.thinker.submit(
+                executor,
+                step_instructions=step_obj.instructions,
+                dependency_outputs_context=dependency_outputs_context_str,
+                overall_parent_task_context=parent_task,
+                strategy=plan_obj.strategy,
+            )
+            shared_count += shared
+            step_obj.response = await asyncio.wrap_future(call)
+            rendered_outputs[step_qname] = self._render_output(plan_obj, step_obj)
+
+        with executor:
+            for step_qname, plan_obj, step_obj in runnable_steps:
+                step_tasks[step_qname] = asyncio.create_task(run_step(step_qname, plan_obj, step_obj))
+            await asyncio.gather(*step_tasks.values())
+        self._log_shared_steps(shared_count)
+
     def _execute_exploration_steps(
         self,
         exploration_plans: List[ExplorationPlan],
@@ -583,77 +1160,62 @@ class Orchestrator:
             for step_obj in plan_obj.steps
         ]
 
-        completed_step_outputs: Dict[str, str] = {}
-        executed_step_qnames: Set[str] = set()
-        max_passes = len(all_steps_to_process)
-
-        for pass_num in range(max_passes + 1):
-            executed_in_this_pass = 0
-            if len(executed_step_qnames) == len(all_steps_to_process):
-                break
-
-            for plan_obj, step_obj in all_steps_to_process:
-                step_qname = f"{plan_obj.plan_id}.{step_obj.step_id}"
-                if step_qname in executed_step_qnames:
-                    continue
+        # Order the dependency graph up front with Kahn's algorithm. Steps never reaching
+        # indegree 0 depend on something missing or circular (or reuse an id) and never run.
+        steps_by_qname: Dict[str, Tuple[ExplorationPlan, PlanStep]] = {}
+        for plan_obj, step_obj in all_steps_to_process:
+            steps_by_qname.setdefault(f"{plan_obj.plan_id}.{step_obj.step_id}", (plan_obj, step_obj))
+
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+        for step_qname, (_, step_obj) in steps_by_qname.items():
+            dependencies = set(step_obj.dependencies or [])
+            indegree[step_qname] = len(dependencies)
+            for dep_qname in dependencies:
+                dependents.setdefault(dep_qname, []).append(step_qname)
+
+        ready = deque(step_qname for step_qname, degree in indegree.items() if degree == 0)
+        runnable_steps: List[Tuple[str, ExplorationPlan, PlanStep]] = []
+        # Insertion-ordered, so whatever is left reports in plan order.
+        pending = dict.fromkeys(steps_by_qname)
+        while ready:
+            step_qname = ready.popleft()
+            runnable_steps.append((step_qname, *steps_by_qname[step_qname]))
+            del pending[step_qname]
+            for child_qname in dependents.get(step_qname, []):
+                indegree[child_qname] -= 1
+                if indegree[child_qname] == 0:
+                    ready.append(child_qname)
+
+        if len(runnable_steps) < len(all_steps_to_process):
+            pending_qnames = list(pending)
+            _log_agent_activity(
+                "Pipeline",
+                f"Error: Some steps cannot be executed. Possible circular dependency or unmet/invalid dependency. Pending: {pending_qnames}",
+                "",
+                color=BColors.FAIL,
+                level=LogLevel.ERROR,
+            )
 
-                dependencies_met = all(
-                    dep_qname in completed_step_outputs
-                    for dep_qname in (step_obj.dependencies or [])
-                )
+        if runnable_steps and self.thinker.cache:
+            # One embedding request for the whole wave instead of one per step's cache lookup.
+            self.thinker.cache.prefetch_steps(
+                parent_task, [step_obj.instructions for _, plan_obj, step_obj in runnable_steps if plan_obj.strategy]
+            )
 
-                if dependencies_met:
-                    _log_agent_activity(
-                        "ThinkerAgent",
-                        f"Processing -> Plan {plan_obj.plan_id}-{step_obj.step_id}",
-                        step_obj.instructions,
-                        color=BColors.OKCYAN,
-                        snippet_length=100
-                    )
-
-                    dependency_outputs_context_str = ""
-                    if step_obj.dependencies:
-                        dep_outputs_xml_parts = ["<dependency_outputs>"]
-                        for dep_qname in step_obj.dependencies:
-                            p_id, s_id = dep_qname.split('.', 1)
-                            dep_output_content = completed_step_outputs.get(dep_qname, "Error: Dependency output not found!")
-                            dep_outputs_xml_parts.append(
-                                f'  <output plan_id="{p_id}" step_id="{s_id}">\n    {dep_output_content}\n  </output>'
-                            )
-                        dep_outputs_xml_parts.append("</dependency_outputs>")
-                        dependency_outputs_context_str = "\n".join(dep_outputs_xml_parts)
-                    
-                    # Always pass the parent_task to the thinker
-                    step_obj.response = self.thinker.think(
-                        step_instructions=step_obj.instructions,
-                        dependency_outputs_context=dependency_outputs_context_str if step_obj.dependencies else None,
-                        overall_parent_task_context=parent_task
-                    )
-                    completed_step_outputs[step_qname] = step_obj.response or "No response recorded."
-                    executed_step_qnames.add(step_qname)
-                    executed_in_this_pass += 1
-
-            if pass_num > 0 and executed_in_this_pass == 0 and len(executed_step_qnames) < len(all_steps_to_process):
-                pending_qnames = [
-                    f"{p.plan_id}.{s.step_id}"
-                    for p, s in all_steps_to_process
-                    if f"{p.plan_id}.{s.step_id}" not in executed_step_qnames
-                ]
-                _log_agent_activity(
-                    "Pipeline",
-                    f"Error: Could not execute any more steps in pass {pass_num}. Possible circular dependency or unmet/invalid dependency. Pending: {pending_qnames}",
-                    "",
-                    color=BColors.FAIL
-                )
-                break
+        if runnable_steps and self.BATCH_MODE:
+            self._run_step_levels(runnable_steps, parent_task)
+        elif runnable_steps:
+            asyncio.run(self._run_step_graph(runnable_steps, parent_task))
 
-        if len(executed_step_qnames) < len(all_steps_to_process):
-            unexecuted_count = len(all_steps_to_process) - len(executed_step_qnames)
+        if len(runnable_steps) < len(all_steps_to_process):
+            unexecuted_count = len(all_steps_to_process) - len(runnable_steps)
             _log_agent_activity(
                 "Pipeline",
                 f"Warning: Not all steps were executed. {unexecuted_count} steps remain pending.",
                 "",
-                color=BColors.WARNING
+                color=BColors.WARNING,
+                level=LogLevel.WARNING,
             )
         elif all_steps_to_process:
             _log_agent_activity(
@@ -665,24 +1227,43 @@ class Orchestrator:
 
         return exploration_plans
 
+    def _step_budget(self, full_history: List[Dict[str, Any]], current_iteration: int) -> int:
+        used_tokens = sum(len(cycle["summary"]) for cycle in full_history) // self.CHARS_PER_TOKEN
+        remaining_tokens = max(0, self.SYNTHESIZER_CONTEXT_TOKENS - used_tokens)
+        iterations_left = max(1, self.MAX_ITERATIONS - current_iteration + 1)
+        budget = min(self.ITERATION_OUTPUT_BUDGET_TOKENS, remaining_tokens // iterations_left)
+        return max(1, budget // self.EXPECTED_STEP_OUTPUT_TOKENS)
+
     def run(self, parent_task: str) -> str:
         full_history: List[Dict[str, Any]] = []
+        self._step_index.clear()
         previous_review_guidance: Optional[NextIterationGuidance] = None
         current_iteration = 0
         iterations_no_progress = 0
 
         while True:
             current_iteration += 1
-            guidance_prompt_segment = self._prepare_planner_guidance_prompt(previous_review_guidance, full_history)
-            current_exploration_plans: List[ExplorationPlan] = self.planner.generate_plan(parent_task, guidance_prompt_segment)
+            guidance_prompt_segment = self._prepare_planner_guidance_prompt(previous_review_guidance)
+            # The Thinker's cached prefix depends only on the task, so it is set up during planning.
+            thinker_primed = self._prefetch.submit(self.thinker.prime, parent_task)
+            current_exploration_plans: List[ExplorationPlan] = self.planner.generate_plan(
+                parent_task,
+                guidance_prompt_segment,
+                action=previous_review_guidance.action if previous_review_guidance else None,
+                excluded_strategies=previous_review_guidance.excluded_strategies if previous_review_guidance else None,
+                max_steps=self._step_budget(full_history, current_iteration),
+            )
 
             if not current_exploration_plans:
-                _log_agent_activity("Pipeline", "Planner returned no new plans.", "", color=BColors.FAIL)
+                _log_agent_activity("Pipeline", "Planner returned no new plans.", "", color=BColors.FAIL, level=LogLevel.ERROR)
                 if not full_history:
                     return f"{BColors.FAIL}Error: Planner failed to generate an initial plan and there's no history. Cannot proceed.{BColors.ENDC}"
                 _log_agent_activity("Pipeline", "No new plans. Proceeding to synthesize or halt based on Reviewer.", "", color=BColors.OKCYAN)
 
+            thinker_primed.result()
+            reviewer_primed = self._prefetch.submit(self.reviewer.prime)
             updated_exploration_plans = self._execute_exploration_steps(current_exploration_plans, parent_task)
+            reviewer_primed.result()
 
             review_obj: ReviewerOut = self.reviewer.review(
                 parent_task,
@@ -690,12 +1271,32 @@ class Orchestrator:
                 current_iteration,
                 iterations_no_progress,
                 self.STAGNATION_THRESHOLD,
+                iterations_remaining=self.MAX_ITERATIONS - current_iteration,
             )
 
-            full_history.append({
+            cycle = {
                 "plans_with_responses": updated_exploration_plans,
                 "review": review_obj,
-            })
+            }
+            cycle["summary"] = SynthesizerAgent.render_iteration(current_iteration, cycle)
+            cycle["step_responses"] = SynthesizerAgent.index_responses(cycle)
+            full_history.append(cycle)
+            self._index_steps(updated_exploration_plans)
+            if HISTORY_FILE_PATH:
+                record = {
+                    "iteration": current_iteration,
+                    "summary": cycle["summary"],
+                    "step_responses": cycle["step_responses"],
+                    "review": review_obj,
+                }
+                _write_log(to_json(record).decode() + "\n", HISTORY_FILE_PATH)
+            if len(full_history) > self.RAW_HISTORY_ITERATIONS:
+                # The old summary embeds the plans as JSON, a second copy of every response, so
+                # it is re-rendered from the trimmed entry; the full text is in HISTORY_FILE_PATH.
+                trimmed_iteration = len(full_history) - self.RAW_HISTORY_ITERATIONS
+                trimmed = full_history[trimmed_iteration - 1]
+                trimmed.pop("plans_with_responses", None)
+                trimmed["summary"] = SynthesizerAgent.render_iteration(trimmed_iteration, trimmed)
 
             next_guidance = review_obj.next_iteration_guidance
             previous_review_guidance = next_guidance
@@ -716,6 +1317,12 @@ class Orchestrator:
                 _log_agent_activity("Pipeline", f"Process will STOP based on Reviewer: '{halt_reason}' after {current_iteration} iterations.", "", color=BColors.HEADER)
                 break
 
+            # The Reviewer is asked to broaden once stagnation reaches the threshold; if that
+            # iteration finds nothing either, further rounds are pruned rather than spent.
+            if iterations_no_progress > self.STAGNATION_THRESHOLD:
+                _log_agent_activity("Pipeline", f"Process will STOP due to stagnation: no new gems for {iterations_no_progress} iterations.", "", color=BColors.HEADER)
+                break
+
             if current_iteration >= self.MAX_ITERATIONS:
                 _log_agent_activity("Pipeline", f"Process will STOP due to MAX_ITERATIONS ({self.MAX_ITERATIONS}) reached.", "", color=BColors.HEADER)
                 break
@@ -723,37 +1330,86 @@ class Orchestrator:
         if not full_history:
             return f"{BColors.FAIL}Error: No history was generated. Cannot synthesize.{BColors.ENDC}"
 
-        return self.synthesizer.synthesize(parent_task, full_history)
+        final_solution = self.synthesizer.synthesize(parent_task, full_history)
+        for model, totals in self.client.usage.items():
+            _log_agent_activity(
+                "Pipeline",
+                f"Token usage ({model})",
+                f"prompt={totals['prompt']} (cached={totals['cached']}) output={totals['output']}",
+                color=BColors.OKBLUE,
+            )
+        if self.thinker.cache:
+            stats = self.thinker.cache.stats
+            _log_agent_activity(
+                "Pipeline",
+                "Thinker cache",
+                f"exact={stats['exact']} semantic={stats['semantic']} miss={stats['miss']}",
+                color=BColors.OKBLUE,
+            )
+        return final_solution
 
 def main():
+    parser = argparse.ArgumentParser(description="Deep-Reasoning pipeline")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore answers persisted by earlier runs (they are still refreshed).",
+    )
+    parser.add_argument(
+        "--batch-mode",
+        action="store_true",
+        help="Run Thinker steps through the discounted batch API (slower; for unattended runs).",
+    )
+    args = parser.parse_args()
+    dotenv.load_dotenv()
+    _configure_log_level()
+    if args.no_cache:
+        prompt_cache.READS_ENABLED = False
+
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
         print(f"{BColors.FAIL}Error: GEMINI_API_KEY not found in environment variables.{BColors.ENDC}")
         sys.exit(1)
 
-    global LOG_FILE_PATH
+    # Lower this to stay inside the Gemini project's per-minute request quota.
+    concurrency_value = os.environ.get("DEEPREASON_THINKER_CONCURRENCY", "").strip()
+    try:
+        max_concurrent_thinker_calls = max(1, int(concurrency_value)) if concurrency_value else Orchestrator.MAX_CONCURRENT_THINKER_CALLS
+    except ValueError:
+        print(f"{BColors.FAIL}Error: DEEPREASON_THINKER_CONCURRENCY must be a whole number of concurrent Thinker calls, got {concurrency_value!r}.{BColors.ENDC}")
+        sys.exit(1)
+
+    global LOG_FILE_PATH, HISTORY_FILE_PATH
     log_dir = "app/log"
     os.makedirs(log_dir, exist_ok=True)
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     LOG_FILE_PATH = os.path.join(log_dir, f"run_{timestamp}.log")
+    HISTORY_FILE_PATH = os.path.join(log_dir, f"history_{timestamp}.jsonl")
     print(f"{BColors.OKBLUE}Logging to: {LOG_FILE_PATH}{BColors.ENDC}")
 
+    changed_blocks = changed_prompt_blocks()
+    if changed_blocks:
+        _log_agent_activity(
+            "Pipeline",
+            f"Prompt blocks differ from app/prompt_block_hashes.json ({len(changed_blocks)}); their caches will be rebuilt. "
+            "If the edits are intended, refresh the snapshot with `python -m app.instructions`",
+            "\n".join(changed_blocks),
+            color=BColors.WARNING,
+        )
+
     parent_task_input = input(f"{BColors.BOLD}USER > {BColors.ENDC}").strip()
     if not parent_task_input:
         error_message = f"{BColors.FAIL}Error: No main task provided. Exiting.{BColors.ENDC}"
         print(error_message)
-        if LOG_FILE_PATH:
-            try:
-                with open(LOG_FILE_PATH, "a", encoding="utf-8") as f:
-                    f.write(_strip_ansi_codes(error_message) + "\n")
-            except Exception as e:
-                print(f"{BColors.FAIL}Error writing critical exit error to log: {e}{BColors.ENDC}")
+        _write_log(error_message + "\n")
         sys.exit(1)
 
     pipeline = Orchestrator(
         api_key=api_key,
         max_iterations=Orchestrator.MAX_ITERATIONS,
         stagnation_threshold=Orchestrator.STAGNATION_THRESHOLD,
+        batch_mode=args.batch_mode,
+        max_concurrent_thinker_calls=max_concurrent_thinker_calls,
     )
     pipeline.run(parent_task_input)
 
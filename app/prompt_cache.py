@@ -0,0 +1,92 @@
+# app/prompt_cache.py
+
+import functools
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+CACHE_DIR = os.path.join("app", "log", "cache")
+# Cleared by `--no-cache`: every lookup misses, but fresh answers are still stored.
+READS_ENABLED = True
+
+class PromptCache:
+    """
+    Persistent text cache backed by a single SQLite table, so answers survive across runs.
+    Keys are caller-supplied digests; values are the stored response text.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+        )
+        # Databases written before entries carried a timestamp; their rows count as stale.
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "created_at" not in columns:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age_seconds: Optional[float] = None) -> Optional[str]:
+        """The stored value, or None if there is none, it is older than `max_age_seconds`, or reads are off."""
+        if not READS_ENABLED:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if not row or (max_age_seconds is not None and time.time() - row[1] > max_age_seconds):
+            return None
+        return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._conn.commit()
+
+def prompt_key(*parts: str) -> str:
+    return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+def memoize_llm(
+    role: str,
+    key: Callable[..., str],
+    dump: Callable[[Any], str] = str,
+    load: Callable[[str], Any] = str,
+    path: Optional[str] = None,
+):
+    """
+    Decorates an agent method so that a call whose `key(self, *args)` was seen before, in this
+    run or an earlier one, returns the stored answer without an LLM call. Results are stored
+    as `dump(result)` in `<CACHE_DIR>/<role>.sqlite3` and read back with `load`; falsy
+    results are not stored. The database is opened on first use.
+    """
+    path = path or os.path.join(CACHE_DIR, f"{role}.sqlite3")
+
+    def decorator(fn):
+        cache: Optional[PromptCache] = None
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            nonlocal cache
+            if cache is None:
+                cache = PromptCache(path)
+            k = key(self, *args, **kwargs)
+            hit = cache.get(k)
+            if hit is not None:
+                return load(hit)
+            result = fn(self, *args, **kwargs)
+            if result:
+                cache.put(k, dump(result))
+            return result
+
+        return wrapper
+    return decorator
+
+def memoize_synth(key: Callable[..., str], path: str = os.path.join(CACHE_DIR, "synthesizer.sqlite3")):
+    """`memoize_llm` for the Synthesizer's plain-text answers."""
+    return memoize_llm("synthesizer", key, path=path)
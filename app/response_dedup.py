@@ -0,0 +1,63 @@
+# app/response_dedup.py
+
+import hashlib
+import re
+from typing import Dict, List, Tuple
+
+from app.schemas import ExplorationPlan
+
+SIMHASH_MAX_DISTANCE = 3
+_SHINGLE_SIZE = 3
+_WORD_RE = re.compile(r"\w+")
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+def _simhash(text: str) -> int:
+    """64-bit SimHash over word shingles; near-identical texts differ in only a few bits."""
+    words = _WORD_RE.findall(text)
+    shingles = [
+        " ".join(words[i:i + _SHINGLE_SIZE])
+        for i in range(max(1, len(words) - _SHINGLE_SIZE + 1))
+    ]
+    weights = [0] * 64
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+def dedupe_responses(plans: List[ExplorationPlan]) -> List[ExplorationPlan]:
+    """
+    Returns copies of `plans` in which a step response that repeats an earlier one, exactly or
+    within SIMHASH_MAX_DISTANCE bits, is replaced by a pointer to the first occurrence.
+
+    Only the Reviewer's view is rewritten: the originals (and the history the Synthesizer reads)
+    keep every response in full, and the first occurrence stays selectable.
+    """
+    exact: Dict[bytes, Tuple[str, str]] = {}
+    near: List[Tuple[int, Tuple[str, str]]] = []
+    deduped: List[ExplorationPlan] = []
+
+    for plan in plans:
+        plan_copy = plan.model_copy(deep=True)
+        for step in plan_copy.steps:
+            if not step.response:
+                continue
+            normalized = _normalize(step.response)
+            digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+            origin = exact.get(digest)
+            if origin is None:
+                fingerprint = _simhash(normalized)
+                origin = next(
+                    (o for fp, o in near if bin(fp ^ fingerprint).count("1") <= SIMHASH_MAX_DISTANCE),
+                    None,
+                )
+                if origin is None:
+                    exact[digest] = (plan.plan_id, step.step_id)
+                    near.append((fingerprint, (plan.plan_id, step.step_id)))
+                    continue
+            step.response = f"[Duplicate: same content as plan {origin[0]} step {origin[1]}]"
+        deduped.append(plan_copy)
+
+    return deduped
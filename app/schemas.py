@@ -1,7 +1,9 @@
 # app/schemas.py
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field
+
+from app.instructions import STRATEGY_NAMES
 
 # ──────────────────────────────
 # Planner-side models
@@ -15,24 +17,15 @@ class PlanStep(BaseModel):
 
 class ExplorationPlan(BaseModel):
     plan_id: str
-    strategy: str
+    strategy: Literal[STRATEGY_NAMES]
     overview: Optional[str] = None
     steps: List[PlanStep]
 
-    @model_validator(mode="after")
-    def validate_strategy(self):
-        if not self.strategy or not self.strategy.strip():
-            raise ValueError("strategy is required and must be non-empty")
-        return self
-
 class PlannerOut(BaseModel):
-    exploration_plans: List[ExplorationPlan]
+    exploration_plans: List[ExplorationPlan] = Field(max_length=5)
 
-    @model_validator(mode="after")
-    def max_five_plans(cls, v):
-        if len(v.exploration_plans) > 5:
-            raise ValueError("At most 5 exploration plans allowed")
-        return v
+class StrategySelection(BaseModel):
+    strategies: List[Literal[STRATEGY_NAMES]] = Field(max_length=8)
 
 # ──────────────────────────────
 # Reviewer-side models
@@ -52,16 +45,16 @@ class NextIterationGuidance(BaseModel):
         "HALT_STAGNATION",
         "HALT_NO_FEASIBLE_PATH"
     ]
-    reasoning: str
-    target_plan_id: Optional[str] = None
-    target_step_id: Optional[str] = None
-    refinement_details: Optional[str] = None
-    excluded_strategies: Optional[List[str]] = None
-    suggested_strategy: Optional[str] = None
-    dfs_path_summary: Optional[str] = None
+    reasoning: str = Field(description="Detailed justification of why this action is the best next step, or why halting is unavoidable.")
+    target_plan_id: Optional[str] = Field(default=None, description="For DEEPEN, CONTINUE_DFS_PATH, RETRY_STEP_WITH_MODIFICATION.")
+    target_step_id: Optional[str] = Field(default=None, description="For DEEPEN, CONTINUE_DFS_PATH, RETRY_STEP_WITH_MODIFICATION.")
+    refinement_details: Optional[str] = Field(default=None, description="For DEEPEN, RETRY_STEP_WITH_MODIFICATION.")
+    excluded_strategies: Optional[List[str]] = Field(default=None, description="For BROADEN: strategies tried and failed, or unsuitable.")
+    suggested_strategy: Optional[str] = Field(default=None, description="For BROADEN: a promising, genuinely different strategy.")
+    dfs_path_summary: Optional[str] = Field(default=None, description="For CONTINUE_DFS_PATH.")
 
 class ReviewerOut(BaseModel):
-    iteration_assessment: str
-    synthesis_ready: bool
-    selected_context: Optional[List[ContextSelection]] = None
+    iteration_assessment: str = Field(description="Honest qualitative summary of this iteration's value and shortcomings.")
+    synthesis_ready: bool = Field(description="True only if next_iteration_guidance.action is HALT_SUFFICIENT.")
+    selected_context: Optional[List[ContextSelection]] = Field(default=None, description="New, significant gems from this iteration; omit if none.")
     next_iteration_guidance: NextIterationGuidance
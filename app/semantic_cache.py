@@ -0,0 +1,135 @@
+# app/semantic_cache.py
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+def digest(*parts: str) -> str:
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+class SemanticCache:
+    """
+    Two-tier in-memory cache underlying the agent-level caches (currently ThinkerCache).
+
+    1. Exact: caller-supplied key, LRU-evicted.
+    2. Semantic: cosine similarity between L2-normalized embeddings of the entry's text,
+       restricted to entries stored under the same `bucket` (the inputs that must match exactly).
+       Entries stored and looked up with `bucket=None` only take part in the exact tier.
+
+    Values are stored as given; callers copy them if they are mutable. Safe to use from
+    several threads; embeddings are requested outside the lock. `stats` counts lookups by
+    outcome (exact hit, semantic hit, miss). With `embed_batch`, `prefetch` embeds the texts
+    of upcoming lookups in one request, and those lookups use the prefetched vectors.
+    """
+
+    def __init__(
+        self,
+        embed: Optional[Callable[[str], List[float]]] = None,
+        maxsize: int = 4096,
+        similarity_threshold: float = 0.95,
+        embed_batch: Optional[Callable[[List[str]], List[List[float]]]] = None,
+    ):
+        self._embed = embed
+        self._embed_batch = embed_batch
+        self._prefetched: Dict[str, Optional[List[float]]] = {}
+        self._maxsize = maxsize
+        self._similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Tuple[str, Optional[List[float]], Any]]" = OrderedDict()
+        self._by_bucket: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"exact": 0, "semantic": 0, "miss": 0}
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> Optional[List[float]]:
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else None
+
+    def _normalized_embedding(self, text: str) -> Optional[List[float]]:
+        with self._lock:
+            if text in self._prefetched:
+                return self._prefetched.pop(text)
+        if not self._embed:
+            return None
+        try:
+            vector = self._embed(text)
+        except Exception:
+            return None
+        return self._normalize(vector)
+
+    def prefetch(self, texts: List[str]) -> None:
+        """
+        Embeds `texts` in a single batch request ahead of their lookups. Vectors are consumed
+        by the first lookup of each text; a new prefetch discards any left unused.
+        """
+        if not self._embed_batch:
+            return
+        texts = list(dict.fromkeys(texts))
+        if not texts:
+            return
+        try:
+            vectors = self._embed_batch(texts)
+        except Exception:
+            return
+        prefetched = {text: self._normalize(vector) for text, vector in zip(texts, vectors)}
+        with self._lock:
+            self._prefetched = prefetched
+
+    def get(self, bucket: Optional[str], key: str, text: str) -> Tuple[Optional[Any], Optional[List[float]]]:
+        """
+        Returns (value, embedding). `value` is None on a miss; the embedding computed for the
+        semantic lookup is handed back so `put` does not have to request it again.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats["exact"] += 1
+                return self._entries[key][2], None
+            if bucket is None:
+                self.stats["miss"] += 1
+                return None, None
+
+        embedding = self._normalized_embedding(text)
+        if embedding is None:
+            with self._lock:
+                self.stats["miss"] += 1
+            return None, None
+
+        with self._lock:
+            best_key, best_score = None, self._similarity_threshold
+            for candidate_key in self._by_bucket.get(bucket, []):
+                candidate_embedding = self._entries[candidate_key][1]
+                if candidate_embedding is None:
+                    continue
+                score = sum(a * b for a, b in zip(embedding, candidate_embedding))
+                if score >= best_score:
+                    best_key, best_score = candidate_key, score
+
+            if best_key is None:
+                self.stats["miss"] += 1
+                return None, embedding
+            self._entries.move_to_end(best_key)
+            self.stats["semantic"] += 1
+            return self._entries[best_key][2], embedding
+
+    def put(self, bucket: Optional[str], key: str, value: Any, embedding: Optional[List[float]] = None) -> None:
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous[0] != bucket:
+                self._drop_from_bucket(previous[0], key)
+            if bucket is not None and (previous is None or previous[0] != bucket):
+                self._by_bucket.setdefault(bucket, []).append(key)
+            self._entries[key] = (bucket, embedding, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                evicted_key, (evicted_bucket, _, _) = self._entries.popitem(last=False)
+                self._drop_from_bucket(evicted_bucket, evicted_key)
+
+    def _drop_from_bucket(self, bucket: Optional[str], key: str) -> None:
+        if bucket is None:
+            return
+        self._by_bucket[bucket].remove(key)
+        if not self._by_bucket[bucket]:
+            del self._by_bucket[bucket]
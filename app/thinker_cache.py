@@ -0,0 +1,94 @@
+# app/thinker_cache.py
+
+from typing import List, Optional, Tuple
+
+from app.instructions import get_thinker_instructions_sha
+from app.prompt_cache import PromptCache
+from app.semantic_cache import SemanticCache, digest
+
+class ThinkerCache(SemanticCache):
+    """
+    Two-tier cache in front of the ThinkerAgent.
+
+    An exact hit needs the same model, dependency outputs, thinker instructions sha, parent task
+    and step instructions, i.e. the same prompt, whichever plan strategy produced it (or none).
+
+    The semantic tier is opt-in (`semantic=True`), since a near-identical step can still ask for
+    a different answer. Its entries are bucketed by (model, plan strategy, dependency outputs,
+    thinker instructions sha), and within a bucket a step is a hit when its parent task plus
+    step instructions embed within `similarity_threshold` of an earlier step's. Steps without a
+    plan strategy only get exact hits.
+
+    With a `store`, exact hits also persist across runs. Thinker answers can draw on search
+    results, so persisted entries older than `ttl_seconds` are ignored.
+    """
+
+    def __init__(
+        self,
+        *args,
+        similarity_threshold: float = 0.97,
+        store: Optional[PromptCache] = None,
+        ttl_seconds: Optional[float] = None,
+        semantic: bool = False,
+        **kwargs,
+    ):
+        if not semantic:
+            # Without an embedder the base class only serves exact hits.
+            kwargs.update(embed=None, embed_batch=None)
+        super().__init__(*args, similarity_threshold=similarity_threshold, **kwargs)
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _keys(
+        model: str,
+        strategy: Optional[str],
+        parent_task: str,
+        step_instructions: str,
+        dependency_outputs_context: Optional[str],
+    ) -> Tuple[Optional[str], str, str]:
+        # The strategy is not part of the prompt, so it scopes semantic matches but not exact ones.
+        scope = digest(model, dependency_outputs_context or "", get_thinker_instructions_sha())
+        text = ThinkerCache._text(parent_task, step_instructions)
+        bucket = digest(scope, strategy) if strategy else None
+        return bucket, digest(text, scope), text
+
+    @staticmethod
+    def _text(parent_task: str, step_instructions: str) -> str:
+        return f"{parent_task}\n\n{step_instructions}"
+
+    def prefetch_steps(self, parent_task: str, step_instructions: List[str]) -> None:
+        """Embeds the semantic-lookup text of every upcoming step in one request."""
+        self.prefetch([self._text(parent_task, instructions) for instructions in step_instructions])
+
+    def get(
+        self,
+        model: str,
+        strategy: Optional[str],
+        parent_task: str,
+        step_instructions: str,
+        dependency_outputs_context: Optional[str],
+    ) -> Tuple[Optional[str], Optional[List[float]]]:
+        bucket, key, text = self._keys(model, strategy, parent_task, step_instructions, dependency_outputs_context)
+        if self._store:
+            stored = self._store.get(key, self._ttl_seconds)
+            if stored is not None:
+                with self._lock:
+                    self.stats["exact"] += 1
+                return stored, None
+        return super().get(bucket, key, text)
+
+    def put(
+        self,
+        model: str,
+        strategy: Optional[str],
+        parent_task: str,
+        step_instructions: str,
+        dependency_outputs_context: Optional[str],
+        response: str,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        bucket, key, _ = self._keys(model, strategy, parent_task, step_instructions, dependency_outputs_context)
+        super().put(bucket, key, response, embedding)
+        if self._store and response:
+            self._store.put(key, response)
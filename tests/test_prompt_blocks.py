@@ -0,0 +1,48 @@
+import json
+from typing import get_args
+
+import pytest
+
+from app.instructions import (
+    PROMPT_BLOCK_HASHES_PATH,
+    all_prompt_block_hashes,
+    changed_prompt_blocks,
+    get_reviewer_instructions,
+)
+from app.schemas import NextIterationGuidance, ReviewerOut
+
+
+def _snapshot_text() -> str:
+    with open(PROMPT_BLOCK_HASHES_PATH, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_prompt_blocks_match_snapshot():
+    # An intended prompt edit is accepted by refreshing the snapshot: `python -m app.instructions`.
+    assert all_prompt_block_hashes() == json.loads(_snapshot_text())
+
+
+def test_changed_prompt_blocks_does_not_rewrite_snapshot(tmp_path):
+    stale = tmp_path / "prompt_block_hashes.json"
+    stale.write_text('{"REVIEWER_INSTRUCTIONS": {"## Role": "stale"}}\n', encoding="utf-8")
+    before = _snapshot_text()
+
+    changed = changed_prompt_blocks(str(stale))
+
+    assert "REVIEWER_INSTRUCTIONS / ## Role" in changed
+    assert stale.read_text(encoding="utf-8") == '{"REVIEWER_INSTRUCTIONS": {"## Role": "stale"}}\n'
+    assert _snapshot_text() == before
+
+
+# The snapshot only notices that the Reviewer prompt changed; these fail when a compressed
+# prompt stops naming a field or action the Reviewer's output schema needs.
+@pytest.mark.parametrize(
+    "name",
+    [
+        *ReviewerOut.model_fields,
+        *NextIterationGuidance.model_fields,
+        *get_args(NextIterationGuidance.model_fields["action"].annotation),
+    ],
+)
+def test_reviewer_prompt_names_schema_fields_and_actions(name):
+    assert name in get_reviewer_instructions()
@@ -0,0 +1,27 @@
+import ast
+import pathlib
+
+import pytest
+
+APP_DIR = pathlib.Path(__file__).resolve().parent.parent / "app"
+
+
+def _duplicate_defs(body):
+    seen, duplicates = set(), []
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            # Property setters and typing overloads legitimately reuse a name.
+            if any(isinstance(d, ast.Attribute) or getattr(d, "id", None) == "overload" for d in node.decorator_list):
+                continue
+            if node.name in seen:
+                duplicates.append(f"{node.name} (line {node.lineno})")
+            seen.add(node.name)
+        if isinstance(node, ast.ClassDef):
+            duplicates.extend(f"{node.name}.{d}" for d in _duplicate_defs(node.body))
+    return duplicates
+
+
+@pytest.mark.parametrize("path", sorted(APP_DIR.glob("*.py")), ids=lambda p: p.name)
+def test_no_redefined_functions(path):
+    # Mirrors ruff's F811 (configured in pyproject.toml) for environments without ruff.
+    assert _duplicate_defs(ast.parse(path.read_text(encoding="utf-8")).body) == []
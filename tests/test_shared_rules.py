@@ -0,0 +1,50 @@
+import functools
+import re
+
+import pytest
+
+from app.instructions import (
+    _NO_META_COMMENTARY_RULE,
+    _SCHEMA_ENFORCED_NOTE,
+    PLANNER_MODES,
+    get_planner_instructions,
+    get_reviewer_instructions,
+    get_strategy_selector_instructions,
+    get_synthesizer_instructions,
+    get_thinker_instructions,
+)
+
+# A shared-rule placeholder (`{_SCHEMA_ENFORCED_NOTE}`) left unformatted in a prompt file. Other
+# braces are prompt text, like the `{target_plan_id}` task templates of the DEEPEN/RETRY Planner.
+_PLACEHOLDER_RE = re.compile(r"\{_[A-Z][A-Z0-9_]*\}")
+
+# Every agent prompt, with the Planner once per mode.
+AGENT_PROMPTS = {
+    "selector": get_strategy_selector_instructions,
+    **{f"planner_{mode}": functools.partial(get_planner_instructions, mode) for mode in sorted(set(PLANNER_MODES.values()))},
+    "thinker": get_thinker_instructions,
+    "reviewer": get_reviewer_instructions,
+    "synthesizer": get_synthesizer_instructions,
+}
+
+# The agents each shared rule is meant for: an edit that drops a rule from one of them, or lets
+# it leak into any other prompt, should fail here.
+SHARED_RULE_AGENTS = {
+    "_SCHEMA_ENFORCED_NOTE": (
+        _SCHEMA_ENFORCED_NOTE,
+        {"selector", "reviewer", *(f"planner_{mode}" for mode in set(PLANNER_MODES.values()))},
+    ),
+    "_NO_META_COMMENTARY_RULE": (_NO_META_COMMENTARY_RULE, {"thinker", "synthesizer"}),
+}
+
+
+@pytest.mark.parametrize("rule_name", SHARED_RULE_AGENTS)
+@pytest.mark.parametrize("agent", AGENT_PROMPTS)
+def test_shared_rule_reaches_exactly_its_agents(agent, rule_name):
+    rule, agents = SHARED_RULE_AGENTS[rule_name]
+    assert (rule in AGENT_PROMPTS[agent]()) == (agent in agents)
+
+
+@pytest.mark.parametrize("agent", AGENT_PROMPTS)
+def test_no_unformatted_placeholders(agent):
+    assert _PLACEHOLDER_RE.findall(AGENT_PROMPTS[agent]()) == []